@@ -2,44 +2,150 @@ from __future__ import annotations
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
-from PyQt6.QtCore import QStandardPaths
+from PyQt6.QtCore import QStandardPaths, QTimer
 from .core.settings import Settings
 from .core.scheme import register_dark_scheme, DarkUrlSchemeHandler
 from .core.downloads import DownloadsManager
-from .ui.main_window import MainWindow
+from .core.startup import StartupScheduler
+from .core.session import SessionStore
+from .ui.window_manager import Services, WindowManager
+from .ui.page_pool import SparePagePool, SPARE_PAGES
+
+# Periodic session store upkeep (history snapshots + WAL checkpoint)
+SESSION_MAINTENANCE_MS = 5 * 60 * 1000
 
 class DarkApp:
-    def __init__(self) -> None:
-        self.settings = Settings()
-        # Register custom scheme before profile usage
-        register_dark_scheme()
-        self.profile = QWebEngineProfile()
-        self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
-        self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies)
-        
-        # Set proper user agent for better compatibility
-        self.profile.setHttpUserAgent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        # Set storage paths FIRST to ensure cookies are loaded
-        data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)) / "Dark Browser"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        self.profile.setCachePath(str(data_dir / "cache"))
-        self.profile.setPersistentStoragePath(str(data_dir / "storage"))
+    def __init__(self, settings=None, session_store=None, profile_path=None, window_ids=None, coordinator=None) -> None:
+        """Arguments are only passed in a window process (see dark.core.coordinator)"""
+        self.startup = StartupScheduler()
+        self.coordinator = coordinator
+        with self.startup.measure("settings"):
+            self.settings = settings if settings is not None else Settings()
+        with self.startup.measure("session store"):
+            remote = session_store is not None
+            self.session_store = session_store if remote else SessionStore()
+            if not remote:
+                self._import_legacy_session()
+        with self.startup.measure("profile"):
+            # Register custom scheme before profile usage
+            register_dark_scheme()
+            self.profile = QWebEngineProfile()
+            self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+            self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies)
+            
+            # Set proper user agent for better compatibility
+            self.profile.setHttpUserAgent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            
+            # Set storage paths FIRST to ensure cookies are loaded
+            data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)) / "Dark Browser"
+            if profile_path is not None:
+                # Window processes cannot share one profile directory
+                data_dir = Path(profile_path)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            self.profile.setCachePath(str(data_dir / "cache"))
+            self.profile.setPersistentStoragePath(str(data_dir / "storage"))
         
-        # Force loading of existing cookies
-        self.profile.cookieStore().loadAllCookies()
-        self.downloads = DownloadsManager(self.profile)
-        pages_dir = Path(__file__).parent / "pages"
-        pages_dir.mkdir(parents=True, exist_ok=True)
-        self.scheme_handler = DarkUrlSchemeHandler(
-            pages_dir,
-            downloads_provider=self.downloads.list,
-            settings_provider=self.settings.all,
-            settings_actions=self._settings_action,
-            downloads_actions=self.downloads.action,
-        )
-        self.profile.installUrlSchemeHandler(b"dark", self.scheme_handler)
-        self.window = MainWindow(self.profile, self.settings, self.downloads)
+        with self.startup.measure("spare pages"):
+            # Pages with a running renderer, handed to new tabs in every window
+            value = self.settings.get('spare_pages')
+            try:
+                spare = SPARE_PAGES if value is None else int(value)
+            except (TypeError, ValueError):
+                spare = SPARE_PAGES
+            self.spare_pages = SparePagePool(self.profile, size=spare)
+            self.spare_pages.start()
+
+        # Force loading of existing cookies once the window is up
+        self.startup.defer("cookies", self.profile.cookieStore().loadAllCookies, priority=10)
+        with self.startup.measure("downloads"):
+            self.downloads = DownloadsManager(self.profile, load_history=False)
+        self.startup.defer("download history", self.downloads.load_history, priority=20)
+        with self.startup.measure("scheme handler"):
+            pages_dir = Path(__file__).parent / "pages"
+            pages_dir.mkdir(parents=True, exist_ok=True)
+            self.scheme_handler = DarkUrlSchemeHandler(
+                pages_dir,
+                downloads_provider=self.downloads.list,
+                settings_provider=self.settings.all,
+                settings_actions=self._settings_action,
+                downloads_actions=self.downloads.action,
+            )
+            self.profile.installUrlSchemeHandler(b"dark", self.scheme_handler)
+        # The one set of services all windows share; windows are created against it
+        self.services = Services(self.settings, self.session_store, self.profile, self.downloads,
+                                 self.scheme_handler, self.spare_pages)
+        self.window_manager = WindowManager(self.services, coordinator=coordinator)
+        with self.startup.measure("main window"):
+            saved_windows = window_ids or self.session_store.windows() or ["main"]
+            for i, window_id in enumerate(saved_windows):
+                self.window_manager.create(window_id, startup=self.startup if i == 0 else None)
+            self.window = self.window_manager.windows[0]
+
+        # Keep the session database compact and histories fresh
+        self._session_timer = QTimer()
+        self._session_timer.timeout.connect(self._session_maintenance)
+        self._session_timer.start(SESSION_MAINTENANCE_MS)
+        QApplication.instance().aboutToQuit.connect(self.session_store.close)
+        # Spare pages must go before the profile does
+        QApplication.instance().aboutToQuit.connect(self.spare_pages.clear)
+        if coordinator is not None:
+            coordinator.pushed.connect(self._on_coordinator_message)
+            # Launches forwarded by the coordinator go to the last active window process
+            QApplication.instance().applicationStateChanged.connect(self._on_app_state)
+
+    def _import_legacy_session(self):
+        """Move a session saved in settings.json into the session store (once)"""
+        legacy = self.settings.get('session')
+        if not legacy or not self.session_store.is_empty():
+            return
+        import uuid
+        tabs = [dict(t, id=uuid.uuid4().hex) for t in legacy]
+        active = int(self.settings.get('session_active') or 0)
+        active_id = tabs[active]['id'] if 0 <= active < len(tabs) else None
+        self.session_store.replace_window("main", tabs, active_id)
+        self.session_store.put_window("main", geometry=self.settings.get('win_geometry'), state=self.settings.get('win_state'))
+        with self.settings.batch():
+            for key in ('session', 'session_active', 'win_geometry', 'win_state'):
+                self.settings.remove(key)
+
+    @property
+    def windows(self):
+        return self.window_manager.windows
+
+    def _session_maintenance(self):
+        for window in self.windows:
+            try:
+                window.tabman.persist_histories()
+            except RuntimeError:
+                pass  # window already deleted
+        self.session_store.compact()
+
+    def handle_message(self, message: dict):
+        """Act on a launch forwarded by another process (see SingleInstance)"""
+        urls = [u for u in message.get("urls") or [] if isinstance(u, str) and u]
+        if message.get("new_window"):
+            self.new_window(urls)
+            return
+        window = self.window_manager.target()
+        if window is None:
+            self.new_window(urls)
+            return
+        if urls:
+            window.tabman.open_urls(urls)
+        self.window_manager.raise_window(window)
+
+    def new_window(self, urls=None):
+        """Open another browser window, optionally with the given URLs"""
+        return self.window_manager.open(urls)
+
+    def _on_coordinator_message(self, message: dict):
+        if message.get("op") == "open_urls":
+            self.handle_message({"urls": message.get("urls") or []})
+
+    def _on_app_state(self, state):
+        from PyQt6.QtCore import Qt
+        if state == Qt.ApplicationState.ApplicationActive:
+            self.coordinator.notify("activated")
 
     def _settings_action(self, key: str, value):
         """Handle settings changes"""
@@ -49,5 +155,8 @@ class DarkApp:
             self.window.tab_manager.home_url = value
 
     def run(self):
-        self.window.show()
+        for window in self.windows:
+            window.show()
+        # Everything not needed for the first paint runs from here on
+        self.startup.start()
         # Don't open initial tab here - TabManager already handles it
@@ -0,0 +1,105 @@
+from __future__ import annotations
+import shutil
+import tempfile
+import time
+import uuid
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Optional
+
+# Closed tabs remembered at most
+MAX_CLOSED_TABS = 50
+# The most recent ones keep their history in memory; older ones are spilled to disk
+MAX_IN_MEMORY = 10
+
+
+@dataclass(slots=True)
+class ClosedTab:
+    """A closed tab as needed to reopen it"""
+    kind: str
+    url: str
+    title: str
+    history: bytes | None = None  # zlib-compressed serialize_history() data, while in memory
+    spill: Path | None = None  # file holding the compressed history once spilled
+    closed_at: float = field(default_factory=time.time)
+
+
+class ClosedTabStash:
+    """Bounded stack of recently closed tabs for reopen (Ctrl+Shift+T).
+
+    Each entry keeps the tab's back/forward list in the binary form of
+    ``serialize_history``, zlib-compressed. The newest ``max_in_memory``
+    entries stay in memory. Older ones are written to a private temporary
+    directory and read back when reopened. Anything beyond ``max_entries``
+    is forgotten.
+    """
+
+    def __init__(self, max_entries: int = MAX_CLOSED_TABS, max_in_memory: int = MAX_IN_MEMORY) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_in_memory = max(0, int(max_in_memory))
+        self._entries: Deque[ClosedTab] = deque()  # oldest first
+        self._dir: Optional[Path] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, kind: str, url: str = "", title: str = "", history: Optional[bytes] = None):
+        """Remember a closed tab; history is serialize_history() output or None"""
+        packed = zlib.compress(history, 1) if history else None
+        self._entries.append(ClosedTab(kind, url, title, packed))
+        while len(self._entries) > self.max_entries:
+            self._forget(self._entries.popleft())
+        # Spill the newest entry that no longer fits in memory
+        if len(self._entries) > self.max_in_memory:
+            self._spill(self._entries[-1 - self.max_in_memory])
+
+    def pop(self) -> Optional[ClosedTab]:
+        """The most recently closed tab with its history unpacked, or None"""
+        if not self._entries:
+            return None
+        entry = self._entries.pop()
+        entry.history = self._history_of(entry)
+        self._forget(entry)
+        entry.spill = None
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+
+    def _history_of(self, entry: ClosedTab) -> Optional[bytes]:
+        packed = entry.history
+        if packed is None and entry.spill is not None:
+            try:
+                packed = entry.spill.read_bytes()
+            except OSError:
+                return None
+        try:
+            return zlib.decompress(packed) if packed else None
+        except zlib.error:
+            return None
+
+    def _spill(self, entry: ClosedTab):
+        if entry.history is None or entry.spill is not None:
+            return
+        try:
+            if self._dir is None:
+                self._dir = Path(tempfile.mkdtemp(prefix="dark-closed-tabs-"))
+            path = self._dir / f"{uuid.uuid4().hex}.bin"
+            path.write_bytes(entry.history)
+        except OSError as e:
+            print(f"Error spilling closed tab: {e}")
+            return
+        entry.spill, entry.history = path, None
+
+    @staticmethod
+    def _forget(entry: ClosedTab):
+        if entry.spill is not None:
+            try:
+                entry.spill.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,355 @@
+from __future__ import annotations
+import base64
+import json
+import os
+import shutil
+import sys
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from PyQt6.QtCore import QObject, QProcess, QStandardPaths, QTimer, QCoreApplication, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+from .single_instance import server_name
+
+# SessionStore methods window processes may call through the coordinator
+STORE_READS = ("windows", "load_window", "is_empty")
+STORE_WRITES = ("put_tab", "put_tabs", "remove_tab", "set_order", "put_window", "replace_window", "remove_window", "compact")
+
+CALL_TIMEOUT_MS = 5000
+
+
+def profiles_dir() -> Path:
+    """Parent of the window processes' profile directories"""
+    data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation))
+    return data_dir / "Dark Browser" / "profiles"
+
+
+def profile_dir(window_id: str) -> Path:
+    """Storage of one window process; QtWebEngine cannot share it between processes"""
+    return profiles_dir() / window_id
+
+
+def _encode(value):
+    """JSON-safe form of value (bytes, e.g. tab histories, become base64)"""
+    if isinstance(value, (bytes, bytearray)):
+        return {"$b64": base64.b64encode(bytes(value)).decode("ascii")}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict):
+        if set(value) == {"$b64"}:
+            return base64.b64decode(value["$b64"])
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+class _LineChannel:
+    """Newline-delimited JSON over a QLocalSocket"""
+
+    def __init__(self, sock: QLocalSocket, on_message: Callable[[dict], None]) -> None:
+        self.sock = sock
+        self._buffer = b""
+        self._on_message = on_message
+        sock.readyRead.connect(self.read)
+
+    def send(self, message: dict):
+        self.sock.write(json.dumps(_encode(message), separators=(",", ":")).encode("utf-8") + b"\n")
+        self.sock.flush()
+
+    def read(self):
+        self._buffer += bytes(self.sock.readAll())
+        while b"\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            try:
+                message = _decode(json.loads(line.decode("utf-8")))
+            except ValueError:
+                continue
+            if isinstance(message, dict):
+                self._on_message(message)
+
+
+# ----------------------------------------------------------------------------
+# Parent process
+
+class WindowCoordinator(QObject):
+    """Parent process of the multi-process window mode.
+
+    Every browser window runs in its own Python + QtWebEngine process
+    (``main.py --window-process=<id>``) so a busy window cannot stall the
+    others. This process owns the only Settings and SessionStore. Children
+    read and write them over a local socket (see CoordinatorClient), and
+    setting changes are pushed to the other windows. The coordinator quits
+    when its last window process exits (or none could be started). The
+    profile directory of a window closed for good is deleted.
+    """
+
+    def __init__(self, settings, session_store, parent=None) -> None:
+        super().__init__(parent)
+        self.settings = settings
+        self.session_store = session_store
+        self.name = f"{server_name()}-coordinator-{os.getpid()}"
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._processes: Dict[str, QProcess] = {}
+        self._channels: Dict[str, _LineChannel] = {}  # window id -> connected child
+        self._last_active: Optional[str] = None
+
+    def start(self, urls: Optional[List[str]] = None) -> bool:
+        if not self._server.listen(self.name):
+            print(f"Window coordinator unavailable: {self._server.errorString()}")
+            return False
+        window_ids = self.session_store.windows() or ["main"]
+        self._remove_stale_profiles(window_ids)
+        for i, window_id in enumerate(window_ids):
+            self.spawn(window_id, urls if i == 0 else None)
+        return True
+
+    def spawn(self, window_id: Optional[str] = None, urls: Optional[List[str]] = None) -> str:
+        """Start a window process; an unknown window_id opens a fresh window"""
+        window_id = window_id or uuid.uuid4().hex
+        proc = QProcess(self)
+        proc.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedChannels)
+        proc.finished.connect(lambda code, status, wid=window_id: self._on_finished(wid, code, status))
+        proc.errorOccurred.connect(lambda error, wid=window_id: self._on_process_error(wid, error))
+        args = [os.path.abspath(sys.argv[0]), f"--window-process={window_id}", f"--coordinator={self.name}"]
+        self._processes[window_id] = proc  # Before start: a failure may be reported from within it
+        proc.start(sys.executable, args + list(urls or []))
+        return window_id
+
+    def handle_message(self, message: dict):
+        """A launch forwarded by SingleInstance: new window, or URLs for the last active one"""
+        urls = [u for u in message.get("urls") or [] if isinstance(u, str) and u]
+        target = self._channels.get(self._last_active) if self._last_active else None
+        if message.get("new_window") or target is None:
+            self.spawn(urls=urls)
+        else:
+            target.send({"op": "open_urls", "urls": urls})
+
+    def close(self):
+        self._server.close()
+
+    # Children
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            holder: dict = {}
+            channel = _LineChannel(sock, lambda m, h=holder: self._on_message(h, m))
+            holder["channel"] = channel
+            sock.disconnected.connect(lambda h=holder: self._on_disconnected(h))
+
+    def _on_disconnected(self, holder: dict):
+        window_id = holder.get("window_id")
+        if window_id and self._channels.get(window_id) is holder.get("channel"):
+            del self._channels[window_id]
+        holder["channel"].sock.deleteLater()
+
+    def _on_finished(self, window_id: str, code: int, status):
+        channel = self._channels.get(window_id)
+        if channel is not None:
+            channel.read()  # Apply the session writes the window sent before exiting
+        if window_id not in self.session_store.windows():
+            # Closed for good (its section was removed); nothing will restore it
+            shutil.rmtree(profile_dir(window_id), ignore_errors=True)
+        self._drop_process(window_id)
+
+    def _on_process_error(self, window_id: str, error):
+        # Other errors are followed by finished; a process that never started is not
+        if error == QProcess.ProcessError.FailedToStart:
+            print(f"Window process {window_id} failed to start")
+            self._drop_process(window_id)
+
+    def _drop_process(self, window_id: str):
+        proc = self._processes.pop(window_id, None)
+        if proc is not None:
+            proc.deleteLater()
+        if self._last_active == window_id:
+            self._last_active = None
+        if not self._processes:
+            QTimer.singleShot(0, self._quit_if_idle)  # Also works before the event loop runs
+
+    def _quit_if_idle(self):
+        if not self._processes:
+            QCoreApplication.quit()
+
+    def _remove_stale_profiles(self, window_ids: List[str]):
+        """Delete profile directories of windows that are no longer saved (e.g. after a crash)"""
+        profiles = profiles_dir()
+        if not profiles.is_dir():
+            return
+        for path in profiles.iterdir():
+            if path.is_dir() and path.name not in window_ids:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _on_message(self, holder: dict, message: dict):
+        channel = holder["channel"]
+        op = message.get("op") or ""
+        args = message.get("args") or []
+        try:
+            result = self._apply(holder, op, args)
+        except Exception as e:
+            print(f"Coordinator: {op} failed: {e}")
+            result = None
+        if "id" in message:
+            channel.send({"id": message["id"], "result": result})
+
+    def _apply(self, holder: dict, op: str, args: list):
+        window_id = holder.get("window_id")
+        if op == "hello":
+            holder["window_id"] = args[0]
+            self._channels[args[0]] = holder["channel"]
+            self._last_active = args[0]
+            return None
+        if op == "activated":
+            self._last_active = window_id
+            return None
+        if op == "settings.all":
+            return self.settings.all()
+        if op == "settings.update":
+            self.settings.update(args[0])
+            self._broadcast(window_id, {"op": "settings.changed", "values": args[0]})
+            return True
+        if op == "settings.remove":
+            self.settings.remove(args[0])
+            self._broadcast(window_id, {"op": "settings.removed", "key": args[0]})
+            return None
+        if op == "windows.open":
+            return self.spawn(urls=args[0] if args else None)
+        if op == "windows.others":
+            return len([w for w in self._processes if w != window_id])
+        if op.startswith("store."):
+            name = op[len("store."):]
+            if name in STORE_READS or name in STORE_WRITES:
+                kwargs = args[1] if len(args) > 1 else {}
+                return getattr(self.session_store, name)(*args[0], **kwargs)
+        raise ValueError(f"unknown operation {op!r}")
+
+    def _broadcast(self, sender: Optional[str], message: dict):
+        for window_id, channel in self._channels.items():
+            if window_id != sender:
+                channel.send(message)
+
+
+# ----------------------------------------------------------------------------
+# Window processes
+
+class CoordinatorClient(QObject):
+    """Connection of a window process to the WindowCoordinator.
+
+    ``call`` waits for the answer (used for reads at startup); ``notify``
+    does not. Messages pushed by the coordinator are emitted as ``pushed``.
+    """
+
+    pushed = pyqtSignal(dict)
+
+    def __init__(self, name: str, window_id: str, parent=None) -> None:
+        super().__init__(parent)
+        self.window_id = window_id
+        self._sock = QLocalSocket(self)
+        self._channel = _LineChannel(self._sock, self._on_message)
+        self._replies: Dict[int, object] = {}
+        self._seq = 0
+        self._sock.connectToServer(name)
+        if not self._sock.waitForConnected(CALL_TIMEOUT_MS):
+            raise ConnectionError(f"window coordinator {name} not reachable")
+        self.notify("hello", window_id)
+
+    def call(self, op: str, *args):
+        self._seq += 1
+        rid = self._seq
+        self._channel.send({"id": rid, "op": op, "args": list(args)})
+        while rid not in self._replies:
+            if not self._sock.waitForReadyRead(CALL_TIMEOUT_MS):
+                raise ConnectionError(f"no answer from the window coordinator for {op}")
+            self._channel.read()
+        return self._replies.pop(rid)
+
+    def notify(self, op: str, *args):
+        self._channel.send({"op": op, "args": list(args)})
+
+    def _on_message(self, message: dict):
+        if "id" in message:
+            self._replies[message["id"]] = message.get("result")
+        else:
+            # Handled after the current call (if any) returns
+            QTimer.singleShot(0, lambda m=message: self.pushed.emit(m))
+
+
+class RemoteSettings:
+    """Settings of a window process: a local copy, with changes sent to the coordinator"""
+
+    def __init__(self, client: CoordinatorClient) -> None:
+        self._client = client
+        self._cache: dict = client.call("settings.all") or {}
+        self._pending: Optional[dict] = None
+        client.pushed.connect(self._on_pushed)
+
+    def all(self) -> dict:
+        return self._cache
+
+    def get(self, key: str):
+        return self._cache.get(key)
+
+    def set(self, key: str, value):
+        return self.update({key: value})
+
+    def update(self, values: dict):
+        self._cache.update(values)
+        if self._pending is not None:
+            self._pending.update(values)
+        else:
+            self._client.notify("settings.update", values)
+        return True
+
+    def remove(self, key: str):
+        if self._cache.pop(key, None) is not None:
+            self._client.notify("settings.remove", key)
+
+    @contextmanager
+    def batch(self):
+        """Send the changes of the block as one update"""
+        outer = self._pending is not None
+        if not outer:
+            self._pending = {}
+        try:
+            yield self
+        finally:
+            if not outer:
+                pending, self._pending = self._pending, None
+                if pending:
+                    self._client.notify("settings.update", pending)
+
+    def flush(self):
+        pass  # The coordinator writes the file
+
+    def _on_pushed(self, message: dict):
+        if message.get("op") == "settings.changed":
+            self._cache.update(message.get("values") or {})
+        elif message.get("op") == "settings.removed":
+            self._cache.pop(message.get("key"), None)
+
+
+class RemoteSessionStore:
+    """SessionStore of a window process; the coordinator's store does the work"""
+
+    def __init__(self, client: CoordinatorClient) -> None:
+        self._client = client
+
+    def __getattr__(self, name: str):
+        if name in STORE_READS:
+            return lambda *args, **kwargs: self._client.call(f"store.{name}", args, kwargs)
+        if name in STORE_WRITES:
+            return lambda *args, **kwargs: self._client.notify(f"store.{name}", args, kwargs)
+        raise AttributeError(name)
+
+    def close(self):
+        pass  # Owned by the coordinator
@@ -31,15 +31,17 @@ class DownloadItem:
         }
 
 class DownloadsManager(QObject):
-    def __init__(self, profile: QWebEngineProfile, parent=None) -> None:
+    def __init__(self, profile: QWebEngineProfile, parent=None, load_history: bool = True) -> None:
         super().__init__(parent)
         self._profile = profile
         self._items: List[DownloadItem] = []
         self._map: Dict[str, QWebEngineDownloadRequest] = {}
         profile.downloadRequested.connect(self._on_download)
         
-        # Load download history on startup
-        self._load_history()
+        # Load download history on startup (or later via load_history)
+        self._history_loaded = False
+        if load_history:
+            self.load_history()
 
     def _on_download(self, req: QWebEngineDownloadRequest):
         save_dir = Path.home() / "Downloads"
@@ -199,8 +201,11 @@ class DownloadsManager(QObject):
             if item:
                 QDesktopServices.openUrl(QUrl.fromLocalFile(str(Path(item.path).parent)))
     
-    def _load_history(self):
-        """Load download history from JSON file"""
+    def load_history(self):
+        """Load download history from JSON file (once)"""
+        if self._history_loaded:
+            return
+        self._history_loaded = True
         try:
             history_file = Path.home() / ".dark_downloads.json"
             if history_file.exists():
@@ -223,6 +228,8 @@ class DownloadsManager(QObject):
     
     def _save_history(self):
         """Save download history to JSON file"""
+        # Never overwrite history that has not been read yet
+        self.load_history()
         try:
             history_file = Path.home() / ".dark_downloads.json"
             # Save only completed/failed/cancelled downloads (not active ones)
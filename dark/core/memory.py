@@ -0,0 +1,77 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Optional
+
+# Pressure levels returned by memory_pressure()
+PRESSURE_NONE = 0
+PRESSURE_MODERATE = 1
+PRESSURE_CRITICAL = 2
+
+# PSI "some avg10" percentages (share of time tasks stalled on memory)
+PSI_MODERATE = 10.0
+PSI_CRITICAL = 40.0
+# cgroup memory.current / memory.max ratios
+CGROUP_MODERATE = 0.80
+CGROUP_CRITICAL = 0.92
+
+PSI_PATH = Path("/proc/pressure/memory")
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def read_psi(path: Path = PSI_PATH) -> Optional[float]:
+    """The ``some avg10`` value of Linux pressure stall information, or None"""
+    try:
+        for line in path.read_text().splitlines():
+            if line.startswith("some "):
+                for field in line.split()[1:]:
+                    key, _, value = field.partition("=")
+                    if key == "avg10":
+                        return float(value)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _own_cgroup_dir(root: Path = CGROUP_ROOT) -> Optional[Path]:
+    try:
+        for line in Path("/proc/self/cgroup").read_text().splitlines():
+            hierarchy, _, rest = line.partition(":")
+            controllers, _, path = rest.partition(":")
+            if hierarchy == "0" and controllers == "":
+                return root / path.lstrip("/")
+    except OSError:
+        pass
+    return None
+
+
+def read_cgroup_usage(cgroup_dir: Optional[Path] = None) -> Optional[float]:
+    """memory.current / memory.max of our cgroup (v2), or None without a limit"""
+    cgroup_dir = cgroup_dir or _own_cgroup_dir()
+    if cgroup_dir is None:
+        return None
+    try:
+        current = int((cgroup_dir / "memory.current").read_text().strip())
+        limit = (cgroup_dir / "memory.max").read_text().strip()
+    except (OSError, ValueError):
+        return None
+    if limit == "max" or not limit.isdigit() or int(limit) <= 0:
+        return None
+    return current / int(limit)
+
+
+def memory_pressure() -> int:
+    """Current memory pressure level, from PSI or the cgroup limit (whichever is worse)"""
+    level = PRESSURE_NONE
+    psi = read_psi()
+    if psi is not None:
+        if psi >= PSI_CRITICAL:
+            level = PRESSURE_CRITICAL
+        elif psi >= PSI_MODERATE:
+            level = PRESSURE_MODERATE
+    usage = read_cgroup_usage()
+    if usage is not None:
+        if usage >= CGROUP_CRITICAL:
+            level = max(level, PRESSURE_CRITICAL)
+        elif usage >= CGROUP_MODERATE:
+            level = max(level, PRESSURE_MODERATE)
+    return level
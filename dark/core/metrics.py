@@ -0,0 +1,85 @@
+from __future__ import annotations
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Sequence
+
+# Bucket upper bounds in milliseconds; the last bucket is open ended
+DEFAULT_BOUNDS_MS = (0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, 133, 266, 533)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, cheap enough to record on every event.
+
+    ``record`` is O(log buckets) and keeps no samples, so it can run for the
+    whole life of the app. Percentiles are estimated from bucket bounds.
+    """
+
+    def __init__(self, name: str, bounds_ms: Sequence[float] = DEFAULT_BOUNDS_MS) -> None:
+        self.name = name
+        self.bounds = tuple(bounds_ms)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+    def record(self, ms: float):
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.last_ms = ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    @contextmanager
+    def time(self):
+        """Record how long the block takes"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record((time.perf_counter() - start) * 1000)
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ms = self.max_ms = self.last_ms = 0.0
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (max for the open bucket)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(self.count * p / 100))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+    def report(self) -> str:
+        """Human readable histogram"""
+        s = self.summary()
+        lines = [f"{self.name}: {s['count']} samples, mean {s['mean_ms']} ms, "
+                 f"p50 <= {s['p50_ms']} ms, p95 <= {s['p95_ms']} ms, max {s['max_ms']} ms"]
+        peak = max(self.counts) or 1
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            if not n:
+                lower = self.bounds[i] if i < len(self.bounds) else lower
+                continue
+            label = f"{lower:g}-{self.bounds[i]:g} ms" if i < len(self.bounds) else f">{lower:g} ms"
+            lines.append(f"  {label:>14} {n:7d} {'#' * max(1, round(30 * n / peak))}")
+            lower = self.bounds[i] if i < len(self.bounds) else lower
+        return "\n".join(lines)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+import heapq
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Characters after which a match counts as the start of a word
+SEPARATORS = frozenset(" /.-_:?=&#")
+# Results returned per query at most
+MAX_RESULTS = 50
+# Added to the score of every match of a kind, so open tabs rank above the rest
+KIND_BONUS = {"tab": 6, "favorite": 4, "pin": 4, "action": 2}
+
+
+@dataclass(slots=True, eq=False)
+class Entry:
+    """One searchable item: an open tab, a favorite, a home pin or an action"""
+    key: str
+    kind: str
+    title: str
+    detail: str = ""  # URL, or the keyboard shortcut of an action
+    payload: object = None
+    text: str = ""  # lower-cased "title detail", what queries are matched against
+    chars: frozenset = frozenset()  # characters of text, to reject most entries with one subset test
+
+
+def fuzzy_score(token: str, text: str) -> Optional[int]:
+    """Score of token (lower case) against text, or None if it does not match.
+
+    A substring match scores highest, more so at the start of text or of a
+    word. Otherwise every character of token must appear in order; runs of
+    consecutive characters and word starts are rewarded, gaps cost a little.
+    """
+    i = text.find(token)
+    if i >= 0:
+        if i == 0:
+            return 100 + len(token) * 4
+        return (90 if text[i - 1] in SEPARATORS else 70) + len(token) * 4 - min(i, 20) // 4
+    score = 0
+    pos = -1
+    for ch in token:
+        j = text.find(ch, pos + 1)
+        if j < 0:
+            return None
+        if j == pos + 1:
+            score += 5
+        elif j == 0 or text[j - 1] in SEPARATORS:
+            score += 3
+        else:
+            score -= min(j - pos, 8) // 2
+        pos = j
+    return score
+
+
+class SearchIndex:
+    """Fuzzy-searchable set of entries, kept up to date one entry at a time.
+
+    ``put`` and ``remove`` are O(1) and meant to be called from the signal
+    handlers that change a title or URL, so the index never needs a rebuild.
+    ``search`` scores only the entries sharing every character of the query.
+    When a query extends the previous one (the user typed one more character)
+    only the previous matches are scored again.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Entry] = {}
+        self._last_query = ""
+        self._last_matches: Optional[List[Entry]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Entry]:
+        return self._entries.get(key)
+
+    def put(self, key: str, kind: str, title: str, detail: str = "", payload=None):
+        """Add or update an entry"""
+        entry = self._entries.get(key)
+        if entry is not None and entry.title == title and entry.detail == detail:
+            entry.payload = payload
+            return
+        text = f"{title} {detail}".lower()
+        self._entries[key] = Entry(key, kind, title, detail, payload, text, frozenset(text))
+        self._last_matches = None
+
+    def remove(self, key: str):
+        if self._entries.pop(key, None) is not None:
+            self._last_matches = None
+
+    def replace_kind(self, kind: str, items: Iterable[Tuple[str, str, str, object]]):
+        """Swap all entries of kind for items of (key, title, detail, payload)"""
+        for key in [k for k, e in self._entries.items() if e.kind == kind]:
+            del self._entries[key]
+        for key, title, detail, payload in items:
+            self.put(key, kind, title, detail, payload)
+        self._last_matches = None
+
+    def clear(self):
+        self._entries.clear()
+        self._last_matches = None
+
+    def entries(self, kind: Optional[str] = None) -> List[Entry]:
+        return [e for e in self._entries.values() if kind is None or e.kind == kind]
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> List[Tuple[int, Entry]]:
+        """Best (score, entry) pairs for query, highest score first.
+
+        Words of the query are matched separately and must all match.
+        """
+        query = " ".join(query.lower().split())
+        if not query:
+            return []
+        if self._last_matches is not None and query.startswith(self._last_query):
+            candidates: Iterable[Entry] = self._last_matches
+        else:
+            candidates = self._entries.values()
+        tokens = query.split()
+        needed = frozenset(query.replace(" ", ""))
+        matches: List[Entry] = []
+        scored: List[Tuple[int, int, Entry]] = []
+        for entry in candidates:
+            if not needed <= entry.chars:
+                continue
+            total = 0
+            for token in tokens:
+                score = fuzzy_score(token, entry.text)
+                if score is None:
+                    break
+                total += score
+            else:
+                matches.append(entry)
+                scored.append((total + KIND_BONUS.get(entry.kind, 0), -len(scored), entry))
+        self._last_query, self._last_matches = query, matches
+        return [(score, entry) for score, _, entry in heapq.nlargest(limit, scored)]
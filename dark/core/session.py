@@ -0,0 +1,286 @@
+from __future__ import annotations
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from PyQt6.QtCore import QStandardPaths, QByteArray, QDataStream, QIODevice
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS windows (
+    window_id  TEXT PRIMARY KEY,
+    position   INTEGER NOT NULL DEFAULT 0,
+    active_tab TEXT,
+    geometry   TEXT,
+    state      TEXT,
+    updated    REAL,
+    active_group TEXT,
+    groups     TEXT
+);
+CREATE TABLE IF NOT EXISTS tabs (
+    window_id TEXT NOT NULL,
+    tab_id    TEXT NOT NULL,
+    position  INTEGER NOT NULL DEFAULT 0,
+    kind      TEXT NOT NULL DEFAULT 'web',
+    url       TEXT NOT NULL DEFAULT '',
+    title     TEXT NOT NULL DEFAULT '',
+    history   BLOB,
+    grp       TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (window_id, tab_id)
+);
+"""
+
+# Columns added after the first release: (table, column, definition)
+MIGRATIONS = (
+    ("tabs", "grp", "TEXT NOT NULL DEFAULT ''"),
+    ("windows", "active_group", "TEXT"),
+    ("windows", "groups", "TEXT"),
+)
+
+# Checkpoint the write-ahead log after this many small writes
+COMPACT_EVERY = 500
+
+
+class SessionStore:
+    """Crash-safe session storage with one record per tab.
+
+    Sessions live in ``session.db`` (SQLite in WAL mode) next to
+    ``settings.json``. Every window has its own section keyed by a window id,
+    and every tab its own row keyed by a stable tab id, so a navigation
+    rewrites one small row instead of the whole session. The write-ahead log
+    is folded back into the database by ``compact``.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        if path is None:
+            data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation))
+            data_dir.mkdir(parents=True, exist_ok=True)
+            path = data_dir / "session.db"
+        self._path = Path(path)
+        self._writes = 0
+        self._db = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        try:
+            return self._connect()
+        except sqlite3.DatabaseError as e:
+            # Unreadable file: keep it aside for inspection and start over
+            print(f"Session store damaged, starting a new one: {e}")
+            broken = self._path.with_suffix(f".broken-{int(time.time())}")
+            try:
+                self._path.rename(broken)
+            except OSError:
+                pass
+            return self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(str(self._path), isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        if db.execute("PRAGMA quick_check").fetchone()[0] != "ok":
+            db.close()
+            raise sqlite3.DatabaseError("integrity check failed")
+        db.executescript(SCHEMA)
+        self._migrate(db)
+        return db
+
+    @staticmethod
+    def _migrate(db: sqlite3.Connection):
+        """Add columns that databases written by older versions lack"""
+        for table, column, definition in MIGRATIONS:
+            columns = {r[1] for r in db.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    # Reading
+
+    def is_empty(self) -> bool:
+        return self._db.execute("SELECT 1 FROM tabs LIMIT 1").fetchone() is None
+
+    def windows(self) -> List[str]:
+        """Window ids that have a saved section, in window order"""
+        rows = self._db.execute(
+            "SELECT window_id FROM windows ORDER BY position, rowid"
+        ).fetchall()
+        known = [r[0] for r in rows]
+        orphans = self._db.execute(
+            "SELECT DISTINCT window_id FROM tabs WHERE window_id NOT IN (SELECT window_id FROM windows)"
+        ).fetchall()
+        return known + [r[0] for r in orphans]
+
+    def load_window(self, window_id: str) -> dict:
+        """Return the saved tabs and layout of one window"""
+        tabs = [
+            {"id": r[0], "type": r[1], "url": r[2], "title": r[3], "history": r[4], "group": r[5]}
+            for r in self._db.execute(
+                "SELECT tab_id, kind, url, title, history, grp FROM tabs WHERE window_id = ? ORDER BY position",
+                (window_id,),
+            )
+        ]
+        row = self._db.execute(
+            "SELECT active_tab, geometry, state, active_group, groups FROM windows WHERE window_id = ?", (window_id,)
+        ).fetchone()
+        active_tab, geometry, state, active_group, groups = row if row else (None, None, None, None, None)
+        try:
+            groups = json.loads(groups) if groups else []
+        except ValueError:
+            groups = []
+        return {"tabs": tabs, "active_tab": active_tab, "geometry": geometry, "state": state,
+                "active_group": active_group or "", "groups": groups}
+
+    # Writing
+
+    def put_tab(self, window_id: str, tab_id: str, **fields):
+        """Insert or update one tab record; fields left as None keep their stored value"""
+        self._upsert_tab(window_id, tab_id, **fields)
+        self._wrote()
+
+    def put_tabs(self, window_id: str, records: Dict[str, dict]):
+        """put_tab for several tabs (tab id -> fields) in one transaction"""
+        if not records:
+            return
+        with self._transaction():
+            for tab_id, fields in records.items():
+                self._upsert_tab(window_id, tab_id, **fields)
+        self._wrote()
+
+    def _upsert_tab(self, window_id: str, tab_id: str, *, position: Optional[int] = None, kind: Optional[str] = None,
+                    url: Optional[str] = None, title: Optional[str] = None, history: Optional[bytes] = None,
+                    group: Optional[str] = None):
+        self._db.execute(
+            """
+            INSERT INTO tabs (window_id, tab_id, position, kind, url, title, history, grp)
+            VALUES (?, ?, coalesce(?, 0), coalesce(?, 'web'), coalesce(?, ''), coalesce(?, ''), ?, coalesce(?, ''))
+            ON CONFLICT (window_id, tab_id) DO UPDATE SET
+                position = coalesce(?, position),
+                kind     = coalesce(?, kind),
+                url      = coalesce(?, url),
+                title    = coalesce(?, title),
+                history  = coalesce(?, history),
+                grp      = coalesce(?, grp)
+            """,
+            (window_id, tab_id, position, kind, url, title, history, group,
+             position, kind, url, title, history, group),
+        )
+
+    def remove_tab(self, window_id: str, tab_id: str):
+        self._db.execute("DELETE FROM tabs WHERE window_id = ? AND tab_id = ?", (window_id, tab_id))
+        self._wrote()
+
+    def set_order(self, window_id: str, tab_ids: Iterable[str]):
+        """Store tab positions and drop records of tabs no longer in the window"""
+        tab_ids = list(tab_ids)
+        with self._transaction():
+            self._db.executemany(
+                "UPDATE tabs SET position = ? WHERE window_id = ? AND tab_id = ?",
+                [(i, window_id, tid) for i, tid in enumerate(tab_ids)],
+            )
+            placeholders = ",".join("?" * len(tab_ids))
+            if tab_ids:
+                self._db.execute(
+                    f"DELETE FROM tabs WHERE window_id = ? AND tab_id NOT IN ({placeholders})",
+                    (window_id, *tab_ids),
+                )
+            else:
+                self._db.execute("DELETE FROM tabs WHERE window_id = ?", (window_id,))
+        self._wrote()
+
+    def put_window(self, window_id: str, *, active_tab: Optional[str] = None, geometry: Optional[str] = None,
+                   state: Optional[str] = None, position: Optional[int] = None,
+                   active_group: Optional[str] = None, groups: Optional[List[str]] = None):
+        """Insert or update a window section header"""
+        groups = json.dumps(groups) if groups is not None else None
+        self._db.execute(
+            """
+            INSERT INTO windows (window_id, position, active_tab, geometry, state, updated, active_group, groups)
+            VALUES (?, coalesce(?, 0), ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (window_id) DO UPDATE SET
+                position     = coalesce(?, position),
+                active_tab   = coalesce(?, active_tab),
+                geometry     = coalesce(?, geometry),
+                state        = coalesce(?, state),
+                updated      = excluded.updated,
+                active_group = coalesce(?, active_group),
+                groups       = coalesce(?, groups)
+            """,
+            (window_id, position, active_tab, geometry, state, time.time(), active_group, groups,
+             position, active_tab, geometry, state, active_group, groups),
+        )
+        self._wrote()
+
+    def replace_window(self, window_id: str, tabs: List[dict], active_tab: Optional[str] = None):
+        """Rewrite a whole window section in one transaction (imports, bulk changes)"""
+        with self._transaction():
+            self._db.execute("DELETE FROM tabs WHERE window_id = ?", (window_id,))
+            self._db.executemany(
+                "INSERT INTO tabs (window_id, tab_id, position, kind, url, title, history, grp) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (window_id, t["id"], i, t.get("type") or "web", t.get("url") or "", t.get("title") or "", t.get("history"),
+                     t.get("group") or "")
+                    for i, t in enumerate(tabs)
+                ],
+            )
+        self.put_window(window_id, active_tab=active_tab)
+
+    def remove_window(self, window_id: str):
+        with self._transaction():
+            self._db.execute("DELETE FROM tabs WHERE window_id = ?", (window_id,))
+            self._db.execute("DELETE FROM windows WHERE window_id = ?", (window_id,))
+        self._wrote()
+
+    # Maintenance
+
+    def compact(self, vacuum: bool = False):
+        """Fold the write-ahead log back into the database file"""
+        try:
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            if vacuum:
+                self._db.execute("VACUUM")
+            self._writes = 0
+        except sqlite3.Error as e:
+            print(f"Error compacting session store: {e}")
+
+    def close(self):
+        try:
+            self.compact()
+            self._db.close()
+        except sqlite3.Error:
+            pass
+
+    def _wrote(self):
+        self._writes += 1
+        if self._writes >= COMPACT_EVERY:
+            self.compact()
+
+    def _transaction(self):
+        return _Transaction(self._db)
+
+
+class _Transaction:
+    def __init__(self, db: sqlite3.Connection) -> None:
+        self._db = db
+
+    def __enter__(self):
+        self._db.execute("BEGIN")
+        return self._db
+
+    def __exit__(self, exc_type, exc, tb):
+        self._db.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def serialize_history(history) -> bytes:
+    """Compact binary form of a QWebEngineHistory (back/forward list)"""
+    data = QByteArray()
+    stream = QDataStream(data, QIODevice.OpenModeFlag.WriteOnly)
+    stream << history
+    return bytes(data)
+
+
+def restore_history(history, data: bytes) -> bool:
+    """Load a list produced by serialize_history into history; returns success"""
+    if not data:
+        return False
+    stream = QDataStream(QByteArray(data), QIODevice.OpenModeFlag.ReadOnly)
+    stream >> history
+    return stream.status() == QDataStream.Status.Ok
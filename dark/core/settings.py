@@ -1,7 +1,11 @@
 from __future__ import annotations
+import atexit
 import json
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from PyQt6.QtCore import QStandardPaths
+from PyQt6.QtCore import QStandardPaths, QTimer, QCoreApplication
 
 DEFAULTS = {
     "version": "0.1.0",
@@ -15,16 +19,28 @@ DEFAULTS = {
     ],
 }
 
+# How long changes may sit in memory before they are written out
+WRITE_DELAY_MS = 1000
+
+
 class Settings:
     def __init__(self) -> None:
         data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation))
         data_dir.mkdir(parents=True, exist_ok=True)
         self._file = data_dir / "settings.json"
+        self._dirty = False
+        self._batch_depth = 0
+        self._timer = None
         self._cache = self._load()
+        # Whatever is still pending gets written when the app goes away
+        atexit.register(self.flush)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
 
     def _load(self) -> dict:
         if not self._file.exists():
-            self._file.write_text(json.dumps(DEFAULTS, indent=2), encoding="utf-8")
+            self._write(DEFAULTS)
             return dict(DEFAULTS)
         try:
             data = json.loads(self._file.read_text(encoding="utf-8"))
@@ -42,5 +58,83 @@ class Settings:
 
     def set(self, key: str, value):
         self._cache[key] = value
-        self._file.write_text(json.dumps(self._cache, indent=2), encoding="utf-8")
+        self._mark_dirty()
+        return True
+
+    def remove(self, key: str):
+        """Drop a key from the settings file"""
+        if self._cache.pop(key, None) is not None:
+            self._mark_dirty()
+
+    def update(self, values: dict):
+        """Set several keys as one change"""
+        self._cache.update(values)
+        self._mark_dirty()
         return True
+
+    @contextmanager
+    def batch(self):
+        """Group several set() calls; nothing is scheduled until the block ends"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._schedule()
+
+    def flush(self):
+        """Write pending changes now"""
+        if self._timer is not None:
+            self._timer.stop()
+        if not self._dirty:
+            return
+        try:
+            self._write(self._cache)
+            self._dirty = False
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._schedule()
+
+    def _schedule(self):
+        # Coalesce bursts of changes into one write
+        if QCoreApplication.instance() is None:
+            self.flush()
+            return
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        if not self._timer.isActive():
+            self._timer.start(WRITE_DELAY_MS)
+
+    def _write(self, data: dict):
+        """Atomically replace the settings file (temp file + fsync + rename)"""
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        fd, tmp = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=str(self._file.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._file)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        try:
+            dir_fd = os.open(str(self._file.parent), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
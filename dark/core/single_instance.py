@@ -0,0 +1,130 @@
+from __future__ import annotations
+import getpass
+import json
+import os
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+
+def server_name() -> str:
+    """Per-user name of the local socket the running browser listens on"""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return f"dark-browser-{user}"
+
+
+class SingleInstance(QObject):
+    """Forward launches to an already running browser over a local socket.
+
+    A new process first calls ``send``; if a running instance accepts the
+    message the process can exit right away. Otherwise it calls ``listen`` at
+    once, so launches made while it is still starting up do not become a
+    second browser. Those are queued until ``ready`` and then emitted through
+    ``message_received`` like every later launch. Messages are single JSON
+    objects terminated by a newline.
+    """
+
+    message_received = pyqtSignal(dict)
+
+    def __init__(self, name: str | None = None, parent=None) -> None:
+        super().__init__(parent)
+        self._name = name or server_name()
+        self._server: QLocalServer | None = None
+        self._buffers: dict[QLocalSocket, bytes] = {}
+        self._queued: list[dict] | None = []  # None once ready()
+
+    def send(self, message: dict, timeout_ms: int = 300) -> bool:
+        """Deliver message to a running instance; False if there is none"""
+        sock = QLocalSocket()
+        sock.connectToServer(self._name)
+        if not sock.waitForConnected(timeout_ms):
+            return False
+        sock.write(json.dumps(message).encode("utf-8") + b"\n")
+        ok = sock.waitForBytesWritten(timeout_ms)
+        sock.disconnectFromServer()
+        if sock.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+            sock.waitForDisconnected(timeout_ms)
+        return ok
+
+    def listen(self) -> bool:
+        """Become the running instance.
+
+        False if that failed; when another launch won the race to listen,
+        ``send`` now reaches it.
+        """
+        server = QLocalServer(self)
+        if os.name == "nt":
+            server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        # Elsewhere that option makes listen() replace a live socket file, so two
+        # launches could both succeed; a plain bind fails with AddressInUseError
+        if not server.listen(self._name):
+            if server.serverError() != QAbstractSocket.SocketError.AddressInUseError:
+                print(f"Single-instance server unavailable: {server.errorString()}")
+                return False
+            if self._server_alive():
+                return False  # Another launch is the running instance now
+            # A crashed instance left its socket file behind
+            QLocalServer.removeServer(self._name)
+            if not server.listen(self._name):
+                print(f"Single-instance server unavailable: {server.errorString()}")
+                return False
+        if os.name != "nt":
+            try:
+                os.chmod(server.fullServerName(), 0o600)  # Only this user may connect
+            except OSError:
+                pass
+        server.newConnection.connect(self._on_new_connection)
+        self._server = server
+        return True
+
+    def _server_alive(self, timeout_ms: int = 300) -> bool:
+        sock = QLocalSocket()
+        sock.connectToServer(self._name)
+        alive = sock.waitForConnected(timeout_ms)
+        sock.abort()
+        return alive
+
+    def ready(self):
+        """The app can handle launches now: emit the queued ones, then deliver directly"""
+        queued, self._queued = self._queued or [], None
+        for message in queued:
+            self.message_received.emit(message)
+
+    def close(self):
+        if self._server:
+            self._server.close()
+            self._server = None
+
+    def _on_new_connection(self):
+        while self._server and self._server.hasPendingConnections():
+            sock = self._server.nextPendingConnection()
+            self._buffers[sock] = b""
+            sock.readyRead.connect(lambda s=sock: self._on_ready_read(s))
+            sock.disconnected.connect(lambda s=sock: self._on_disconnected(s))
+
+    def _on_ready_read(self, sock: QLocalSocket):
+        data = self._buffers.get(sock, b"") + bytes(sock.readAll())
+        while b"\n" in data:
+            line, data = data.split(b"\n", 1)
+            self._dispatch(line)
+        self._buffers[sock] = data
+
+    def _on_disconnected(self, sock: QLocalSocket):
+        rest = self._buffers.pop(sock, b"")
+        if rest.strip():
+            self._dispatch(rest)
+        sock.deleteLater()
+
+    def _dispatch(self, line: bytes):
+        try:
+            message = json.loads(line.decode("utf-8"))
+        except ValueError:
+            return
+        if not isinstance(message, dict):
+            return
+        if self._queued is not None:
+            self._queued.append(message)
+        else:
+            self.message_received.emit(message)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+from PyQt6.QtCore import QTimer
+
+
+class StartupScheduler:
+    """Run startup work in prioritized idle slices once the window is up.
+
+    Work needed for the first paint is timed with ``measure``; everything
+    else is registered with ``defer`` and runs one phase per event-loop turn
+    after ``start``, lowest priority value first. Durations of both kinds end
+    up in ``timings`` (milliseconds, in the order they ran).
+    """
+
+    def __init__(self) -> None:
+        self._phases: List[Tuple[int, int, str, Callable]] = []
+        self._seq = 0
+        self._t0 = time.perf_counter()
+        self._started = False
+        self._running = False
+        self.timings: Dict[str, float] = {}
+        self.first_paint_ms: float | None = None
+        self.finished_ms: float | None = None
+
+    @contextmanager
+    def measure(self, name: str):
+        """Time a synchronous phase that has to run before the first paint"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = (time.perf_counter() - start) * 1000
+
+    def defer(self, name: str, fn: Callable, priority: int = 50):
+        """Queue fn to run in an idle slice after the first paint"""
+        self._phases.append((priority, self._seq, name, fn))
+        self._seq += 1
+        if self._started and not self._running:
+            self._schedule()
+
+    def start(self):
+        """Mark the end of the first-paint path and begin running deferred phases"""
+        if self._started:
+            return
+        self._started = True
+        self.first_paint_ms = (time.perf_counter() - self._t0) * 1000
+        self._schedule()
+
+    def pending(self) -> List[str]:
+        return [name for _, _, name, _ in sorted(self._phases)]
+
+    def report(self) -> str:
+        """Human readable breakdown of where startup time went"""
+        lines = [f"{name:<24}{ms:8.1f} ms" for name, ms in self.timings.items()]
+        if self.first_paint_ms is not None:
+            lines.append(f"{'first paint at':<24}{self.first_paint_ms:8.1f} ms")
+        if self.finished_ms is not None:
+            lines.append(f"{'idle phases done at':<24}{self.finished_ms:8.1f} ms")
+        return "\n".join(lines)
+
+    def _schedule(self):
+        self._running = True
+        QTimer.singleShot(0, self._run_next)
+
+    def _run_next(self):
+        if not self._phases:
+            self._running = False
+            self.finished_ms = (time.perf_counter() - self._t0) * 1000
+            if os.environ.get("DARK_STARTUP_TRACE"):
+                print("Startup phases:\n" + self.report())
+            return
+        self._phases.sort()
+        _, _, name, fn = self._phases.pop(0)
+        start = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            print(f"Startup phase '{name}' failed: {e}")
+        self.timings[name] = (time.perf_counter() - start) * 1000
+        QTimer.singleShot(0, self._run_next)
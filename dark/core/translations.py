@@ -53,6 +53,12 @@ ES_TRANSLATIONS = {
     "Close": "Cerrar",
     "Close Others": "Cerrar Otras",
     "Close All": "Cerrar Todas",
+    "Close Tabs to the Right": "Cerrar Pestañas a la Derecha",
+    "Close Duplicate Tabs": "Cerrar Pestañas Duplicadas",
+    "Move to Window": "Mover a Ventana",
+    "Move to Group": "Mover a Grupo",
+    "New Group...": "Nuevo Grupo...",
+    "New Tab Group": "Nuevo Grupo de Pestañas",
     "Duplicate": "Duplicar",
     "Pin Tab": "Fijar Pestaña",
     "Unpin Tab": "Desfijar Pestaña",
@@ -139,6 +145,12 @@ EN_TRANSLATIONS = {
     "Close": "Close",
     "Close Others": "Close Others",
     "Close All": "Close All",
+    "Close Tabs to the Right": "Close Tabs to the Right",
+    "Close Duplicate Tabs": "Close Duplicate Tabs",
+    "Move to Window": "Move to Window",
+    "Move to Group": "Move to Group",
+    "New Group...": "New Group...",
+    "New Tab Group": "New Tab Group",
     "Duplicate": "Duplicate",
     "Pin Tab": "Pin Tab",
     "Unpin Tab": "Unpin Tab",
@@ -0,0 +1,145 @@
+from __future__ import annotations
+import heapq
+from typing import Callable, List, Optional, Tuple
+from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem
+from ..core.search_index import SearchIndex, Entry
+from ..core.metrics import LatencyHistogram
+
+# Rows shown at most (the index may match many more)
+MAX_SHOWN = 12
+PALETTE_WIDTH = 560
+KIND_LABELS = {"tab": "Tab", "favorite": "Favorite", "pin": "Pin", "action": "Action"}
+
+
+class CommandPalette(QFrame):
+    """Ctrl+K overlay: fuzzy search over open tabs, favorites, home pins and actions.
+
+    Tabs come from the tab manager's SearchIndex, which its title and URL
+    handlers keep current. Favorites, pins and actions are few and are
+    re-read into a small index of the palette each time it opens. With an
+    empty query the most recently used tabs are listed (a tab switcher).
+    Query time is recorded in ``latency``.
+    """
+
+    def __init__(self, main_window) -> None:
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.setObjectName("CommandPalette")
+        self.extras = SearchIndex()
+        self.latency = LatencyHistogram("palette query")
+        self._actions: List[Tuple[str, str, Callable]] = []
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(6)
+        self.edit = QLineEdit()
+        self.edit.setPlaceholderText("Search tabs, favorites and actions")
+        self.edit.textChanged.connect(self._update)
+        self.edit.installEventFilter(self)
+        self.results = QListWidget()
+        self.results.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Typing stays in the line edit
+        self.results.setUniformItemSizes(True)
+        self.results.itemClicked.connect(self._activate)
+        layout.addWidget(self.edit)
+        layout.addWidget(self.results)
+        self.hide()
+
+    def add_action(self, title: str, shortcut: str, callback: Callable):
+        self._actions.append((title, shortcut, callback))
+
+    def open(self):
+        self._refresh_extras()
+        width = min(PALETTE_WIDTH, self.main_window.width() - 40)
+        self.setGeometry((self.main_window.width() - width) // 2, 60, width, 360)
+        self.show()
+        self.raise_()
+        self.edit.clear()
+        self._update("")
+        self.edit.setFocus()
+
+    def close_palette(self):
+        self.hide()
+        view = self.main_window.tabman.current_view()
+        if view is not None:
+            view.setFocus()
+
+    # Results
+
+    def _refresh_extras(self):
+        """Re-read favorites, home pins and actions (small lists, changed elsewhere)"""
+        favorites = getattr(self.main_window, 'favorites', None) or []
+        self.extras.replace_kind("favorite", [
+            (f"fav:{url}", title or url, url, url) for url, title in favorites
+        ])
+        pins = self.main_window.settings.get("pinned") or []
+        self.extras.replace_kind("pin", [
+            (f"pin:{p.get('url')}", p.get("title") or p.get("url"), p.get("url"), p.get("url"))
+            for p in pins if isinstance(p, dict) and p.get("url")
+        ])
+        self.extras.replace_kind("action", [
+            (f"action:{title}", title, shortcut, callback) for title, shortcut, callback in self._actions
+        ])
+
+    def _matches(self, text: str) -> List[Entry]:
+        index = self.main_window.tabman.search_index
+        if not text.strip():
+            # Tab switcher: most recently used tabs first
+            tabs = heapq.nlargest(MAX_SHOWN, self.main_window.tabman.tabs, key=lambda t: t.last_active)
+            entries = (index.get(t.id) for t in tabs)
+            return [e for e in entries if e is not None]
+        found = index.search(text, MAX_SHOWN) + self.extras.search(text, MAX_SHOWN)
+        found.sort(key=lambda pair: pair[0], reverse=True)
+        return [entry for _, entry in found[:MAX_SHOWN]]
+
+    def _update(self, text: str):
+        with self.latency.time():
+            entries = self._matches(text)
+        self.results.clear()
+        for entry in entries:
+            label = f"{entry.title}  ·  {entry.detail}" if entry.detail else entry.title
+            item = QListWidgetItem(f"{KIND_LABELS.get(entry.kind, '')}: {label}")
+            item.setData(Qt.ItemDataRole.UserRole, entry)
+            item.setToolTip(entry.detail or entry.title)
+            self.results.addItem(item)
+        if entries:
+            self.results.setCurrentRow(0)
+
+    def _activate(self, item: Optional[QListWidgetItem] = None):
+        item = item or self.results.currentItem()
+        entry = item.data(Qt.ItemDataRole.UserRole) if item is not None else None
+        self.close_palette()
+        if entry is None:
+            return
+        tabman = self.main_window.tabman
+        if entry.kind == "tab":
+            row = tabman.row_of(entry.payload)
+            if row >= 0:
+                tabman.set_active(row)  # Also switches to the tab's group
+        elif entry.kind in ("favorite", "pin"):
+            open_tabs = [t for t in tabman.tabs_for_url(entry.payload) if tabman.row_of(t) >= 0]
+            if open_tabs:
+                tabman.set_active(tabman.row_of(open_tabs[0]))
+            else:
+                tabman.create_tab(entry.payload)
+        elif entry.kind == "action":
+            entry.payload()
+
+    # Keys
+
+    def eventFilter(self, obj, event):  # noqa: N802
+        if obj is self.edit and event.type() == QEvent.Type.KeyPress:
+            key = event.key()
+            if key == Qt.Key.Key_Escape:
+                self.close_palette()
+                return True
+            if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                self._activate()
+                return True
+            if key in (Qt.Key.Key_Down, Qt.Key.Key_Up) and self.results.count():
+                step = 1 if key == Qt.Key.Key_Down else -1
+                self.results.setCurrentRow((self.results.currentRow() + step) % self.results.count())
+                return True
+        elif obj is self.edit and event.type() == QEvent.Type.FocusOut and self.isVisible():
+            if not self.results.underMouse():
+                self.hide()
+        return super().eventFilter(obj, event)
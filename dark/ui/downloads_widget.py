@@ -196,10 +196,19 @@ class DownloadsWidget(QWidget):
         self.mgr = downloads_manager
         self._setup_ui()
         self.items: dict[str, DownloadItemWidget] = {}
+        # Polls only while the page is on screen (see showEvent/hideEvent)
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.refresh)
-        self.timer.start(800)
+        self.timer.setInterval(800)
+
+    def showEvent(self, e):  # noqa: N802
         self.refresh()
+        self.timer.start()
+        super().showEvent(e)
+
+    def hideEvent(self, e):  # noqa: N802
+        self.timer.stop()
+        super().hideEvent(e)
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
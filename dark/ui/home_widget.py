@@ -6,6 +6,16 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPush
 from PyQt6.QtCore import Qt, QUrl
 from PyQt6.QtGui import QIcon, QPixmap
 
+_logo_pixmap: QPixmap | None = None
+
+
+def _logo(path) -> QPixmap:
+    """The home logo scaled to 150x150, scaled once per process"""
+    global _logo_pixmap
+    if _logo_pixmap is None:
+        _logo_pixmap = QPixmap(str(path)).scaled(150, 150, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    return _logo_pixmap
+
 class HomeWidget(QWidget):
     def __init__(self, settings, parent=None, tab_manager=None) -> None:
         super().__init__(parent)
@@ -26,10 +36,8 @@ class HomeWidget(QWidget):
             logo_path = Path(__file__).parent.parent / 'resources' / 'icons' / 'Dark_logo.png'
             if logo_path.exists():
                 logo_label = QLabel()
-                logo_pixmap = QPixmap(str(logo_path))
-                # Scale logo to reasonable size (150x150)
-                scaled_pixmap = logo_pixmap.scaled(150, 150, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(scaled_pixmap)
+                # Scaled logo (150x150), shared by every Home page
+                logo_label.setPixmap(_logo(logo_path))
                 logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 logo_label.setStyleSheet("margin: 0px; padding: 0px;")
                 logo_container.addWidget(logo_label)
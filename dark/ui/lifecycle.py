@@ -0,0 +1,120 @@
+from __future__ import annotations
+import time
+from typing import Callable, List
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWebEngineCore import QWebEnginePage
+from ..core.memory import memory_pressure, PRESSURE_MODERATE, PRESSURE_CRITICAL
+
+State = QWebEnginePage.LifecycleState
+
+# How often background tabs are re-evaluated
+CHECK_INTERVAL_MS = 30 * 1000
+# Defaults, overridable in settings
+FREEZE_AFTER_S = 5 * 60
+DISCARD_AFTER_S = 30 * 60
+MAX_LIVE_TABS = 20
+# Never shrink the live-tab budget below this, even under pressure
+MIN_LIVE_TABS = 2
+
+STATE_NAMES = {State.Active: "active", State.Frozen: "frozen", State.Discarded: "discarded"}
+
+
+class TabLifecycleManager:
+    """Freeze and discard background tabs by LRU.
+
+    Tabs idle for ``tab_freeze_after_s`` are frozen (no script, no timers),
+    those idle for ``tab_discard_after_s`` are discarded (renderer released,
+    history kept). On top of that only ``max_live_tabs`` web tabs may keep a
+    renderer; the least recently used ones beyond the budget are discarded.
+    Active, pinned and audible tabs, and tabs still loading, are never
+    touched. Under memory pressure the idle times and the budget shrink.
+    Selecting a tab brings it back to Active, which reloads discarded pages.
+    """
+
+    def __init__(self, tabs: Callable[[], List], is_exempt: Callable, on_state_changed: Callable, settings=None, parent=None) -> None:
+        self._tabs = tabs
+        self._is_exempt = is_exempt
+        self._on_state_changed = on_state_changed
+        self.settings = settings
+        self.pressure = 0
+        self._timer = QTimer(parent)
+        self._timer.timeout.connect(self.check)
+        self._timer.start(CHECK_INTERVAL_MS)
+
+    # Hooks called by the tab manager
+
+    def watch(self, tab):
+        """Track lifecycle changes of a tab's page"""
+        page = tab.page
+        if page is None:
+            return
+        tab.lifecycle = STATE_NAMES.get(page.lifecycleState(), "active")
+        page.lifecycleStateChanged.connect(lambda state, t=tab: self._state_changed(t, state))
+
+    def touch(self, tab):
+        """tab was selected: mark it used now and bring it back to Active"""
+        tab.last_active = time.monotonic()
+        page = tab.page
+        if page is not None and page.lifecycleState() != State.Active:
+            page.setLifecycleState(State.Active)
+
+    # Policy
+
+    def _setting(self, key: str, default):
+        if not self.settings:
+            return default
+        try:
+            value = self.settings.get(key)
+            return default if value is None else type(default)(value)
+        except (TypeError, ValueError):
+            return default
+
+    def limits(self):
+        """(freeze_after_s, discard_after_s, max_live) for the current pressure level"""
+        freeze_after = self._setting('tab_freeze_after_s', FREEZE_AFTER_S)
+        discard_after = self._setting('tab_discard_after_s', DISCARD_AFTER_S)
+        max_live = self._setting('max_live_tabs', MAX_LIVE_TABS)
+        if self.pressure >= PRESSURE_CRITICAL:
+            freeze_after, discard_after, max_live = 0, freeze_after / 4, max_live // 4
+        elif self.pressure >= PRESSURE_MODERATE:
+            freeze_after, discard_after, max_live = freeze_after / 2, discard_after / 4, max_live // 2
+        return freeze_after, discard_after, max(MIN_LIVE_TABS, max_live)
+
+    def check(self):
+        """Apply the policy to all background tabs"""
+        if self._setting('tab_lifecycle', True) is False:
+            return
+        self.pressure = memory_pressure()
+        freeze_after, discard_after, max_live = self.limits()
+        now = time.monotonic()
+
+        live = [t for t in self._tabs() if t.page is not None and t.lifecycle != "discarded"]
+        candidates = sorted((t for t in live if not self._is_exempt(t)), key=lambda t: t.last_active)
+        over_budget = len(live) - max_live
+        for tab in candidates:
+            idle = now - tab.last_active
+            if over_budget > 0 or idle >= discard_after:
+                if self._apply(tab, State.Discarded):
+                    over_budget -= 1
+            elif idle >= freeze_after:
+                self._apply(tab, State.Frozen)
+
+    def _apply(self, tab, state) -> bool:
+        page = tab.page
+        if page.isVisible() or page.lifecycleState() == state:
+            return False
+        # Never go further than Chromium considers safe (audio, devtools, ...)
+        recommended = page.recommendedState()
+        if state.value > recommended.value:
+            state = recommended
+        if state == page.lifecycleState() or state == State.Active:
+            return False
+        page.setLifecycleState(state)
+        return state == State.Discarded
+
+    def _state_changed(self, tab, state):
+        tab.lifecycle = STATE_NAMES.get(state, "active")
+        self._on_state_changed(tab)
+
+    def stop(self):
+        self._timer.stop()
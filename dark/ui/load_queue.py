@@ -0,0 +1,120 @@
+from __future__ import annotations
+from typing import Callable, Dict, Optional, Set, Tuple
+
+
+class LoadQueue:
+    """Start page loads for many tabs while capping how many run at once.
+
+    Entries are tabs; ``start`` is called with the tab and the URL to load and
+    ``finished`` must be called once that load reports ``loadFinished``.
+    ``priorities`` maps a list of tabs to sort keys; the entry with the lowest
+    key always starts next, and a key starting with 0 (the active tab)
+    bypasses the cap entirely.
+    """
+
+    def __init__(self, start: Callable, priorities: Callable, max_concurrent: int = 3, on_progress: Optional[Callable] = None) -> None:
+        self._start = start
+        self._priorities = priorities
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._on_progress = on_progress
+        self._pending: Dict[object, Optional[str]] = {}  # tab -> URL, in request order
+        self._running: Set[object] = set()
+        self._done = 0
+        self._total = 0
+
+    def request(self, tab, url: Optional[str] = None):
+        """Queue a load for tab (replacing any queued one) and start what fits"""
+        if tab in self._running:
+            self._running.discard(tab)
+        elif tab not in self._pending:
+            self._total += 1
+        self._pending.pop(tab, None)
+        self._pending[tab] = url
+        # At the cap only an urgent request can start; skip ranking the whole queue
+        if len(self._running) < self.max_concurrent or self._priorities([tab])[0][0] == 0:
+            self.pump()
+        else:
+            self._report()
+
+    def finished(self, tab):
+        """Release the slot held by tab and start the next queued load"""
+        if tab not in self._running:
+            return
+        self._running.discard(tab)
+        self._done += 1
+        self.pump()
+
+    def cancel(self, tab):
+        """Forget tab, whether it is queued or loading"""
+        was_pending = tab in self._pending
+        was_running = tab in self._running
+        self._pending.pop(tab, None)
+        self._running.discard(tab)
+        if was_pending or was_running:
+            self._done += 1
+            if was_running:
+                self.pump()
+            else:
+                self._report()  # No slot freed, nothing new can start
+
+    def cancel_many(self, tabs):
+        """Forget several tabs at once; the queue is pumped a single time"""
+        dropped = freed = 0
+        for tab in tabs:
+            if tab in self._pending:
+                del self._pending[tab]
+                dropped += 1
+            elif tab in self._running:
+                self._running.discard(tab)
+                freed += 1
+        if dropped or freed:
+            self._done += dropped + freed
+            if freed:
+                self.pump()
+            else:
+                self._report()
+
+    def pump(self):
+        """Start queued loads in priority order until the cap is reached.
+
+        The queue is ranked once per call, not once per started load.
+        """
+        if self._pending:
+            tabs = list(self._pending)
+            keys = self._priorities(tabs)
+            for i in sorted(range(len(tabs)), key=keys.__getitem__):
+                tab = tabs[i]
+                if len(self._running) >= self.max_concurrent and keys[i][0] != 0:
+                    break
+                if tab not in self._pending:
+                    continue  # Cancelled by an earlier start
+                url = self._pending.pop(tab)
+                self._running.add(tab)
+                try:
+                    self._start(tab, url)
+                except Exception as e:
+                    print(f"Error starting tab load: {e}")
+                    self._running.discard(tab)
+                    self._done += 1
+        self._report()
+
+    def is_queued(self, tab) -> bool:
+        return tab in self._pending
+
+    def is_loading(self, tab) -> bool:
+        """True while tab is queued or its load has not finished"""
+        return tab in self._pending or tab in self._running
+
+    def progress(self) -> Tuple[int, int]:
+        """Return (finished, total) for the current batch"""
+        return self._done, self._total
+
+    def _report(self):
+        if not self._pending and not self._running:
+            self._done = 0
+            self._total = 0
+        if self._on_progress:
+            try:
+                self._on_progress(self._done, self._total)
+            except Exception:
+                pass
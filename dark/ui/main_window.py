@@ -3,7 +3,7 @@ from PyQt6.QtCore import Qt, QUrl, QTimer
 from PyQt6.QtGui import QIcon, QClipboard, QShortcut, QKeySequence
 from PyQt6.QtWidgets import (
     QWidget, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
-    QListWidget, QListWidgetItem, QApplication, QStackedLayout, QDockWidget, QMenu
+    QApplication, QStackedLayout, QDockWidget, QMenu
 )
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEngineProfile
@@ -16,20 +16,28 @@ import traceback
 import shutil
 from pathlib import Path
 from .tabs import TabManager
-from .home_widget import HomeWidget
-from .settings_widget import SettingsWidget
-from .downloads_widget import DownloadsWidget
-from .notification_widget import NotificationManager
+from .tab_model import TabListView
+from .tab_groups import GroupBar
+from .command_palette import CommandPalette
+from ..core.urls import normalize_url
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, profile: QWebEngineProfile, settings, downloads=None) -> None:
+    def __init__(self, profile: QWebEngineProfile, settings, downloads=None, startup=None, session_store=None, window_id: str | None = None, spare_pages=None, window_manager=None, home_tab: bool = True) -> None:
         super().__init__()
         self.setWindowTitle("Dark Browser")
         self.resize(1400, 900)
         self.profile = profile
         self.settings = settings
         self.downloads = downloads
+        self.startup = startup
+        self.session_store = session_store
+        self.window_manager = window_manager  # Creates further windows on the shared services
+        # Each window owns its own section of the session store
+        if window_id is None:
+            import uuid
+            window_id = uuid.uuid4().hex
+        self.window_id = window_id
 
         # Central widget (navbar + content stack)
         central = QWidget(self)
@@ -81,15 +89,23 @@ class MainWindow(QMainWindow):
         root_v.addWidget(self.favorites_bar)
 
         # Tabs dock (left)
-        self.tabs_list = QListWidget()
+        self.tabs_list = TabListView()
         self.tabs_list.setMinimumWidth(196)
         self.tabs_list.setMaximumWidth(260)
-        self.tabs_list.itemClicked.connect(self._on_tab_clicked)
+        self.tabs_list.clicked.connect(self._on_tab_clicked)
         self.tabs_dock = QDockWidget("Tabs", self)
         self.tabs_dock.setObjectName("TabsDock")
         self.tabs_dock.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea)
         self.tabs_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable | QDockWidget.DockWidgetFeature.DockWidgetClosable)
-        self.tabs_dock.setWidget(self.tabs_list)
+        # Tab group picker above the strip
+        self.group_bar = GroupBar()
+        tabs_panel = QWidget()
+        tabs_panel_v = QVBoxLayout(tabs_panel)
+        tabs_panel_v.setContentsMargins(0, 0, 0, 0)
+        tabs_panel_v.setSpacing(0)
+        tabs_panel_v.addWidget(self.group_bar)
+        tabs_panel_v.addWidget(self.tabs_list, 1)
+        self.tabs_dock.setWidget(tabs_panel)
         self.tabs_dock.closeEvent = lambda e: self._on_tabs_dock_closed()
         self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.tabs_dock)
         self.tabs_dock.setVisible(True)
@@ -101,15 +117,12 @@ class MainWindow(QMainWindow):
         self.content_stack.setStackingMode(QStackedLayout.StackingMode.StackOne)
         root_v.addWidget(self.content, 1)
 
-        # Sidebar (ChatGPT)
-        self.sidebar_view = QWebEngineView(self)
+        # Sidebar (ChatGPT); the view itself is created after the first paint
+        self.sidebar_view = None
         self.sidebar_dock = QDockWidget("ChatGPT", self)
-        self.sidebar_view.setMinimumWidth(400)
-        self.sidebar_view.setMaximumWidth(700)
         self.sidebar_dock.setObjectName("SidebarDock")
         self.sidebar_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
         self.sidebar_dock.setFeatures(QDockWidget.DockWidgetFeature.DockWidgetMovable | QDockWidget.DockWidgetFeature.DockWidgetClosable)
-        self.sidebar_dock.setWidget(self.sidebar_view)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.sidebar_dock)
         self.sidebar_dock.setVisible(False)
 
@@ -123,16 +136,22 @@ class MainWindow(QMainWindow):
         self.favorites = []  # List of (url, title) tuples
         self.favorites_widgets = []  # List of favorite button widgets
         
-        # Load favorites from settings
-        self.load_favorites()
+        # Load favorites from settings; the bar is built after the first paint
+        saved_favorites = self.settings.get('favorites')
+        self.favorites = saved_favorites if isinstance(saved_favorites, list) else []
+        self._favorite_keys: dict[str, int] = {}  # normalized URL -> number of favorites with it
+        self._index_favorites()
+        self._defer("favorites bar", self.load_favorites, 30)
 
         # Main view stack manager
-        self.tabman = TabManager(self.profile, self.tabs_list, self.url_edit, self.content, self.content_stack, settings=self.settings, downloads=self.downloads, main_window=self)
+        self.tabman = TabManager(self.profile, self.tabs_list, self.url_edit, self.content, self.content_stack, settings=self.settings, downloads=self.downloads, main_window=self, session_store=self.session_store, window_id=self.window_id, spare_pages=spare_pages, home_tab=home_tab)
         self.side_open = False
+        self.group_bar.group_selected.connect(self.tabman.switch_group)
+        self.group_bar.group_added.connect(self.tabman.add_group)
+        self.palette = CommandPalette(self)
         
-        # Notification manager
-        self.notification_manager = NotificationManager(self)
-        self.notification_manager.hide()  # Initially hidden, shown when needed
+        # Notification manager; built on the first notification
+        self._notification_manager = None
         
         # Setup download notifications
         if self.downloads:
@@ -150,8 +169,9 @@ class MainWindow(QMainWindow):
         # Restore state/geometry but force sidebar to start closed
         try:
             import base64
-            geo = self.settings.get('win_geometry')
-            state = self.settings.get('win_state')
+            saved = self.session_store.load_window(self.window_id) if self.session_store else {}
+            geo = saved.get('geometry') or self.settings.get('win_geometry')
+            state = saved.get('state') or self.settings.get('win_state')
             if geo:
                 self.restoreGeometry(base64.b64decode(geo))
             if state:
@@ -179,8 +199,33 @@ class MainWindow(QMainWindow):
         # Setup keyboard shortcuts
         self._setup_keyboard_shortcuts()
         
-        # Welcome dialog system
-        self._setup_welcome_dialog()
+        # Remaining startup work runs in idle slices
+        self._defer("sidebar", self._ensure_sidebar_view, 40)
+        self._defer("welcome check", self._setup_welcome_dialog, 50)
+
+    def _defer(self, name: str, fn, priority: int):
+        """Run fn after the first paint when a startup scheduler is present"""
+        if self.startup:
+            self.startup.defer(name, fn, priority)
+        else:
+            fn()
+
+    @property
+    def notification_manager(self):
+        if self._notification_manager is None:
+            from .notification_widget import NotificationManager
+            self._notification_manager = NotificationManager(self)
+            self._notification_manager.hide()  # Initially hidden, shown when needed
+        return self._notification_manager
+
+    def _ensure_sidebar_view(self) -> QWebEngineView:
+        """Create the ChatGPT sidebar view on first use"""
+        if self.sidebar_view is None:
+            self.sidebar_view = QWebEngineView(self)
+            self.sidebar_view.setMinimumWidth(400)
+            self.sidebar_view.setMaximumWidth(700)
+            self.sidebar_dock.setWidget(self.sidebar_view)
+        return self.sidebar_view
 
     def _setup_keyboard_shortcuts(self):
         """Setup all keyboard shortcuts"""
@@ -204,9 +249,9 @@ class MainWindow(QMainWindow):
         shortcut_f5_reload = QShortcut(QKeySequence("F5"), self)
         shortcut_f5_reload.activated.connect(lambda: self.tabman.navigate("reload"))
         
-        # Ctrl+Shift+T: Reopen closed tab (placeholder - needs history)
+        # Ctrl+Shift+T: Reopen the last closed tab with its history
         shortcut_reopen = QShortcut(QKeySequence("Ctrl+Shift+T"), self)
-        shortcut_reopen.activated.connect(lambda: self.tabman.create_tab())  # Simple implementation
+        shortcut_reopen.activated.connect(lambda: self.tabman.reopen_closed_tab())
         
         # Ctrl+Tab: Next tab
         shortcut_next_tab = QShortcut(QKeySequence("Ctrl+Tab"), self)
@@ -236,10 +281,33 @@ class MainWindow(QMainWindow):
         shortcut_settings = QShortcut(QKeySequence("Ctrl+,"), self)
         shortcut_settings.activated.connect(lambda: self.tabman.open_url("dark://settings"))
 
+        # Ctrl+Shift+F12: Show performance counters (tab switch latency)
+        shortcut_perf = QShortcut(QKeySequence("Ctrl+Shift+F12"), self)
+        shortcut_perf.activated.connect(self._show_perf_stats)
+
+        # Ctrl+K: Command palette (tabs, favorites, pins and the actions below)
+        shortcut_palette = QShortcut(QKeySequence("Ctrl+K"), self)
+        shortcut_palette.activated.connect(self.palette.open)
+        for title, keys, callback in (
+            ("New Tab", "Ctrl+T", lambda: self.tabman.create_tab()),
+            ("Close Tab", "Ctrl+W", lambda: self.tabman.close_tab(self.tabman.active_index)),
+            ("Reopen Closed Tab", "Ctrl+Shift+T", lambda: self.tabman.reopen_closed_tab()),
+            ("Home", "", lambda: self.tabman.open_url("dark://home")),
+            ("Settings", "Ctrl+,", lambda: self.tabman.open_url("dark://settings")),
+            ("Downloads", "Ctrl+J", lambda: self.tabman.open_url("dark://downloads")),
+            ("New Window", "", self._open_new_window),
+            ("New Tab Group", "", self.group_bar.ask_new_group),
+            ("Toggle Tabs", "", self.toggle_tabs_dock),
+            ("Toggle Sidebar", "", lambda: self.toggle_sidebar()),
+            ("Full Screen", "F11", self._toggle_fullscreen),
+            ("Reload", "Ctrl+R", lambda: self.tabman.navigate("reload")),
+            ("Performance Counters", "Ctrl+Shift+F12", self._show_perf_stats),
+        ):
+            self.palette.add_action(title, keys, callback)
+
     def _setup_welcome_dialog(self):
         """Setup and show welcome dialog for first run or debug mode"""
         from PyQt6.QtCore import QTimer
-        from .welcome_dialog import WelcomeDialog
         
         # Check if this is first run or debug mode
         first_run = not self.settings.get('welcome_shown')
@@ -260,33 +328,47 @@ class MainWindow(QMainWindow):
         welcome_dialog = WelcomeDialog(self)
         welcome_dialog.exec()
 
+    def _open_new_window(self):
+        if self.window_manager:
+            self.window_manager.open()
+        else:
+            self.tabman._new_window().show()
+
     def _cycle_tab(self, direction: int):
-        """Cycle through tabs (1 for next, -1 for previous)"""
-        if not self.tabman.tabs:
+        """Cycle through the tabs of the current group (1 for next, -1 for previous)"""
+        rows = self.tabman.rows_in_group()
+        if not rows:
             return
         
         current = self.tabman.active_index
-        if direction == 1:  # Next tab
-            next_tab = current + 1
-            if next_tab >= len(self.tabman.tabs):
-                next_tab = 0
-        else:  # Previous tab
-            next_tab = current - 1
-            if next_tab < 0:
-                next_tab = len(self.tabman.tabs) - 1
+        pos = rows.index(current) if current in rows else -1
+        next_tab = rows[(pos + direction) % len(rows)]
         
         self.tabman.set_active(next_tab)
     
+    def _show_perf_stats(self):
+        """Print the runtime performance histograms and summarize them in a notification"""
+        hist = self.tabman.switch_latency
+        print(hist.report())
+        if self.window_manager:
+            print(self.window_manager.creation_latency.report())
+        print(self.palette.latency.report())
+        updates = self.tabman._page_updates
+        print(f"page signals: {updates.signals} coalesced into {updates.flushes} frame updates")
+        stats = hist.summary()
+        self.show_notification(f"Tab switch: {stats['count']} samples, p50 <= {stats['p50_ms']} ms, "
+                               f"p95 <= {stats['p95_ms']} ms, max {stats['max_ms']} ms", "info", 6000)
+
     def _toggle_favorite(self):
         """Toggle current page as favorite"""
         if 0 <= self.tabman.active_index < len(self.tabman.tabs):
             tab = self.tabman.tabs[self.tabman.active_index]
-            if tab.view:
-                url = tab.view.url().toString()
-                title = tab.view.title() or "Untitled"
+            if tab.page:
+                url = tab.page.url().toString()
+                title = tab.page.title() or "Untitled"
                 if url and url.startswith("http"):
                     # Check if already favorited
-                    if any(url == fav_url for fav_url, _ in self.favorites):
+                    if self.is_favorite(url):
                         self.remove_favorite(url)
                     else:
                         self.add_favorite(url, title)
@@ -305,9 +387,9 @@ class MainWindow(QMainWindow):
         url = self.tabman.parse_url_or_search(text, self.settings.get("search") or "google")
         self.tabman.open_url(url)
 
-    def _on_tab_clicked(self, item: QListWidgetItem):  # type: ignore[name-defined]
-        idx = self.tabs_list.row(item)
-        if idx == self.tabs_list.count() - 1:
+    def _on_tab_clicked(self, index):
+        idx = index.row()
+        if idx >= len(self.tabman.tabs):
             # Don't create Home tab automatically - create empty web tab instead
             self.tabman.create_tab()
             self.tabman.set_active(len(self.tabman.tabs) - 1)
@@ -387,7 +469,7 @@ class MainWindow(QMainWindow):
     
     def _update_favorites_bar_visibility(self):
         """Update favorites bar visibility based on setting and current tab"""
-        if not self.favorites:
+        if not self.favorites or not self.favorites_widgets:
             self.hide_favorites_bar()
             return
             
@@ -404,6 +486,9 @@ class MainWindow(QMainWindow):
         """Load favorites from settings"""
         saved_favorites = self.settings.get('favorites')
         self.favorites = saved_favorites if isinstance(saved_favorites, list) else []
+        self._index_favorites()
+        if getattr(self, 'tabman', None):
+            self.tabman._update_all_tabs_favorite_status()
         self.rebuild_favorites_bar()
         # Update visibility based on setting
         self._update_favorites_bar_visibility()
@@ -412,28 +497,44 @@ class MainWindow(QMainWindow):
         """Save favorites to settings"""
         self.settings.set('favorites', self.favorites)
     
+    def is_favorite(self, url: str) -> bool:
+        """Whether url (in any equivalent spelling) is a favorite"""
+        return normalize_url(url) in self._favorite_keys
+
+    def _index_favorites(self):
+        self._favorite_keys = {}
+        for fav_url, _ in self.favorites:
+            key = normalize_url(fav_url)
+            self._favorite_keys[key] = self._favorite_keys.get(key, 0) + 1
+
+    def _drop_favorite_entries(self, url: str):
+        """Remove every favorite equivalent to url (same key as is_favorite)"""
+        key = normalize_url(url)
+        self.favorites = [fav for fav in self.favorites if normalize_url(fav[0]) != key]
+        self._favorite_keys.pop(key, None)
+
     def add_favorite(self, url: str, title: str):
         """Add a favorite to the list and update UI"""
         # Remove if already exists
-        self.favorites = [(u, t) for u, t in self.favorites if u != url]
+        self._drop_favorite_entries(url)
         # Add to the end
         self.favorites.append((url, title))
+        key = normalize_url(url)
+        self._favorite_keys[key] = self._favorite_keys.get(key, 0) + 1
         self.save_favorites()
         self.rebuild_favorites_bar()
         self._update_favorites_bar_visibility()
-        # Update all tabs' favorite status
-        if hasattr(self.tabman, '_update_all_tabs_favorite_status'):
-            self.tabman._update_all_tabs_favorite_status()
+        # Repaint only the tabs showing this page
+        self.tabman.refresh_tabs_for_url(url)
     
     def remove_favorite(self, url: str):
         """Remove a favorite from the list and update UI"""
-        self.favorites = [(u, t) for u, t in self.favorites if u != url]
+        self._drop_favorite_entries(url)
         self.save_favorites()
         self.rebuild_favorites_bar()
         self._update_favorites_bar_visibility()
-        # Update all tabs' favorite status
-        if hasattr(self.tabman, '_update_all_tabs_favorite_status'):
-            self.tabman._update_all_tabs_favorite_status()
+        # Repaint only the tabs showing this page
+        self.tabman.refresh_tabs_for_url(url)
     
     def rebuild_favorites_bar(self):
         """Rebuild the favorites bar UI with pre-loading for performance"""
@@ -482,6 +583,7 @@ class MainWindow(QMainWindow):
         menu.exec(global_pos)
 
     def toggle_sidebar(self, with_text: str | None = None):
+        self._ensure_sidebar_view()
         # Always open sidebar when sending text
         if with_text:
             # Open sidebar if closed, keep open if already open
@@ -569,6 +671,15 @@ class MainWindow(QMainWindow):
             self.dl_btn.setIcon(QIcon(f"{icon_base}/downloads.svg"))
             self.dl_btn.setToolTip("Descargas")
 
+    def _other_windows_open(self) -> bool:
+        """True when another browser window is still open"""
+        if self.window_manager:
+            return self.window_manager.others_open(self)
+        return any(
+            isinstance(w, MainWindow) and w is not self and w.isVisible()
+            for w in QApplication.topLevelWidgets()
+        )
+
     # Persist session/layout
     def closeEvent(self, e):  # pragma: no cover
         # Check for active downloads before closing
@@ -592,16 +703,36 @@ class MainWindow(QMainWindow):
                 e.ignore()
                 return
         
+        # Titles and URLs still waiting for the next frame
+        self.tabman._page_updates.flush()
         try:
-            sess = self.tabman.export_session()
-            self.settings.set('session', sess.get('tabs', []))
-            # Save the actual active tab index instead of last tab
-            self.settings.set('session_active', self.tabman.active_index if self.tabman.active_index >= 0 else 0)
-            # Save favorites
-            self.save_favorites()
             import base64
-            self.settings.set('win_geometry', base64.b64encode(self.saveGeometry()).decode('ascii'))
-            self.settings.set('win_state', base64.b64encode(self.saveState()).decode('ascii'))
+            geometry = base64.b64encode(self.saveGeometry()).decode('ascii')
+            state = base64.b64encode(self.saveState()).decode('ascii')
+            if self.session_store:
+                if self._other_windows_open():
+                    # Closing one of several windows drops just that window's section
+                    self.session_store.remove_window(self.window_id)
+                    # ...and nothing may write it back: stop saving and free the pages
+                    self.tabman.close()
+                    if self.window_manager:
+                        self.window_manager.forget(self)
+                else:
+                    self.tabman._persist_structure()
+                    self.tabman.persist_histories()
+                    self.session_store.put_window(self.window_id, geometry=geometry, state=state)
+                self.save_favorites()
+            else:
+                sess = self.tabman.export_session()
+                with self.settings.batch():
+                    self.settings.set('session', sess.get('tabs', []))
+                    # Save the actual active tab index instead of last tab
+                    self.settings.set('session_active', self.tabman.active_index if self.tabman.active_index >= 0 else 0)
+                    # Save favorites
+                    self.save_favorites()
+                    self.settings.set('win_geometry', geometry)
+                    self.settings.set('win_state', state)
+            self.settings.flush()
         except Exception:
             pass
         return super().closeEvent(e)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+import time
+from typing import Callable, Dict, Optional
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QWidget, QStackedLayout
+
+# Tab title used when a native page is opened without one
+NATIVE_TITLES = {"home": "Home", "settings": "Settings", "downloads": "Descargas"}
+
+# Hidden native pages are deleted after this long (rebuilt on next use)
+NATIVE_IDLE_S = 2 * 60
+# Hidden native pages kept at most, besides the visible one
+MAX_HIDDEN_NATIVE = 1
+CHECK_INTERVAL_MS = 30 * 1000
+
+
+class NativePageCache:
+    """The Home, Settings and Downloads widgets of one window.
+
+    Native tabs do not own a widget. All tabs of one kind share a single
+    instance, built by its factory the first time such a tab is shown.
+    Hidden instances are deleted after ``NATIVE_IDLE_S``, or least recently
+    shown first when more than ``budget`` of them are alive.
+    """
+
+    def __init__(self, stack: QStackedLayout, factories: Dict[str, Callable[[], QWidget]], budget: int = MAX_HIDDEN_NATIVE, parent=None) -> None:
+        self._stack = stack
+        self._factories = factories
+        self.budget = max(0, int(budget))
+        self._widgets: Dict[str, QWidget] = {}
+        self._hidden_since: Dict[str, float] = {}
+        self._current: Optional[str] = None
+        self._timer = QTimer(parent)
+        self._timer.timeout.connect(self.trim)
+        self._timer.start(CHECK_INTERVAL_MS)
+
+    def get(self, kind: str) -> QWidget:
+        """The widget for kind, built on first use"""
+        widget = self._widgets.get(kind)
+        if widget is None:
+            widget = self._widgets[kind] = self._factories[kind]()
+            self._stack.addWidget(widget)
+        return widget
+
+    def peek(self, kind: str) -> Optional[QWidget]:
+        """The widget for kind if it is currently built"""
+        return self._widgets.get(kind)
+
+    def shown(self, kind: Optional[str]):
+        """kind is now on screen (None for a web page); the others start idling"""
+        previous, self._current = self._current, kind
+        if previous is not None and previous != kind and previous in self._widgets:
+            self._hidden_since[previous] = time.monotonic()
+        self._hidden_since.pop(kind, None)
+        self.trim()
+
+    def trim(self):
+        """Delete hidden widgets past the idle time or the budget"""
+        now = time.monotonic()
+        hidden = sorted(self._hidden_since, key=self._hidden_since.get)
+        for i, kind in enumerate(hidden):
+            if now - self._hidden_since[kind] >= NATIVE_IDLE_S or len(hidden) - i > self.budget:
+                self.drop(kind)
+
+    def drop(self, kind: str):
+        self._hidden_since.pop(kind, None)
+        widget = self._widgets.pop(kind, None)
+        if widget is not None:
+            self._stack.removeWidget(widget)
+            widget.deleteLater()
+
+    def stop(self):
+        self._timer.stop()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+import time
+from typing import List, Optional
+from PyQt6.QtCore import QTimer, QUrl
+from .web import WebPage
+
+# Spare pages kept ready on the profile (each holds a renderer process)
+SPARE_PAGES = 2
+# Refill only after new tabs stopped arriving for this long
+REFILL_DELAY_MS = 1500
+
+
+class SparePagePool:
+    """Pre-created WebPages whose renderers are already running.
+
+    ``take`` hands out a spare page (or None when the pool is empty, so the
+    caller builds one as before) and schedules a refill. Refills create one
+    page at a time and wait until tab creation has been quiet for
+    ``REFILL_DELAY_MS``, so a burst of new tabs is not slowed down by them.
+    Spare pages have no parent; whoever takes one parents it.
+    """
+
+    def __init__(self, profile, size: int = SPARE_PAGES) -> None:
+        self.profile = profile
+        self.size = max(0, int(size))
+        self._spare: List[WebPage] = []
+        self._started = time.perf_counter()
+        self.warmup_ms: Optional[float] = None  # Until the first spare renderer answered
+        self._refill_timer = QTimer()
+        self._refill_timer.setSingleShot(True)
+        self._refill_timer.timeout.connect(self._refill_one)
+        self._closed = False
+
+    def start(self):
+        """Spin up the first spare page now and the rest in idle time"""
+        if self.size and not self._spare:
+            self._add_page()
+        self._schedule_refill()
+
+    def take(self) -> Optional[WebPage]:
+        """A ready page for a new tab, or None"""
+        page = self._spare.pop(0) if self._spare else None
+        if page is not None:
+            try:
+                page.loadFinished.disconnect()
+            except Exception:
+                pass
+            # Drop the warm-up about:blank entry, or Back would lead to a blank page
+            page.history().clear()
+        self._schedule_refill()
+        return page
+
+    def clear(self):
+        """Delete the spare pages (before the profile goes away)"""
+        self._closed = True
+        self._refill_timer.stop()
+        while self._spare:
+            self._spare.pop().deleteLater()
+
+    def _schedule_refill(self):
+        if not self._closed and len(self._spare) < self.size:
+            self._refill_timer.start(REFILL_DELAY_MS)
+
+    def _refill_one(self):
+        if self._closed or len(self._spare) >= self.size:
+            return
+        self._add_page()
+        self._schedule_refill()
+
+    def _add_page(self):
+        try:
+            page = WebPage(self.profile)
+            page.loadFinished.connect(lambda *_: self._on_warm(page))
+            # A blank load is enough to start the renderer process
+            page.load(QUrl("about:blank"))
+            self._spare.append(page)
+        except Exception as e:
+            print(f"Warning: could not create a spare page: {e}")
+
+    def _on_warm(self, page):
+        if self.warmup_ms is None:
+            self.warmup_ms = (time.perf_counter() - self._started) * 1000
+        try:
+            page.loadFinished.disconnect()
+        except Exception:
+            pass
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from typing import Callable, Dict
+from PyQt6.QtCore import Qt, QTimer
+
+# One flush per display frame at most
+FRAME_MS = 16
+
+# What changed on a page since the last flush (bit flags)
+TITLE = 1
+ICON = 2
+URL = 4
+LOADED = 8
+
+
+class PageUpdateDispatcher:
+    """Coalesce page signals into one update per frame.
+
+    The titleChanged, iconChanged, urlChanged and loadFinished handlers only
+    ``mark`` the page dirty. The first mark of a frame starts a timer, and
+    after ``FRAME_MS`` the callback gets every dirty page with the OR of its
+    flags. It reads the current title and URL from the page at that point. A
+    page that changes its title on a timer or calls pushState in a loop
+    therefore costs one row repaint and one session write per frame, not
+    one per signal.
+    """
+
+    def __init__(self, flush: Callable[[Dict[object, int]], None], interval_ms: int = FRAME_MS, parent=None) -> None:
+        self._flush = flush
+        self._dirty: Dict[object, int] = {}  # page -> flags, in first-marked order
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self.signals = 0  # Marks received, for the performance counters
+        self.flushes = 0
+
+    def mark(self, page, flags: int):
+        self.signals += 1
+        self._dirty[page] = self._dirty.get(page, 0) | flags
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def discard(self, page):
+        """Forget pending updates of a page that is going away or changing owner"""
+        self._dirty.pop(page, None)
+
+    def flush(self):
+        """Deliver pending updates now"""
+        self._timer.stop()
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
+        self.flushes += 1
+        self._flush(dirty)
+
+    def stop(self):
+        self._timer.stop()
+        self._dirty.clear()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+from typing import List
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QComboBox, QToolButton, QInputDialog
+
+# Name shown for the group every window starts with (stored as "")
+DEFAULT_GROUP_LABEL = "Default"
+
+
+class GroupBar(QWidget):
+    """Workspace picker above the tab strip.
+
+    Picking a group emits ``group_selected`` with its name, the "+" button
+    asks for a name and emits ``group_added``. The tab manager decides what
+    happens; the bar only shows what ``set_groups`` last told it.
+    """
+
+    group_selected = pyqtSignal(str)
+    group_added = pyqtSignal(str)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("GroupBar")
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 0)
+        layout.setSpacing(4)
+        self.combo = QComboBox()
+        self.combo.setToolTip("Tab group")
+        self.combo.activated.connect(lambda i: self.group_selected.emit(self.combo.itemData(i) or ""))
+        self.add_btn = QToolButton()
+        self.add_btn.setText("+")
+        self.add_btn.setToolTip("New tab group")
+        self.add_btn.clicked.connect(self.ask_new_group)
+        layout.addWidget(self.combo, 1)
+        layout.addWidget(self.add_btn)
+
+    def set_groups(self, names: List[str], active: str):
+        self.combo.blockSignals(True)
+        self.combo.clear()
+        for name in names:
+            self.combo.addItem(name or DEFAULT_GROUP_LABEL, name)
+        self.combo.setCurrentIndex(max(0, self.combo.findData(active)))
+        self.combo.blockSignals(False)
+
+    def ask_new_group(self):
+        name, ok = QInputDialog.getText(self, "New Tab Group", "Name:")
+        name = (name or "").strip()
+        if ok and name:
+            self.group_added.emit(name)
@@ -0,0 +1,348 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List, Optional
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QPoint, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QPainter
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView
+
+ICONS_DIR = Path(__file__).resolve().parent.parent / "resources" / "icons"
+
+UrlRole = Qt.ItemDataRole.UserRole + 1
+KindRole = Qt.ItemDataRole.UserRole + 2
+FavoriteRole = Qt.ItemDataRole.UserRole + 3
+ActiveRole = Qt.ItemDataRole.UserRole + 4
+NewTabRole = Qt.ItemDataRole.UserRole + 5
+StateRole = Qt.ItemDataRole.UserRole + 6  # lifecycle: active, frozen or discarded
+
+NEW_TAB_TITLE = "+ New Tab"
+
+# Row geometry (matches the old per-item widgets)
+ROW_HEIGHT = 32
+ROW_MARGIN_V = 6
+ROW_MARGIN_H = 2
+BUTTON_SIZE = 20
+BUTTON_SPACING = 6
+PADDING_H = 8
+FAVICON_SIZE = 16
+
+
+class TabListModel(QAbstractListModel):
+    """Rows of the tab strip, backed directly by TabManager.tabs.
+
+    The list is shared with the tab manager and is only changed through
+    this model so every change reaches the view as a row insert, remove or
+    dataChanged instead of a rebuild. The last row is the "+ New Tab" entry.
+    """
+
+    def __init__(self, tabs: List, is_favorite: Optional[Callable[[str], bool]] = None, parent=None) -> None:
+        super().__init__(parent)
+        self._tabs = tabs
+        self._is_favorite = is_favorite or (lambda url: False)
+        self._resetting = 0
+        self.active_row = -1
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return len(self._tabs) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not index.isValid() or row < 0 or row > len(self._tabs):
+            return None
+        if row == len(self._tabs):
+            if role == Qt.ItemDataRole.DisplayRole:
+                return NEW_TAB_TITLE
+            if role == NewTabRole:
+                return True
+            return None
+        tab = self._tabs[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return tab.title or "New Tab"
+        if role == Qt.ItemDataRole.DecorationRole:
+            if tab.kind != "web" or tab.page is None:
+                return None
+            try:
+                return tab.page.icon()  # Favicon; null until the page reports one
+            except RuntimeError:
+                return None  # page already deleted
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return tab.url or tab.title
+        if role == UrlRole:
+            return tab.url
+        if role == KindRole:
+            return tab.kind
+        if role == FavoriteRole:
+            return tab.kind == "web" and bool(tab.url) and self._is_favorite(tab.url)
+        if role == ActiveRole:
+            return row == self.active_row
+        if role == NewTabRole:
+            return False
+        if role == StateRole:
+            return tab.lifecycle
+        return None
+
+    def flags(self, index: QModelIndex):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    # Changes (all mutations of the shared list go through here)
+
+    def append(self, tab):
+        self.insert(len(self._tabs), tab)
+
+    def insert(self, row: int, tab):
+        if self._resetting:
+            self._tabs.insert(row, tab)
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._tabs.insert(row, tab)
+        self.endInsertRows()
+
+    def extend(self, tabs: List):
+        if not tabs:
+            return
+        if self._resetting:
+            self._tabs.extend(tabs)
+            return
+        first = len(self._tabs)
+        self.beginInsertRows(QModelIndex(), first, first + len(tabs) - 1)
+        self._tabs.extend(tabs)
+        self.endInsertRows()
+
+    def pop(self, row: int):
+        if self._resetting:
+            return self._tabs.pop(row)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        tab = self._tabs.pop(row)
+        if self.active_row == row:
+            self.active_row = -1
+        elif self.active_row > row:
+            self.active_row -= 1
+        self.endRemoveRows()
+        return tab
+
+    def replace_all(self, tabs: List):
+        """Swap in a new tab list (batch closes) with a single model reset"""
+        with self.resetting():
+            self._tabs[:] = tabs
+            self.active_row = -1
+
+    def clear(self):
+        with self.resetting():
+            self._tabs.clear()
+            self.active_row = -1
+
+    @contextmanager
+    def resetting(self):
+        """Apply many changes as one model reset (session restore, bulk edits)"""
+        if self._resetting == 0:
+            self.beginResetModel()
+        self._resetting += 1
+        try:
+            yield self
+        finally:
+            self._resetting -= 1
+            if self._resetting == 0:
+                self.endResetModel()
+
+    def refresh(self, row: int, roles: Optional[List[int]] = None):
+        """Repaint one tab row after its title, URL, icon or favorite state changed"""
+        if self._resetting or not 0 <= row < len(self._tabs):
+            return
+        index = self.index(row)
+        if roles:
+            self.dataChanged.emit(index, index, roles)
+        else:
+            self.dataChanged.emit(index, index)
+
+    def refresh_all(self):
+        if self._resetting or not self._tabs:
+            return
+        self.dataChanged.emit(self.index(0), self.index(len(self._tabs) - 1))
+
+    def set_active_row(self, row: int):
+        """Move the active marker; only the two affected rows are repainted"""
+        previous, self.active_row = self.active_row, row
+        if previous != row:
+            self.refresh(previous)
+        self.refresh(row)
+
+
+class TabItemDelegate(QStyledItemDelegate):
+    """Paints tab rows, including the hover close and favorite buttons"""
+
+    _icons: dict = {}
+
+    def __init__(self, view: "TabListView") -> None:
+        super().__init__(view)
+        self._view = view
+
+    @classmethod
+    def icon(cls, name: str) -> QIcon:
+        icon = cls._icons.get(name)
+        if icon is None:
+            icon = cls._icons[name] = QIcon(str(ICONS_DIR / name))
+        return icon
+
+    @staticmethod
+    def content_rect(rect: QRect) -> QRect:
+        return rect.adjusted(ROW_MARGIN_H, ROW_MARGIN_V, -ROW_MARGIN_H, -ROW_MARGIN_V)
+
+    def button_rects(self, rect: QRect, index: QModelIndex) -> dict:
+        """Hit areas of the hover buttons of a row, keyed by button name"""
+        if index.data(NewTabRole):
+            return {}
+        content = self.content_rect(rect)
+        top = content.top() + (content.height() - BUTTON_SIZE) // 2
+        close = QRect(content.right() - PADDING_H - BUTTON_SIZE + 1, top, BUTTON_SIZE, BUTTON_SIZE)
+        rects = {"close": close}
+        if index.data(KindRole) == "web":
+            rects["star"] = close.translated(-(BUTTON_SIZE + BUTTON_SPACING), 0)
+        return rects
+
+    def button_at(self, rect: QRect, index: QModelIndex, pos: QPoint) -> Optional[str]:
+        for name, r in self.button_rects(rect, index).items():
+            if r.contains(pos):
+                return name
+        return None
+
+    def sizeHint(self, option, index) -> QSize:  # noqa: N802
+        return QSize(option.rect.width(), ROW_HEIGHT + 2 * ROW_MARGIN_V)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        content = self.content_rect(option.rect)
+        hovered = self._view.hover_row == index.row()
+        active = bool(index.data(ActiveRole))
+        new_tab = bool(index.data(NewTabRole))
+
+        if active or hovered:
+            painter.fillRect(content, QColor(255, 255, 255, 15))
+        if active:
+            painter.fillRect(QRect(content.left(), content.top(), 3, content.height()), QColor("#3b82f6"))
+
+        buttons = self.button_rects(option.rect, index) if hovered else {}
+        text_rect = content.adjusted(PADDING_H + (3 if active else 0), 0, -PADDING_H, 0)
+        if buttons:
+            left_most = min(r.left() for r in buttons.values())
+            text_rect.setRight(left_most - BUTTON_SPACING)
+        favicon = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(favicon, QIcon) and not favicon.isNull():
+            top = text_rect.top() + (text_rect.height() - FAVICON_SIZE) // 2
+            favicon.paint(painter, QRect(text_rect.left(), top, FAVICON_SIZE, FAVICON_SIZE))
+            text_rect.setLeft(text_rect.left() + FAVICON_SIZE + BUTTON_SPACING)
+
+        font = painter.font()
+        font.setPixelSize(13)
+        painter.setFont(font)
+        discarded = index.data(StateRole) == "discarded"
+        if discarded:
+            # Sleeping tab: dimmed and italic until it is selected again
+            font.setItalic(True)
+            painter.setFont(font)
+        painter.setPen(QColor("#9ca3af") if new_tab else QColor("#6b7280") if discarded else QColor("#e5e7eb"))
+        title = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        elided = painter.fontMetrics().elidedText(title, Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, elided)
+
+        for name, r in buttons.items():
+            if r.contains(self._view.hover_pos):
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor(255, 255, 255, 31))
+                painter.drawRoundedRect(r, 6, 6)
+            if name == "close":
+                icon = self.icon("close.svg")
+            else:
+                icon = self.icon("star_filled.svg" if index.data(FavoriteRole) else "star.svg")
+            icon.paint(painter, r.adjusted(3, 3, -3, -3))
+        painter.restore()
+
+
+class TabListView(QListView):
+    """Vertical tab strip; rows are painted by TabItemDelegate.
+
+    Clicking a row emits the usual ``clicked`` signal. Clicks on a row's
+    hover buttons are consumed here and reported as ``close_requested`` and
+    ``favorite_toggled`` with the row number.
+    """
+
+    close_requested = pyqtSignal(int)
+    favorite_toggled = pyqtSignal(int)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("TabStrip")
+        self.hover_row = -1
+        self.hover_pos = QPoint(-1, -1)
+        self._pressed_button: Optional[tuple] = None
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setItemDelegate(TabItemDelegate(self))
+
+    def _button_at(self, pos: QPoint):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None, index
+        return self.itemDelegate().button_at(self.visualRect(index), index, pos), index
+
+    def _set_hover(self, row: int, pos: QPoint):
+        previous = self.hover_row
+        self.hover_row, self.hover_pos = row, pos
+        model = self.model()
+        if model is None:
+            return
+        for r in {previous, row}:
+            if r >= 0:
+                self.viewport().update(self.visualRect(model.index(r, 0)))
+
+    def mouseMoveEvent(self, e):  # noqa: N802
+        self._set_hover(self.indexAt(e.position().toPoint()).row(), e.position().toPoint())
+        super().mouseMoveEvent(e)
+
+    def leaveEvent(self, e):  # noqa: N802
+        self._set_hover(-1, QPoint(-1, -1))
+        super().leaveEvent(e)
+
+    def mousePressEvent(self, e):  # noqa: N802
+        if e.button() == Qt.MouseButton.LeftButton:
+            button, index = self._button_at(e.position().toPoint())
+            if button:
+                self._pressed_button = (button, index.row())
+                e.accept()
+                return
+        self._pressed_button = None
+        super().mousePressEvent(e)
+
+    def mouseReleaseEvent(self, e):  # noqa: N802
+        pressed, self._pressed_button = self._pressed_button, None
+        if pressed is not None:
+            button, index = self._button_at(e.position().toPoint())
+            if (button, index.row()) == pressed:
+                if button == "close":
+                    self.close_requested.emit(index.row())
+                else:
+                    self.favorite_toggled.emit(index.row())
+            e.accept()
+            return
+        super().mouseReleaseEvent(e)
+
+    def rows_in_view(self) -> tuple:
+        """First and last row currently visible (inclusive), or (-1, -1)"""
+        model = self.model()
+        if model is None or model.rowCount() == 0:
+            return -1, -1
+        rect = self.viewport().rect()
+        first = self.indexAt(rect.topLeft()).row()
+        last = self.indexAt(QPoint(rect.left(), rect.bottom())).row()
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = model.rowCount() - 1
+        return first, last
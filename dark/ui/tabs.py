@@ -1,14 +1,34 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import time
+import uuid
+from dataclasses import dataclass, field
 from typing import List, Optional
-from PyQt6.QtCore import Qt, QUrl, QPoint
-from PyQt6.QtWidgets import QWidget, QListWidget, QListWidgetItem, QPushButton, QHBoxLayout, QStackedLayout, QLabel, QMenu, QApplication
+from PyQt6.QtCore import Qt, QUrl, QPoint, QTimer
+from PyQt6.QtWidgets import QWidget, QStackedLayout, QMenu, QApplication
 from PyQt6.QtGui import QClipboard
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEnginePage as Page
 from .web import WebPage
 from .home_widget import HomeWidget
-from .tab_item import TabItemWidget
+from .tab_model import TabListModel, TabListView
+from .load_queue import LoadQueue
+from .view_pool import ViewPool, VIEW_POOL_SIZE
+from .page_pool import SparePagePool
+from .page_updates import PageUpdateDispatcher, TITLE, ICON, URL, LOADED
+from .native_pages import NativePageCache, NATIVE_TITLES, MAX_HIDDEN_NATIVE
+from .lifecycle import TabLifecycleManager
+from ..core.session import serialize_history, restore_history
+from ..core.urls import normalize_url
+from ..core.metrics import LatencyHistogram
+from ..core.closed_tabs import ClosedTabStash
+from ..core.search_index import SearchIndex
+
+# Delay before the active tab is written to the session after a switch
+ACTIVE_SAVE_DELAY_MS = 500
+# Closed pages deleted per event-loop turn after a batch close
+DISPOSE_PER_TURN = 8
+# Pause between reloading two hibernated tabs after switching back to their group
+GROUP_WAKE_INTERVAL_MS = 750
 
 SEARCH_ENGINES = {
     "google": "https://www.google.com/search?q={q}",
@@ -17,16 +37,28 @@ SEARCH_ENGINES = {
     "brave": "https://search.brave.com/search?q={q}",
 }
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Tab:
-    view: QWebEngineView | None
-    widget: QWidget | None
+    """One entry of the tab strip; hashed by identity, addressed by its stable id"""
+    page: WebPage | None = None  # Shown through the window's ViewPool, never owned by a view
     title: str = "New Tab"
     url: str = ""
     pinned: bool = False
+    kind: str = "web"  # web, home, settings, downloads
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    history: bytes | None = None  # Saved back/forward list, applied when the page is created
+    last_active: float = field(default_factory=time.monotonic)  # For the lifecycle LRU
+    lifecycle: str = "active"  # active, frozen or discarded (see TabLifecycleManager)
+    group: str = ""  # Tab group (workspace) of the window; "" is the default one
+    wake: bool = False  # Page was Active when its group was left; reloaded when the group is shown again
+
+    @property
+    def is_placeholder(self) -> bool:
+        """Restored web tab whose page has not been created yet"""
+        return self.kind == "web" and self.page is None
 
 class TabManager:
-    def __init__(self, profile: QWebEngineProfile, tabs_list: QListWidget, url_edit, content_container: QWidget, content_stack: QStackedLayout, settings=None, downloads=None, main_window=None) -> None:
+    def __init__(self, profile: QWebEngineProfile, tabs_list: TabListView, url_edit, content_container: QWidget, content_stack: QStackedLayout, settings=None, downloads=None, main_window=None, session_store=None, window_id: str = "main", spare_pages: Optional[SparePagePool] = None, home_tab: bool = True) -> None:
         self.profile = profile
         self.tabs_list = tabs_list
         self.url_edit = url_edit
@@ -35,80 +67,161 @@ class TabManager:
         self.settings = settings
         self.downloads = downloads
         self.main_window = main_window
+        self.session_store = session_store
+        self.window_id = window_id
+        self._persisted_ids: set[str] = set()
         self.tabs: List[Tab] = []
         self.active_index: int = -1
+        # The tab strip shows self.tabs through this model; change the list only via the model
+        self._tab_model = TabListModel(self.tabs, is_favorite=self._is_favorite_url, parent=tabs_list)
+        self.tabs_list.setModel(self._tab_model)
+        # Hash indexes so signal handlers never scan self.tabs
+        self._tabs_by_id: dict[str, Tab] = {}
+        self._tabs_by_page: dict = {}  # WebPage -> Tab
+        self._tabs_by_url: dict[str, set] = {}  # normalized URL -> tabs showing it
+        self.search_index = SearchIndex()  # Titles and URLs for the command palette
+        # Page signals only mark tabs dirty; rows and session records are updated once per frame
+        self._page_updates = PageUpdateDispatcher(self._apply_page_updates, parent=tabs_list)
+        self._rows: Optional[dict] = None  # Tab -> row, rebuilt after structural changes
+        self._tab_model.rowsInserted.connect(lambda _p, first, last: self._index_rows(first, last))
+        self._tab_model.rowsAboutToBeRemoved.connect(lambda _p, first, last: self._unindex_rows(first, last))
+        self._tab_model.rowsRemoved.connect(lambda *_: self._invalidate_rows())
+        self._tab_model.modelReset.connect(self._reindex)
+        # Only the active group's rows are shown (hidden rows are forgotten on reset)
+        self._tab_model.modelReset.connect(self._apply_group_filter)
+        self._tab_model.rowsInserted.connect(lambda _p, first, last: self._apply_group_filter(first, last))
+        self.tabs_list.close_requested.connect(self.close_tab)
+        self.tabs_list.favorite_toggled.connect(self._toggle_tab_favorite)
         self._restoring_session = False  # Flag to prevent redundant set_active calls
+        self._closed = False  # Set by close(); a closed window saves nothing more
+        self._active_save_timer: Optional[QTimer] = None
+        self._dispose_queue: List = []
+        self.switch_latency = LatencyHistogram("tab switch")
+        # Recently closed tabs with their back/forward lists, for Ctrl+Shift+T
+        self.closed_tabs = ClosedTabStash()
+        QApplication.instance().aboutToQuit.connect(self.closed_tabs.clear)
+        # Tab groups: only the active one keeps live pages, the others are hibernated
+        self.groups: List[str] = [""]
+        self.active_group = ""
+        self._group_active: dict[str, str] = {}  # group -> id of its last active tab
+        self._waking: List[Tab] = []  # hibernated tabs of the active group still to reload
+        self._wake_timer = QTimer(tabs_list)
+        self._wake_timer.timeout.connect(self._wake_next)
 
-        # Pre-warm QWebEngine with a lightweight page to prevent first-search restart
-        self._prewarm_qwebengine()
+        # Web tabs own their pages; a few views are shared and switch pages on activation
+        pool_size = VIEW_POOL_SIZE
+        if self.settings:
+            try:
+                pool_size = int(self.settings.get('view_pool_size') or VIEW_POOL_SIZE)
+            except (TypeError, ValueError):
+                pass
+        self._views = ViewPool(self._create_pool_view, pool_size)
+        # Home/Settings/Downloads widgets are shared by their tabs and built on demand
+        native_budget = MAX_HIDDEN_NATIVE
+        if self.settings:
+            try:
+                native_budget = int(self.settings.get('native_page_budget') or MAX_HIDDEN_NATIVE)
+            except (TypeError, ValueError):
+                pass
+        self._native = NativePageCache(self.stack, {
+            "home": lambda: HomeWidget(self.settings, self.container, tab_manager=self),
+            "settings": self._build_settings_widget,
+            "downloads": self._build_downloads_widget,
+        }, native_budget, parent=tabs_list)
 
-        # Restore session or open single Home tab
+        # Cap how many pages load at once when many tabs need loading together
+        max_loads = 3
+        if self.settings:
+            try:
+                max_loads = int(self.settings.get('max_concurrent_loads') or 3)
+            except (TypeError, ValueError):
+                pass
+        self._load_queue = LoadQueue(self._start_tab_load, self._load_priorities, max_loads, on_progress=self._on_load_progress)
+
+        # Freeze/discard background tabs to bound renderer memory
+        self.lifecycle = TabLifecycleManager(lambda: self.tabs, self._lifecycle_exempt, self._on_lifecycle_changed,
+                                             settings=self.settings, parent=tabs_list)
+
+        # New web tabs take pre-started pages; a window without the app pool keeps one of its own
+        if spare_pages is None:
+            spare_pages = SparePagePool(self.profile, size=1)
+            spare_pages.start()
+        self.spare_pages = spare_pages
+
+        # Restore session or open single Home tab (unless the caller brings the first tab)
         restored = False
         if self.settings:
             try:
-                sess = self.settings.get('session') or []
-                active = int(self.settings.get('session_active') or 0)
+                sess, active = self._load_saved_session()
                 #print(f"DEBUG: Restoring session with {len(sess)} tabs, active index: {active}")
                 if sess:
                     # Set flag to prevent redundant set_active calls during restore
                     self._restoring_session = True
                     
-                    # Create tabs without immediately setting active
-                    for i, t in enumerate(sess):
-                        ttype = t.get('type')
-                        #print(f"DEBUG: Tab {i}: type={ttype}, url={t.get('url')}, title={t.get('title')}")
-                        if ttype == 'web':
-                            self.create_tab(t.get('url') or 'https://www.google.com')
-                            # Set the saved title after creation
-                            saved_title = t.get('title')
-                            if saved_title and self.tabs:
-                                self.tabs[-1].title = saved_title
-                        elif ttype == 'home':
-                            title = t.get('title') or 'Home'
-                            self.create_tab_native(HomeWidget(self.settings, tab_manager=self), title)
-                        elif ttype == 'settings':
-                            from .settings_widget import SettingsWidget
-                            title = t.get('title') or 'Settings'
-                            self.create_tab_native(SettingsWidget(self.settings, self.container.window()), title)
-                        elif ttype == 'downloads':
-                            from .downloads_widget import DownloadsWidget
-                            title = t.get('title') or 'Descargas'
-                            self.create_tab_native(DownloadsWidget(self.downloads), title)
+                    # Create tabs without immediately setting active; the strip is reset once
+                    with self._tab_model.resetting():
+                        for i, t in enumerate(sess):
+                            ttype = t.get('type')
+                            #print(f"DEBUG: Tab {i}: type={ttype}, url={t.get('url')}, title={t.get('title')}")
+                            if ttype == 'web':
+                                # Keep only a lightweight record; the view is created on first activation
+                                self.create_tab_placeholder(t.get('url') or 'https://www.google.com', t.get('title'))
+                                self.tabs[-1].history = t.get('history')
+                            elif ttype in NATIVE_TITLES:
+                                # The widget itself is only built when the tab is shown
+                                self.create_tab_native(ttype, t.get('title') or NATIVE_TITLES[ttype])
+                            else:
+                                continue
+                            if t.get('id'):
+                                self.tabs[-1].id = t['id']
+                            self.tabs[-1].group = t.get('group') or ""
                     
-                    # Clear flag and set the final active tab
+                    # Clear flag, build the list once and set the final active tab
                     self._restoring_session = False
-                    last_active = int(self.settings.get('session_active') or 0)
-                    #print(f"DEBUG: Setting final active tab to index {last_active}, total tabs: {len(self.tabs)}")
-                    if 0 <= last_active < len(self.tabs):
-                        self.set_active(last_active)
+                    for tab in self.tabs:
+                        if tab.group not in self.groups:
+                            self.groups.append(tab.group)
+                    if self.tabs:
+                        self.active_group = self.tabs[active if 0 <= active < len(self.tabs) else -1].group
+                    self._apply_group_filter()
+                    self._groups_changed()
+                    self._tabs_changed()
+                    #print(f"DEBUG: Setting final active tab to index {active}, total tabs: {len(self.tabs)}")
+                    if 0 <= active < len(self.tabs):
+                        self.set_active(active)
                     else:
                         self.set_active(len(self.tabs) - 1)
-                    
-                    # Reload all web tabs to ensure they're fully loaded after session restore
-                    # Use QTimer to ensure tabs are fully loaded before reloading
-                    from PyQt6.QtCore import QTimer
-                    QTimer.singleShot(500, self._reload_all_tabs_for_restore)
+
+                    # Eager restore still goes through the load queue
+                    if self.settings.get('session_restore') == 'eager':
+                        for tab in self.tabs:
+                            if tab.is_placeholder and tab.group == self.active_group:
+                                self._load_queue.request(tab)
                     
                     restored = True
             except Exception:
+                self._restoring_session = False
                 restored = False
-        if not restored:
-            self.create_tab_native(HomeWidget(self.settings, tab_manager=self), 'Home')
+        if not restored and home_tab:
+            self.create_tab_native('home', 'Home')
             self.set_active(0)
 
-    def _reload_all_tabs_for_restore(self):
-        """Reload all web tabs after session restore to ensure full loading"""
-        #print(f"DEBUG: Reloading {len(self.tabs)} tabs after session restore")
-        for i, tab in enumerate(self.tabs):
-            if tab.view and tab.view.url().toString():
-                #print(f"DEBUG: Reloading tab {i}: {tab.view.url().toString()}")
-                tab.view.reload()
-    
+    def _load_saved_session(self):
+        """Saved tabs and active index, from the session store or legacy settings"""
+        if self.session_store:
+            saved = self.session_store.load_window(self.window_id)
+            tabs = saved.get('tabs') or []
+            self.groups = [""] + [g for g in saved.get('groups') or [] if g]
+            self._persisted_ids = {t['id'] for t in tabs}
+            active = next((i for i, t in enumerate(tabs) if t['id'] == saved.get('active_tab')), 0)
+            return tabs, active
+        return self.settings.get('session') or [], int(self.settings.get('session_active') or 0)
+
     def _reload_all_tabs_for_theme(self):
         """Reload all web tabs to apply dark theme"""
         for tab in self.tabs:
-            if tab.view and tab.view.url().toString():
-                tab.view.reload()
+            if tab.page and tab.page.url().toString():
+                tab.page.triggerAction(Page.WebAction.Reload)
 
     def parse_url_or_search(self, text: str, engine: str) -> str:
         text = (text or "").strip()
@@ -123,27 +236,30 @@ class TabManager:
         from urllib.parse import quote_plus
         return SEARCH_ENGINES.get(engine, SEARCH_ENGINES["google"]).format(q=quote_plus(text))
 
-    def _attach_view(self, view: QWebEngineView):
-        # Ensure the new view is parented and sized
-        view.setParent(self.container)
+    def _create_pool_view(self) -> QWebEngineView:
+        """New view for the ViewPool; it only ever shows pages set on it"""
+        view = QWebEngineView(self.container)
         self.stack.addWidget(view)
-        
-        # Connect signals safely
+        # Setup custom context menu for web view
+        view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        view.customContextMenuRequested.connect(lambda pos: self._web_context_menu(pos, view))
+        return view
+
+    def _attach_page(self, page: WebPage):
+        # Page signals stay connected whichever pool view shows the page
+        page.tab_manager = self  # Used by WebPage.createWindow
+        mark = self._page_updates.mark
         try:
-            view.titleChanged.connect(lambda title: self._sync_title(title, view))
-            view.iconChanged.connect(lambda *_: self._refresh_tabs_ui())
-            view.urlChanged.connect(lambda url: self._on_url_changed(url, view))
+            page.titleChanged.connect(lambda *_: mark(page, TITLE))
+            page.iconChanged.connect(lambda *_: mark(page, ICON))
+            page.urlChanged.connect(lambda *_: mark(page, URL))
             # Removed selectionChanged to prevent floating button
-            view.loadFinished.connect(lambda *_: self._update_all_tabs_favorite_status())
-            
-            # Setup custom context menu for web view
-            view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            view.customContextMenuRequested.connect(lambda pos: self._web_context_menu(pos, view))
+            page.loadFinished.connect(lambda *_: mark(page, LOADED))
         except Exception:
             pass
         
         # Enable prudent features
-        s = view.settings()
+        s = page.settings()
         try:
             s.setAttribute(s.WebAttribute.JavascriptEnabled, True)
             s.setAttribute(s.WebAttribute.JavascriptCanOpenWindows, True)
@@ -163,53 +279,219 @@ class TabManager:
         # Auto-grant runtime permissions prudently
         def on_perm(origin, feature):
             try:
-                view.page().setFeaturePermission(origin, feature, Page.PermissionPolicy.PermissionGrantedByUser)
+                page.setFeaturePermission(origin, feature, Page.PermissionPolicy.PermissionGrantedByUser)
             except Exception:
                 pass
         try:
-            view.page().featurePermissionRequested.connect(on_perm)
+            page.featurePermissionRequested.connect(on_perm)
         except Exception:
             pass
 
     def resize(self):
         pass
 
-    def create_tab(self, url: Optional[str] = None):
+    # Tab indexes
+
+    def tab_by_id(self, tab_id: str) -> Optional[Tab]:
+        return self._tabs_by_id.get(tab_id)
+
+    def tab_for_page(self, page) -> Optional[Tab]:
+        """Tab that owns page"""
+        return self._tabs_by_page.get(page)
+
+    def row_of(self, tab: Tab) -> int:
+        """Current position of tab in the strip, or -1"""
+        if self._rows is None:
+            self._rows = {t: i for i, t in enumerate(self.tabs)}
+        return self._rows.get(tab, -1)
+
+    def _bind_page(self, tab: Tab, page: WebPage):
+        """Give tab its page and index it"""
+        tab.page = page
+        self._tabs_by_page[page] = tab
+        self.lifecycle.watch(tab)
+        self._tab_model.refresh(self.row_of(tab))  # A hibernated row stops looking asleep
+
+    def tabs_for_url(self, url: str) -> set:
+        """Tabs whose page is url, in any equivalent spelling"""
+        return self._tabs_by_url.get(normalize_url(url), set())
+
+    def _set_tab_url(self, tab: Tab, url: str):
+        """Change tab.url and keep the URL index in step"""
+        old_key, new_key = normalize_url(tab.url), normalize_url(url)
+        tab.url = url
+        if self._tabs_by_id.get(tab.id) is not tab:
+            return
+        self._index_search(tab)
+        if old_key == new_key:
+            return
+        self._drop_url_key(tab, old_key)
+        if new_key:
+            self._tabs_by_url.setdefault(new_key, set()).add(tab)
+
+    def _drop_url_key(self, tab: Tab, key: str):
+        tabs = self._tabs_by_url.get(key)
+        if tabs is not None:
+            tabs.discard(tab)
+            if not tabs:
+                del self._tabs_by_url[key]
+
+    def _index_search(self, tab: Tab):
+        detail = tab.url if tab.kind == "web" else f"dark://{tab.kind}"
+        self.search_index.put(tab.id, "tab", tab.title, detail, tab)
+
+    def _index_tab(self, tab: Tab):
+        self._tabs_by_id[tab.id] = tab
+        self._index_search(tab)
+        key = normalize_url(tab.url)
+        if key:
+            self._tabs_by_url.setdefault(key, set()).add(tab)
+        if tab.page is not None:
+            self._tabs_by_page[tab.page] = tab
+
+    def _unindex_tab(self, tab: Tab):
+        if self._tabs_by_id.get(tab.id) is tab:
+            del self._tabs_by_id[tab.id]
+            self.search_index.remove(tab.id)
+        self._drop_url_key(tab, normalize_url(tab.url))
+        if tab.page is not None:
+            self._tabs_by_page.pop(tab.page, None)
+
+    def _index_rows(self, first: int, last: int):
+        for tab in self.tabs[first:last + 1]:
+            self._index_tab(tab)
+        self._invalidate_rows()
+
+    def _unindex_rows(self, first: int, last: int):
+        for tab in self.tabs[first:last + 1]:
+            self._unindex_tab(tab)
+
+    def _invalidate_rows(self):
+        self._rows = None
+
+    def _reindex(self):
+        self._tabs_by_id.clear()
+        self._tabs_by_page.clear()
+        self._tabs_by_url.clear()
+        self.search_index.clear()
+        for tab in self.tabs:
+            self._index_tab(tab)
+        self._invalidate_rows()
+
+    def _new_page(self) -> WebPage:
+        """Create the WebPage of a web tab (owned by the container, not by a view)"""
+        page = self.spare_pages.take() or WebPage(self.profile)
+        page.setParent(self.container)
+        self._attach_page(page)
+        return page
+
+    def create_tab(self, url: Optional[str] = None, background: bool = False):
         if url:
             # Create web tab with URL
-            view = QWebEngineView(self.container)
-            page = WebPage(self.profile, view)
-            view.setPage(page)
-            # Set view reference in page for createWindow to access
-            page.view = view
-            self._attach_view(view)
-            t = Tab(view=view, widget=None, title="Loading...")
-            self.tabs.append(t)
-            self._rebuild_list()
-            self.set_active(len(self.tabs)-1)
-            view.load(QUrl(url))
-            # Update URL bar immediately
-            self.url_edit.setText(url)
-            # Update favorite status for the new tab
-            self._update_tab_favorite_status(len(self.tabs)-1)
+            t = Tab(title="Loading...", url=url, group=self.active_group)
+            self._bind_page(t, self._new_page())
+            self._tab_model.append(t)
+            self._tabs_changed()
+            if not background:
+                self.set_active(self.row_of(t))
+            self._load_queue.request(t, url)
+            if not background:
+                # Update URL bar immediately
+                self.url_edit.setText(url)
         else:
             # Create Home tab
-            from .home_widget import HomeWidget
-            home_widget = HomeWidget(self.settings, tab_manager=self)
-            home_widget.setParent(self.container)
-            self.stack.addWidget(home_widget)
-            t = Tab(view=None, widget=home_widget, title="Home")
-            self.tabs.append(t)
-            self._rebuild_list()
-            self.set_active(len(self.tabs)-1)
-
-    def create_tab_native(self, widget: QWidget, title: str = ""):
-        widget.setParent(self.container)
-        self.stack.addWidget(widget)
-        t = Tab(view=None, widget=widget, title=title or "New Tab")
-        self.tabs.append(t)
-        self._rebuild_list()
+            t = self.create_tab_native("home", "Home")
+        return t
+
+    def create_tab_native(self, kind: str, title: str = "") -> Tab:
+        """Add a Home, Settings or Downloads tab; its widget comes from the native page cache"""
+        t = Tab(title=title or NATIVE_TITLES.get(kind, "New Tab"), kind=kind, group=self.active_group)
+        self._tab_model.append(t)
+        if self._restoring_session:
+            return t
+        self._tabs_changed()
         self.set_active(len(self.tabs)-1)
+        return t
+
+    def _build_settings_widget(self) -> QWidget:
+        from .settings_widget import SettingsWidget
+        return SettingsWidget(self.settings, self.container.window(), self.container)
+
+    def _build_downloads_widget(self) -> QWidget:
+        from .downloads_widget import DownloadsWidget
+        return DownloadsWidget(self.downloads, self.container)
+
+    def create_tab_placeholder(self, url: str, title: Optional[str] = None):
+        """Append a web tab that keeps only its title and URL until it is first shown"""
+        t = Tab(title=title or url, url=url, group=self.active_group)
+        self._tab_model.append(t)
+        if not self._restoring_session:
+            self._tabs_changed()
+
+    def open_urls(self, urls: List[str], activate_first: bool = True):
+        """Open several URLs in new tabs, loading them through the load queue"""
+        first = len(self.tabs)
+        self._tab_model.extend([Tab(title=url, url=url, group=self.active_group) for url in urls])
+        if len(self.tabs) == first:
+            return
+        self._tabs_changed()
+        if activate_first:
+            self.set_active(first)
+        for tab in self.tabs[first:]:
+            if tab.is_placeholder:
+                self._load_queue.request(tab)
+
+    def _materialize_tab(self, tab: Tab):
+        """Create the page for a placeholder tab and queue its saved URL"""
+        self._load_queue.request(tab)
+
+    def _start_tab_load(self, tab: Tab, url: Optional[str]):
+        """Load callback for the queue: create the page if needed, then load"""
+        if tab.page is None:
+            if tab.kind != "web":
+                raise ValueError("not a web tab")
+            self._bind_page(tab, self._new_page())
+        if url is None and tab.history:
+            # Bring back the saved back/forward list; this also loads its current entry
+            data, tab.history = tab.history, None
+            try:
+                if restore_history(tab.page.history(), data):
+                    return
+            except Exception as e:
+                print(f"Error restoring tab history: {e}")
+        tab.page.load(QUrl(url or tab.url))
+
+    def _load_priorities(self, tabs: List[Tab]):
+        """Active tab first, then tabs visible in the list, then by distance"""
+        first_visible, last_visible = self.tabs_list.rows_in_view()
+        keys = []
+        for tab in tabs:
+            index = self.row_of(tab)
+            if index < 0:
+                keys.append((3, 0))
+                continue
+            if index == self.active_index:
+                keys.append((0, 0))
+                continue
+            distance = abs(index - self.active_index) if self.active_index >= 0 else index
+            visible = first_visible <= index <= last_visible
+            keys.append((1 if visible else 2, distance))
+        return keys
+
+    def _on_load_finished(self, page):
+        tab = self.tab_for_page(page)
+        if tab is not None:
+            self._load_queue.finished(tab)
+
+    def _on_load_progress(self, done: int, total: int):
+        """Show load queue progress in the tabs dock title"""
+        dock = getattr(self.main_window, 'tabs_dock', None) if self.main_window else None
+        if dock is None:
+            return
+        if total > 1 and done < total:
+            dock.setWindowTitle(f"Tabs · loading {done}/{total}")
+        else:
+            dock.setWindowTitle("Tabs")
 
     def set_active(self, index: int):
         #print(f"DEBUG: set_active called with index {index}, current active_index: {self.active_index}, restoring: {self._restoring_session}")
@@ -222,118 +504,97 @@ class TabManager:
             print(f"DEBUG: Skipping set_active during session restore")
             return
         
+        started = time.perf_counter()
+        tab = self.tabs[index]
+        # Selecting a tab of another group (e.g. from the tab switcher) switches to that group
+        if tab.group != self.active_group:
+            self._enter_group(tab.group)
         # Update active index
         self.active_index = index
-        #print(f"DEBUG: Updated active_index to {self.active_index}")
-        
-        # Save session immediately when tab changes (but not during restore)
-        if not self._restoring_session:
-            self._save_session_immediately()
-        
-        # Remove active class from all tabs
-        for i in range(self.tabs_list.count()):
-            item = self.tabs_list.item(i)
-            widget = self.tabs_list.itemWidget(item)
-            if widget and widget.objectName() == "TabItem":
-                widget.setProperty("class", "")
-                widget.style().unpolish(widget)
-                widget.style().polish(widget)
-        
-        # Add active class to selected tab
-        item = self.tabs_list.item(index)
-        widget = self.tabs_list.itemWidget(item)
-        if widget and widget.objectName() == "TabItem":
-            widget.setProperty("class", "active")
-            widget.style().unpolish(widget)
-            widget.style().polish(widget)
+        self._group_active[tab.group] = tab.id
+
+        # Restored tabs get their page the first time they are selected
+        if tab.is_placeholder:
+            self._materialize_tab(tab)
+        # Wakes frozen/discarded pages (discarded ones reload)
+        self.lifecycle.touch(tab)
         
-        # Select the item in the list
-        self.tabs_list.setCurrentItem(item)
+        # Only the previous and the new row are repainted
+        self._tab_model.set_active_row(index)
+        self.tabs_list.setCurrentIndex(self._tab_model.index(index))
         
-        # Show the selected tab content
+        # Show the selected tab content (also sets the URL bar)
         self._show_only(index)
         
-        # Update URL bar to match the active tab
-        if 0 <= index < len(self.tabs):
-            tab = self.tabs[index]
-            if tab.view and not tab.widget:
-                # Web tab - update URL bar with current URL
-                try:
-                    url = tab.view.url().toString()
-                    if url:
-                        self.url_edit.setText(url)
-                except Exception:
-                    pass
-            elif tab.widget:
-                # Native tab - set appropriate URL
-                if hasattr(tab.widget, '__class__'):
-                    class_name = tab.widget.__class__.__name__
-                    if 'HomeWidget' in class_name:
-                        self.url_edit.setText("dark://home")
-                    elif 'SettingsWidget' in class_name:
-                        self.url_edit.setText("dark://settings")
-                    elif 'DownloadsWidget' in class_name:
-                        self.url_edit.setText("dark://downloads")
-        
         # Setup context menu only once
         if not hasattr(self, '_ctx_init'):
             self._refresh_tabs_ui()
-        
-        # Update favorites bar visibility if main_window supports it
-        if self.main_window and hasattr(self.main_window, '_update_favorites_bar_visibility'):
-            self.main_window._update_favorites_bar_visibility()
+
+        # Saving the active tab is coalesced; fast cycling writes once
+        if not self._restoring_session:
+            self._schedule_active_save()
+        self.switch_latency.record((time.perf_counter() - started) * 1000)
+
+    def _lifecycle_exempt(self, tab: Tab) -> bool:
+        """Tabs the lifecycle manager must leave alone"""
+        if tab.kind != "web" or tab.pinned or self._load_queue.is_loading(tab):
+            return True
+        if 0 <= self.active_index < len(self.tabs) and self.tabs[self.active_index] is tab:
+            return True
+        try:
+            return tab.page.recentlyAudible()
+        except (AttributeError, RuntimeError):
+            return True
+
+    def _on_lifecycle_changed(self, tab: Tab):
+        self._tab_model.refresh(self.row_of(tab))
+
+    def _schedule_active_save(self):
+        if self._active_save_timer is None:
+            self._active_save_timer = QTimer()
+            self._active_save_timer.setSingleShot(True)
+            self._active_save_timer.timeout.connect(self._save_session_immediately)
+        # Restart on every switch: only the tab the user settles on is saved
+        self._active_save_timer.start(ACTIVE_SAVE_DELAY_MS)
+
+    def _url_for_bar(self, tab: Tab) -> str:
+        """What the URL bar shows for tab"""
+        if tab.kind == "web":
+            url = tab.page.url().toString() if tab.page else ""
+            return url or tab.url
+        return f"dark://{tab.kind}"
 
     def _show_only(self, index: int):
         if 0 <= index < len(self.tabs):
             tab = self.tabs[index]
-            target = tab.view if tab.view is not None else tab.widget
+            # Web pages go into a pool view (setPage only if it shows another page)
+            target = None
+            if tab.page is not None:
+                target = self._views.show(tab.page)
+            elif tab.kind in NATIVE_TITLES:
+                target = self._native.get(tab.kind)
             if target is not None:
-                if tab.view:
-                    #print(f"DEBUG: Switching to web view at index {index}")
-                    self.stack.setCurrentWidget(tab.view)
-                elif tab.widget:
-                    #print(f"DEBUG: Switching to native widget at index {index}")
-                    self.stack.setCurrentWidget(tab.widget)
-                else:
-                    print(f"DEBUG: No widget found for tab at index {index}")
-                #print(f"DEBUG: set_active completed, current stack widget: {self.stack.currentWidget()}")
+                self.stack.setCurrentWidget(target)
                 target.show()  # Ensure widget is visible
                 target.setFocus()
-                # Update URL bar
-                if tab.view:
-                    # Web view - show actual URL
-                    try:
-                        url = tab.view.url().toString()
-                        if url:
-                            self.url_edit.setText(url)
-                    except Exception:
-                        pass
-                elif tab.widget:
-                    # Native widget - show corresponding dark:// URL
-                    if hasattr(tab.widget, '__class__'):
-                        class_name = tab.widget.__class__.__name__
-                        if 'HomeWidget' in class_name:
-                            self.url_edit.setText("dark://home")
-                        elif 'SettingsWidget' in class_name:
-                            self.url_edit.setText("dark://settings")
-                        elif 'DownloadsWidget' in class_name:
-                            self.url_edit.setText("dark://downloads")
-                        else:
-                            self.url_edit.setText("")
+            self._native.shown(tab.kind if tab.kind in NATIVE_TITLES else None)
+            try:
+                self.url_edit.setText(self._url_for_bar(tab))
+            except RuntimeError:
+                pass  # page already deleted
 
     def close_tab(self, index: int):
         if index < 0 or index >= len(self.tabs):
             return
-        t = self.tabs.pop(index)
-        if t.view:
-            self.stack.removeWidget(t.view)
-            t.view.deleteLater()
-        if t.widget:
-            self.stack.removeWidget(t.widget)
-            t.widget.deleteLater()
-        self._rebuild_list()
+        t = self._tab_model.pop(index)
+        self._load_queue.cancel(t)
+        self._stash_closed(t)
+        if t.page:
+            self._views.release(t.page)
+            t.page.deleteLater()
+        self._tabs_changed()
         if self.tabs:
-            self.set_active(min(index, len(self.tabs)-1))
+            self.set_active(self._neighbour_row(index, t.group))
         else:
             # No tabs left: close the app window
             try:
@@ -341,26 +602,407 @@ class TabManager:
             except Exception:
                 pass
 
+    # Batch closing: one model reset, one session write, deletion spread over turns
+
+    def close_tabs(self, tabs):
+        """Close several tabs in one pass"""
+        doomed = set(tabs)
+        if not doomed:
+            return
+        active = self.tabs[self.active_index] if 0 <= self.active_index < len(self.tabs) else None
+        keep = [t for t in self.tabs if t not in doomed]
+        closed = [t for t in self.tabs if t in doomed]
+        if not closed:
+            return
+        # The active tab stays active; otherwise the next surviving tab after it
+        next_active = None
+        if active is not None and active not in doomed:
+            next_active = active
+        elif keep:
+            # Prefer a surviving tab of the same group so the group stays on screen
+            same = [t for t in keep if t.group == self.active_group]
+            after = [t for t in self.tabs[self.active_index:] if t not in doomed and t.group == self.active_group]
+            next_active = after[0] if after else same[-1] if same else keep[-1]
+
+        self._tab_model.replace_all(keep)
+        self.active_index = self.row_of(next_active) if next_active is not None else -1
+        self._load_queue.cancel_many(closed)
+        # Only the newest entries would survive in the stash anyway
+        for t in closed[-self.closed_tabs.max_entries:]:
+            self._stash_closed(t)
+        for t in closed:
+            if t.page:
+                self._views.release(t.page)
+                self._dispose_queue.append(t.page)
+        self._tabs_changed()
+        if next_active is not None:
+            self.set_active(self.active_index)
+        else:
+            try:
+                self.container.window().close()
+            except Exception:
+                pass
+        if self._dispose_queue:
+            QTimer.singleShot(0, self._dispose_some)
+
+    def close_other_tabs(self, index: int):
+        """Close the other tabs of the tab's group"""
+        if 0 <= index < len(self.tabs):
+            keep = self.tabs[index]
+            self.close_tabs([t for t in self.tabs if t is not keep and t.group == keep.group])
+
+    def close_tabs_to_right(self, index: int):
+        if 0 <= index < len(self.tabs):
+            group = self.tabs[index].group
+            self.close_tabs([t for t in self.tabs[index + 1:] if t.group == group])
+
+    def close_all_tabs(self):
+        self.close_tabs(list(self.tabs))
+
+    def close_duplicate_tabs(self):
+        """Close web tabs showing a page that another tab already shows (the active one is kept)"""
+        active = self.tabs[self.active_index] if 0 <= self.active_index < len(self.tabs) else None
+        seen = {}
+        for t in self.tabs:
+            if t.kind != "web" or t.group != self.active_group:
+                continue
+            key = normalize_url(self._url_for_bar(t))
+            if key and key not in seen:
+                seen[key] = t
+        if active is not None and active.kind == "web":
+            seen[normalize_url(self._url_for_bar(active))] = active
+        keepers = set(seen.values())
+        self.close_tabs([t for t in self.tabs if t.kind == "web" and t.group == self.active_group
+                         and t not in keepers and normalize_url(self._url_for_bar(t))])
+
+    # Tab groups: switching away hibernates a group, switching back reloads it gradually
+
+    def rows_in_group(self, group: Optional[str] = None) -> List[int]:
+        """Rows of the tabs in group (the active group by default)"""
+        group = self.active_group if group is None else group
+        return [i for i, t in enumerate(self.tabs) if t.group == group]
+
+    def _neighbour_row(self, index: int, group: str) -> int:
+        """Row to activate after the tab at index left: the nearest one of group, else any"""
+        rows = self.rows_in_group(group)
+        if not rows:
+            return min(index, len(self.tabs) - 1)
+        after = [r for r in rows if r >= index]
+        return after[0] if after else rows[-1]
+
+    def add_group(self, name: str, switch: bool = True):
+        name = (name or "").strip()
+        if name and name not in self.groups:
+            self.groups.append(name)
+            self._groups_changed()
+            self._persist_active()
+        if name and switch:
+            self.switch_group(name)
+
+    def switch_group(self, name: str):
+        """Show group name: its last active tab comes back first, the rest follow"""
+        if name == self.active_group and 0 <= self.active_index < len(self.tabs):
+            return
+        self._enter_group(name)
+        tab = self.tab_by_id(self._group_active.get(name, ""))
+        if tab is None or tab.group != name:
+            rows = self.rows_in_group(name)
+            tab = self.tabs[rows[0]] if rows else None
+        if tab is None:
+            self.create_tab_native("home", "Home")  # Joins the (empty) group
+        else:
+            self.set_active(self.row_of(tab))
+
+    def move_to_group(self, index: int, name: str):
+        """Put the tab at index into group name (created if new)"""
+        if not 0 <= index < len(self.tabs):
+            return
+        name = (name or "").strip()
+        tab = self.tabs[index]
+        if name == tab.group:
+            return
+        if name not in self.groups:
+            self.groups.append(name)
+            self._groups_changed()
+        was_active = index == self.active_index
+        tab.group = name
+        self._persist_tab(tab)
+        self._apply_group_filter(index, index)
+        if name != self.active_group and self._hibernate(tab):
+            QTimer.singleShot(0, self._dispose_some)
+        if was_active:
+            rows = self.rows_in_group(self.active_group)
+            if rows:
+                self.set_active(self._neighbour_row(index, self.active_group))
+            else:
+                self.create_tab_native("home", "Home")
+        self._persist_active()
+
+    def _enter_group(self, name: str):
+        """Make name the visible group and hibernate the one left behind"""
+        previous, self.active_group = self.active_group, name
+        if name not in self.groups:
+            self.groups.append(name)
+        hibernated = False
+        for tab in self.tabs:
+            if tab.group == previous and tab.group != name:
+                hibernated = self._hibernate(tab) or hibernated
+        # A named group left without tabs goes away
+        if previous and previous != name and not self.rows_in_group(previous):
+            self.groups.remove(previous)
+            self._group_active.pop(previous, None)
+        if hibernated:
+            QTimer.singleShot(0, self._dispose_some)
+        self._apply_group_filter()
+        self._groups_changed()
+        self._schedule_wake()
+
+    def _hibernate(self, tab: Tab) -> bool:
+        """Drop the page of a background web tab, keeping its URL and history.
+
+        The tab becomes a placeholder again; its renderer is released once
+        the page is deleted. Tabs playing audio keep their page.
+        """
+        page = tab.page
+        if page is None or tab.kind != "web":
+            return False
+        try:
+            if page.recentlyAudible():
+                return False
+        except RuntimeError:
+            return False
+        self._set_tab_url(tab, self._url_for_bar(tab))
+        tab.history = self._tab_history(tab)
+        self._load_queue.cancel(tab)
+        self._views.release(page)
+        self._tabs_by_page.pop(page, None)
+        tab.page = None
+        # Pages the lifecycle policy had frozen or discarded are not brought back
+        tab.wake = tab.lifecycle == "active"
+        tab.lifecycle = "discarded"
+        self._dispose_queue.append(page)
+        if self.session_store and not (self.settings and self.settings.get('session_history') is False):
+            try:
+                self.session_store.put_tab(self.window_id, tab.id, history=tab.history, **self._session_record(tab))
+            except Exception as e:
+                print(f"Error saving tab history: {e}")
+        return True
+
+    def _schedule_wake(self):
+        """Reload the active group's hibernated tabs one at a time, visible rows first.
+
+        Only tabs whose page was Active when the group was left are woken,
+        and no more than the lifecycle manager's live-tab budget allows; the
+        rest stay placeholders that load when selected.
+        """
+        first, last = self.tabs_list.rows_in_view()
+        rows = [r for r in self.rows_in_group() if self.tabs[r].is_placeholder and self.tabs[r].wake]
+        rows.sort(key=lambda r: (not first <= r <= last, abs(r - max(0, self.active_index))))
+        live = sum(1 for t in self.tabs if t.page is not None and t.lifecycle != "discarded")
+        budget = max(0, self.lifecycle.limits()[2] - live)
+        for r in rows[budget:]:
+            self.tabs[r].wake = False
+        self._waking = [self.tabs[r] for r in rows[:budget]]
+        if self._waking:
+            self._wake_timer.start(GROUP_WAKE_INTERVAL_MS)
+        else:
+            self._wake_timer.stop()
+
+    def _wake_next(self):
+        while self._waking:
+            tab = self._waking.pop(0)
+            # Skip tabs closed, moved to another group or already loaded meanwhile
+            if self.tab_by_id(tab.id) is tab and tab.group == self.active_group and tab.is_placeholder:
+                tab.wake = False
+                self._load_queue.request(tab)
+                break
+        if not self._waking:
+            self._wake_timer.stop()
+
+    def _apply_group_filter(self, first: int = 0, last: Optional[int] = None):
+        """Hide the rows of tabs outside the active group (the "+ New Tab" row stays)"""
+        last = len(self.tabs) - 1 if last is None else min(last, len(self.tabs) - 1)
+        for row in range(first, last + 1):
+            self.tabs_list.setRowHidden(row, self.tabs[row].group != self.active_group)
+
+    def _groups_changed(self):
+        """Show the group list in the window's group bar"""
+        bar = getattr(self.main_window, 'group_bar', None) if self.main_window else None
+        if bar is not None:
+            bar.set_groups(self.groups, self.active_group)
+
+    # Moving tabs between windows: the page itself moves, so nothing reloads
+
+    def move_tab(self, index: int, target: "TabManager") -> Optional[Tab]:
+        """Move the tab at index into another window's tab manager"""
+        if target is self or index < 0 or index >= len(self.tabs):
+            return None
+        tab = self._tab_model.pop(index)
+        self._load_queue.cancel(tab)
+        if tab.page is not None:
+            self._views.release(tab.page)
+            self._detach_page(tab.page)
+        self._tabs_changed()
+        target.adopt_tab(tab)
+        if self.tabs:
+            self.set_active(self._neighbour_row(index, tab.group))
+        else:
+            try:
+                self.container.window().close()
+            except Exception:
+                pass
+        return tab
+
+    def move_tab_to_new_window(self, index: int):
+        """Open the tab at index alone in a new window, keeping its page, history and scroll state"""
+        if index < 0 or index >= len(self.tabs):
+            return
+        # Show the new window first: if this was the last tab, this window closes
+        # and must see another one open, or it would persist an empty section
+        window = self._new_window(home_tab=False)
+        window.show()
+        self.move_tab(index, window.tabman)
+
+    def adopt_tab(self, tab: Tab, activate: bool = True):
+        """Take over a tab (and its live page) detached from another window"""
+        tab.group = self.active_group  # Groups belong to a window
+        if tab.page is not None:
+            tab.page.setParent(self.container)
+            self._attach_page(tab.page)
+            self._bind_page(tab, tab.page)
+        self._tab_model.append(tab)
+        self._tabs_changed()
+        if activate:
+            self.set_active(self.row_of(tab))
+
+    def _detach_page(self, page: WebPage):
+        """Disconnect a page from this window before it moves to another one"""
+        for signal in (page.titleChanged, page.iconChanged, page.urlChanged, page.loadFinished,
+                       page.featurePermissionRequested, page.lifecycleStateChanged):
+            try:
+                signal.disconnect()
+            except (TypeError, RuntimeError):
+                pass  # nothing connected
+        self._page_updates.discard(page)
+        page.setParent(None)
+        page.tab_manager = None
+
+    def _window_manager(self):
+        return getattr(self.main_window, 'window_manager', None) if self.main_window else None
+
+    def _new_window(self, home_tab: bool = True):
+        """Another browser window on the app's shared services"""
+        manager = self._window_manager()
+        if manager is not None:
+            return manager.create(home_tab=home_tab)
+        from .main_window import MainWindow
+        return MainWindow(self.profile, self.settings, self.downloads, session_store=self.session_store,
+                          spare_pages=self.spare_pages, home_tab=home_tab)
+
+    def _other_windows(self) -> list:
+        """Other open browser windows, for "Move to Window" """
+        own = self.container.window()
+        manager = self._window_manager()
+        if manager is not None:
+            return manager.others(own)
+        return [w for w in QApplication.topLevelWidgets()
+                if w is not own and hasattr(w, 'tabman') and w.isVisible()]
+
+    def close(self):
+        """The window closed for good: stop saving the session and release every page.
+
+        Called after the window's section was removed from the session store,
+        so that late title/URL signals or the periodic history save cannot
+        write the tabs back.
+        """
+        self._closed = True
+        self.session_store = None
+        if self._active_save_timer is not None:
+            self._active_save_timer.stop()
+        self._page_updates.stop()
+        self._wake_timer.stop()
+        self.lifecycle.stop()
+        self._native.stop()
+        self._load_queue.cancel_many(self.tabs)
+        for tab in self.tabs:
+            if tab.page is not None:
+                self._views.release(tab.page)
+                self._tabs_by_page.pop(tab.page, None)
+                self._dispose_queue.append(tab.page)
+                tab.page = None
+        if self._dispose_queue:
+            QTimer.singleShot(0, self._dispose_some)
+
+    def _dispose_some(self):
+        """Delete a few closed pages per event-loop turn"""
+        for _ in range(min(DISPOSE_PER_TURN, len(self._dispose_queue))):
+            page = self._dispose_queue.pop()
+            try:
+                page.deleteLater()
+            except RuntimeError:
+                pass  # already deleted
+        if self._dispose_queue:
+            QTimer.singleShot(0, self._dispose_some)
+
+    # Closed tabs and duplicates come back with their whole back/forward list
+
+    def _tab_history(self, tab: Tab) -> Optional[bytes]:
+        """Serialized back/forward list of a web tab (saved one for placeholders)"""
+        if tab.page is None:
+            return tab.history
+        try:
+            return serialize_history(tab.page.history())
+        except Exception as e:
+            print(f"Error saving tab history: {e}")
+            return None
+
+    def _stash_closed(self, tab: Tab):
+        if tab.kind == "web":
+            self.closed_tabs.push("web", self._url_for_bar(tab), tab.title, self._tab_history(tab))
+        else:
+            self.closed_tabs.push(tab.kind, title=tab.title)
+
+    def _open_with_history(self, url: str, title: str, history: Optional[bytes]) -> Tab:
+        """Add an active web tab that restores history (falling back to url).
+
+        Restoring the list reloads its current entry as a history navigation,
+        which is answered from the HTTP cache when possible.
+        """
+        t = Tab(title=title or url, url=url, history=history, group=self.active_group)
+        self._tab_model.append(t)
+        self._tabs_changed()
+        self.set_active(self.row_of(t))
+        return t
+
+    def reopen_closed_tab(self):
+        """Bring back the most recently closed tab (Ctrl+Shift+T)"""
+        entry = self.closed_tabs.pop()
+        if entry is None:
+            return
+        if entry.kind == "web":
+            self._open_with_history(entry.url, entry.title, entry.history)
+        else:
+            self.create_tab_native(entry.kind, entry.title)
+
     def duplicate_tab(self, index: int):
         if index < 0 or index >= len(self.tabs):
             return
-        if self.tabs[index].view:
-            url = self.tabs[index].view.url().toString()
-            self.create_tab(url)
-            # URL bar is already updated in create_tab
+        tab = self.tabs[index]
+        if tab.kind == "web":
+            self._open_with_history(self._url_for_bar(tab), tab.title, self._tab_history(tab))
         else:
-            # Duplicate native tabs as a new home tab
-            self.create_tab_native(HomeWidget(self.settings, tab_manager=self), "Home")
+            # Native pages are shared, so a duplicate is just another tab of the same kind
+            self.create_tab_native(self.tabs[index].kind, self.tabs[index].title)
 
     def toggle_pin(self, index: int):
         if index < 0 or index >= len(self.tabs):
             return
         
         tab = self.tabs[index]
-        if tab.view:
+        if tab.page:
             # Get current page info
-            url = tab.view.url().toString()
-            title = tab.view.title() or "Untitled"
+            url = tab.page.url().toString()
+            title = tab.page.title() or "Untitled"
             
             # Get current pins
             pins = self.settings.get("pinned") or []
@@ -390,11 +1032,10 @@ class TabManager:
             self._refresh_home_widget()
     
     def _refresh_home_widget(self):
-        """Refresh the home widget to show updated pins"""
-        for tab in self.tabs:
-            if tab.widget and hasattr(tab.widget, '__class__') and 'HomeWidget' in tab.widget.__class__.__name__:
-                tab.widget._render_pins()
-                break
+        """Refresh the home widget to show updated pins (if it is built)"""
+        home = self._native.peek("home")
+        if home is not None:
+            home._render_pins()
 
     def navigate(self, kind: str):
         v = self.current_view()
@@ -418,54 +1059,30 @@ class TabManager:
         # internal routing
         if url.startswith("dark://"):
             host = url.replace("dark://", "").split("?")[0]
-            if host == "home":
-                # Check if Home tab already exists
+            if host in NATIVE_TITLES:
+                # Switch to an existing tab of that page, else open one
                 for i, tab in enumerate(self.tabs):
-                    if tab.widget and hasattr(tab.widget, '__class__') and 'HomeWidget' in tab.widget.__class__.__name__:
+                    if tab.kind == host:
                         self.set_active(i)
                         return
-                self.create_tab_native(HomeWidget(self.settings, tab_manager=self), "Home")
-                # Update URL bar for home page
-                self.url_edit.setText("dark://home")
-                return
-            if host == "settings":
-                # Check if Settings tab already exists
-                for i, tab in enumerate(self.tabs):
-                    if tab.widget and hasattr(tab.widget, '__class__') and 'SettingsWidget' in tab.widget.__class__.__name__:
-                        self.set_active(i)
-                        return
-                from .settings_widget import SettingsWidget
-                self.create_tab_native(SettingsWidget(self.settings, self.container.window()), "Settings")
-                # Update URL bar for settings page
-                self.url_edit.setText("dark://settings")
-                return
-            if host == "downloads":
-                # Check if Downloads tab already exists
-                for i, tab in enumerate(self.tabs):
-                    if tab.widget and hasattr(tab.widget, '__class__') and 'DownloadsWidget' in tab.widget.__class__.__name__:
-                        self.set_active(i)
-                        return
-                from .downloads_widget import DownloadsWidget
-                self.create_tab_native(DownloadsWidget(self.downloads), "Descargas")
-                # Update URL bar for downloads page
-                self.url_edit.setText("dark://downloads")
+                self.create_tab_native(host, NATIVE_TITLES[host])
+                # Update URL bar for the internal page
+                self.url_edit.setText(f"dark://{host}")
                 return
             return
         
         # Smart tab management: decide whether to use current tab or create new one
         current_tab = self.tabs[self.active_index] if 0 <= self.active_index < len(self.tabs) else None
         
-        if current_tab and current_tab.widget and not current_tab.view:
+        if current_tab and current_tab.kind in NATIVE_TITLES:
             # Current tab is native - check if we should convert it or create new
-            class_name = current_tab.widget.__class__.__name__
-            
             # Convert Home tab to web tab if it's the first navigation (common pattern)
-            if 'HomeWidget' in class_name:
+            if current_tab.kind == "home":
                 self._convert_current_to_web(url)
                 return
             
             # For Settings and Downloads, always create new tab to preserve functionality
-            if 'SettingsWidget' in class_name or 'DownloadsWidget' in class_name:
+            if current_tab.kind in ("settings", "downloads"):
                 self.create_tab(url)
                 self.set_active(len(self.tabs) - 1)
                 # Update URL bar immediately since create_tab won't do it for existing tabs
@@ -497,39 +1114,27 @@ class TabManager:
         self.tabs_list.blockSignals(True)
         
         try:
-            # Remove native widget from stack if present
-            if tab.widget:
-                try:
-                    self.stack.removeWidget(tab.widget)
-                    tab.widget.hide()
-                    # Set parent to None to ensure proper cleanup
-                    tab.widget.setParent(None)
-                except Exception:
-                    pass
-            
-            # Create web view
-            view = QWebEngineView(self.container)
-            page = WebPage(self.profile, view)
-            view.setPage(page)
-            # Set view reference in page for createWindow to access
-            page.view = view
+            # The shared Home widget stays in the native page cache
+            # Create the page
+            page = self._new_page()
             
             # Update tab to be web tab
-            tab.view = view
-            tab.widget = None
+            self._bind_page(tab, page)
+            tab.kind = "web"
             tab.title = "Loading..."
-            
-            # Attach view and load URL
-            self._attach_view(view)
+            self._set_tab_url(tab, url)
+            # Same tab id, new type: rewrite its record
+            self._persisted_ids.discard(tab.id)
             
             # Load URL immediately after attachment
-            view.load(QUrl(url))
+            page.load(QUrl(url))
             # Update URL bar immediately
             self.url_edit.setText(url)
             
             # Update UI
-            self._rebuild_list()
-            # Show the new view immediately
+            self._tab_model.refresh(self.active_index)
+            self._tabs_changed()
+            # Show the new page immediately
             self._show_only(self.active_index)
             
         finally:
@@ -537,8 +1142,10 @@ class TabManager:
             self.tabs_list.blockSignals(False)
 
     def current_view(self) -> Optional[QWebEngineView]:
+        """The pool view showing the active tab's page"""
         if 0 <= self.active_index < len(self.tabs):
-            return self.tabs[self.active_index].view
+            page = self.tabs[self.active_index].page
+            return self._views.view_for(page) if page is not None else None
         return None
 
     def _web_context_menu(self, pos, view):
@@ -691,54 +1298,9 @@ class TabManager:
     
     def _open_link_in_new_window(self, link_url: str):
         """Open link in new window"""
-        # Reuse the new window creation logic from context menu
-        from .main_window import MainWindow
-        from PyQt6.QtWebEngineCore import QWebEngineProfile
-        from ..core.downloads import DownloadsManager
-        from ..core.scheme import register_dark_scheme, DarkUrlSchemeHandler
-        from pathlib import Path
-        
-        # Use the SAME profile for shared cookies and sessions
-        new_profile = self.profile
-        
-        # Create new downloads manager
-        new_downloads = DownloadsManager(new_profile)
-        
-        # Create scheme handler
-        pages_dir = Path(__file__).parent.parent / "pages"
-        pages_dir.mkdir(parents=True, exist_ok=True)
-        new_scheme_handler = DarkUrlSchemeHandler(
-            pages_dir,
-            downloads_provider=new_downloads.list,
-            settings_provider=self.settings.all if self.settings else {},
-            settings_actions=lambda action, value: None,
-            downloads_actions=new_downloads.action,
-        )
-        new_profile.setUrlSchemeHandler("dark", new_scheme_handler)
-        
-        # Create new window with shared profile
-        new_window = MainWindow(new_profile, self.settings, new_downloads)
-        new_window.tabman.create_tab(link_url)
-        new_window.show()
-        
-        # Clear all default tabs and create only the specific tab
-        new_window.tabman.tabs.clear()
-        new_window.tabman.tabs_list.clear()
-        
-        # Clear the content stack properly
-        while new_window.tabman.stack.count() > 0:
-            widget = new_window.tabman.stack.widget(0)
-            new_window.tabman.stack.removeWidget(widget)
-            widget.deleteLater()
-        
-        # Create the specific tab for the new window
-        new_window.tabman.create_tab(link_url)
-        
-        # Ensure the window is fully initialized before showing
-        new_window.show()
-        # Force a reload after a short delay to ensure page loads
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(100, lambda: new_window.tabman.current_view().reload() if new_window.tabman.current_view() else None)
+        window = self._new_window(home_tab=False)
+        window.tabman.create_tab(link_url)
+        window.show()
     
     def _download_link(self, link_url: str):
         """Download link using download system"""
@@ -768,74 +1330,69 @@ class TabManager:
         except Exception as e:
             print(f"Error downloading link: {e}")
 
-    def _sync_title(self, title: str, view=None):
-        """Sync title from web view to tab"""
-        try:
-            # Use provided view or try to get sender
-            sender_view = view
-            if not sender_view:
-                try:
-                    sender_view = self.sender()
-                except AttributeError:
-                    return
-            
-            if not sender_view:
-                return
-            
-            # Find which tab this view belongs to and update its title
-            for i, tab in enumerate(self.tabs):
-                if tab.view and tab.view == sender_view:
-                    # Update stored title
-                    tab.title = title or "New Tab"
-                    # Update the tab item widget
-                    self._update_tab_title(i, tab.title)
-                    break
-        except Exception as e:
-            print(f"Error syncing title: {e}")
-            pass
+    def _apply_page_updates(self, dirty: dict):
+        """Bring the tabs of the pages that changed during the last frame up to date"""
+        changed = []
+        for page, flags in dirty.items():
+            tab = self.tab_for_page(page)
+            if tab is None:
+                continue  # Closed, hibernated or moved to another window since
+            try:
+                if flags & (TITLE | URL):
+                    url = page.url().toString() if flags & URL else ""
+                    if url:
+                        self._set_tab_url(tab, url)
+                    tab.title = page.title() or "New Tab"
+                    self._index_search(tab)
+                    # Repaints the title and the favorite star of the row
+                    self._tab_model.refresh(self.row_of(tab))
+                    changed.append(tab)
+            except RuntimeError:
+                continue  # page already deleted
+            if flags & ICON and not flags & (TITLE | URL):
+                # Only the favicon changed; a title/URL refresh above repainted the whole row
+                self._tab_model.refresh(self.row_of(tab), [Qt.ItemDataRole.DecorationRole])
+            if flags & LOADED:
+                self._on_load_finished(page)
+        if changed:
+            if self.session_store:
+                self._persist_tabs(changed)
+            else:
+                self._save_session_immediately()
+
+    def _is_favorite_url(self, url: str) -> bool:
+        if not self.main_window or not url or not hasattr(self.main_window, 'is_favorite'):
+            return False
+        return self.main_window.is_favorite(url)
+
+    def refresh_tabs_for_url(self, url: str):
+        """Repaint the rows of the tabs showing url (after a favorite changed)"""
+        for tab in self.tabs_for_url(url):
+            self._tab_model.refresh(self.row_of(tab))
+
+    def _toggle_tab_favorite(self, index: int):
+        """Star button of a tab row: add the tab's page to favorites or remove it"""
+        if not (0 <= index < len(self.tabs)) or not self.main_window:
+            return
+        tab = self.tabs[index]
+        if tab.kind != "web" or not tab.url:
+            return
+        if self._is_favorite_url(tab.url):
+            self.main_window.remove_favorite(tab.url)
+        else:
+            self.main_window.add_favorite(tab.url, tab.title)
 
     def _update_all_tabs_favorite_status(self):
         """Update favorite status for all tabs"""
-        for i in range(len(self.tabs)):
-            self._update_tab_favorite_status(i)
+        self._tab_model.refresh_all()
 
     def _update_tab_favorite_status(self, index: int):
         """Update favorite status for a specific tab"""
-        if index < 0 or index >= self.tabs_list.count() - 1:  # -1 for the + New Tab item
-            return
-        
-        item = self.tabs_list.item(index)
-        widget = self.tabs_list.itemWidget(item)
-        if widget and hasattr(widget, 'set_favorite_status') and self.main_window:
-            tab = self.tabs[index] if index < len(self.tabs) else None
-            if tab and tab.view:
-                url = tab.view.url().toString()
-                # Check if this URL is in favorites
-                is_fav = any(url == fav_url for fav_url, _ in self.main_window.favorites)
-                widget.set_favorite_status(is_fav)
-                # Also update the URL
-                if hasattr(widget, 'set_url'):
-                    widget.set_url(url)
+        self._tab_model.refresh(index)
 
     def _update_tab_title(self, index: int, title: str):
-        """Update only a specific tab's title without rebuilding the entire list"""
-        if index < 0 or index >= self.tabs_list.count() - 1:  # -1 for the + New Tab item
-            return
-        
-        item = self.tabs_list.item(index)
-        widget = self.tabs_list.itemWidget(item)
-        if widget and hasattr(widget, 'set_title'):
-            widget.set_title(title)
-            
-            # Update URL and favorite status for web tabs
-            if index < len(self.tabs):
-                tab = self.tabs[index]
-                if tab.view and hasattr(widget, 'set_url'):
-                    widget.set_url(tab.view.url().toString())
-                    if hasattr(widget, 'set_favorite_status') and self.main_window:
-                        url = tab.view.url().toString()
-                        is_fav = any(url == fav_url for fav_url, _ in self.main_window.favorites)
-                        widget.set_favorite_status(is_fav)
+        """Update only a specific tab's row without touching the rest of the list"""
+        self._tab_model.refresh(index)
 
     def _refresh_tabs_ui(self):
         # Setup context menu for tabs list (once)
@@ -845,233 +1402,175 @@ class TabManager:
             self._ctx_init = True
 
     def _open_ctx_menu(self, pos):
-        idx = self.tabs_list.currentRow()
-        if idx < 0 or idx == self.tabs_list.count()-1:
+        idx = self.tabs_list.indexAt(pos).row()
+        if idx < 0 or idx >= len(self.tabs):
             return
         m = QMenu(self.tabs_list)
         a_close = m.addAction("Close Tab")
+        a_close_others = m.addAction("Close Others")
+        a_close_right = m.addAction("Close Tabs to the Right")
+        a_close_dups = m.addAction("Close Duplicate Tabs")
+        a_close_all = m.addAction("Close All")
+        m.addSeparator()
         a_dup = m.addAction("Duplicate Tab")
         a_pin = m.addAction("Pin/Unpin")
         a_newwin = m.addAction("Open in New Window")
-        act = m.exec(self.tabs_list.mapToGlobal(pos))
+        group_menu = m.addMenu("Move to Group")
+        group_targets = {}
+        for name in self.groups:
+            if name != self.tabs[idx].group:
+                group_targets[group_menu.addAction(name or "Default")] = name
+        a_new_group = group_menu.addAction("New Group...")
+        targets = {}
+        others = self._other_windows()
+        if others:
+            move_menu = m.addMenu("Move to Window")
+            for w in others:
+                tm = w.tabman
+                active = tm.tabs[tm.active_index] if 0 <= tm.active_index < len(tm.tabs) else None
+                label = f"{active.title if active else 'Window'} ({len(tm.tabs)} tabs)"
+                targets[move_menu.addAction(label)] = tm
+        act = m.exec(self.tabs_list.viewport().mapToGlobal(pos))
         if act == a_close:
             self.close_tab(idx)
+        elif act == a_close_others:
+            self.close_other_tabs(idx)
+        elif act == a_close_right:
+            self.close_tabs_to_right(idx)
+        elif act == a_close_dups:
+            self.close_duplicate_tabs()
+        elif act == a_close_all:
+            self.close_all_tabs()
         elif act == a_dup:
             self.duplicate_tab(idx)
         elif act == a_pin:
             self.toggle_pin(idx)
         elif act == a_newwin:
-            url = (self.tabs[idx].view.url().toString() if self.tabs[idx].view else "dark://home")
-            # Create new window instance with proper arguments
-            from .main_window import MainWindow
-            from PyQt6.QtWebEngineCore import QWebEngineProfile
-            from ..core.downloads import DownloadsManager
-            from ..core.scheme import register_dark_scheme, DarkUrlSchemeHandler
-            from pathlib import Path
-            
-            # Use the SAME profile for shared cookies and sessions
-            new_profile = self.profile
-            
-            # Ensure profile has proper configuration
-            from PyQt6.QtCore import QStandardPaths
-            from pathlib import Path
-            data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)) / "Dark Browser"
-            data_dir.mkdir(parents=True, exist_ok=True)
-            new_profile.setCachePath(str(data_dir / "cache"))
-            new_profile.setPersistentStoragePath(str(data_dir / "storage"))
-            
-            # Register custom scheme for new window (check if already registered)
-            try:
-                register_dark_scheme()
-            except:
-                pass  # Already registered
-            
-            new_downloads = DownloadsManager(new_profile)
-            pages_dir = Path(__file__).parent.parent / "pages"
-            pages_dir.mkdir(parents=True, exist_ok=True)
-            scheme_handler = DarkUrlSchemeHandler(
-                pages_dir,
-                downloads_provider=new_downloads.list,
-                settings_provider=self.settings.all,
-                settings_actions=lambda k, v: None,
-                downloads_actions=new_downloads.action,
-            )
-            new_profile.installUrlSchemeHandler(b"dark", scheme_handler)
-            
-            new_window = MainWindow(new_profile, self.settings, new_downloads)
-            
-            # Clear all default tabs and create only the specific tab
-            new_window.tabman.tabs.clear()
-            new_window.tabman.tabs_list.clear()
-            
-            # Clear the content stack properly
-            while new_window.tabman.stack.count() > 0:
-                widget = new_window.tabman.stack.widget(0)
-                new_window.tabman.stack.removeWidget(widget)
-                widget.deleteLater()
-            
-            # Create the specific tab for the new window
-            new_window.tabman.create_tab(url)
-            
-            # Ensure the window is fully initialized before showing
-            new_window.show()
-            # Force a reload after a short delay to ensure page loads
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(100, lambda: new_window.tabman.current_view().reload() if new_window.tabman.current_view() else None)
-
-    def _rebuild_list(self):
-        self.tabs_list.clear()
-        from pathlib import Path
-        close_path = str((Path(__file__).parent.parent / 'resources' / 'icons' / 'close.svg').resolve())
-        for i, t in enumerate(self.tabs):
-            item = QListWidgetItem()
-            self.tabs_list.addItem(item)
-            # Get title safely - use stored title first, then try view title
-            title = t.title or "New Tab"
-            if t.view and not t.title:
-                try:
-                    view_title = t.view.title()
-                    title = view_title or "Loading..."
-                except Exception:
-                    title = "Loading..."
-            w = TabItemWidget(title, None, close_path, is_web_tab=bool(t.view))
-            # capture index by default arg
-            w.close_btn.clicked.connect(lambda _=False, idx=i: self.close_tab(idx))
-            # Set main_window reference
-            if hasattr(self, 'main_window'):
-                w.main_window = self.main_window
-            # Set URL and favorite status for web tabs
-            if t.view and hasattr(w, 'set_url'):
-                w.set_url(t.view.url().toString())
-                if hasattr(w, 'set_favorite_status') and self.main_window:
-                    url = t.view.url().toString()
-                    is_fav = any(url == fav_url for fav_url, _ in self.main_window.favorites)
-                    w.set_favorite_status(is_fav)
-            self.tabs_list.setItemWidget(item, w)
-        # plus item
-        plus = QListWidgetItem()
-        plus_widget = QWidget()
-        plus_widget.setObjectName("TabItem")
-        plus_widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        plus_layout = QHBoxLayout(plus_widget)
-        plus_layout.setContentsMargins(8, 6, 8, 8)
-        plus_layout.setSpacing(6)
-        
-        plus_label = QLabel("+ New Tab")
-        plus_label.setStyleSheet("background: transparent; color: #9ca3af; font-size: 13px;")
-        plus_layout.addWidget(plus_label, 1)
-        
-        self.tabs_list.addItem(plus)
-        self.tabs_list.setItemWidget(plus, plus_widget)
+            # The page moves with the tab: no reload, history and page state are kept
+            self.move_tab_to_new_window(idx)
+        elif act in group_targets:
+            self.move_to_group(idx, group_targets[act])
+        elif act == a_new_group:
+            from PyQt6.QtWidgets import QInputDialog
+            name, ok = QInputDialog.getText(self.tabs_list, "New Tab Group", "Name:")
+            if ok and name.strip():
+                self.move_to_group(idx, name.strip())
+        elif act in targets:
+            self.move_tab(idx, targets[act])
+            targets[act].container.window().activateWindow()
+
+    def _tabs_changed(self):
+        """Tabs were added, removed or changed type: the strip already has the rows, save the session"""
+        self._persist_structure()
 
     # Session export
     def export_session(self) -> dict:
         tabs = []
         for t in self.tabs:
-            if t.view:
+            if t.page:
                 tabs.append({ 
                     'type': 'web', 
-                    'url': t.view.url().toString(),
-                    'title': t.title or t.view.title() or "New Tab"
+                    'url': t.page.url().toString() or t.url,
+                    'title': t.title or t.page.title() or "New Tab",
+                    'group': t.group
                 })
+            elif t.is_placeholder:
+                tabs.append({ 'type': 'web', 'url': t.url, 'title': t.title or t.url, 'group': t.group })
             else:
-                # Check widget class to determine type accurately
-                widget = t.widget
-                if widget and hasattr(widget, '__class__'):
-                    class_name = widget.__class__.__name__
-                    if 'SettingsWidget' in class_name:
-                        tabs.append({ 'type': 'settings', 'title': t.title or 'Settings' })
-                    elif 'DownloadsWidget' in class_name:
-                        tabs.append({ 'type': 'downloads', 'title': t.title or 'Descargas' })
-                    elif 'HomeWidget' in class_name:
-                        tabs.append({ 'type': 'home', 'title': t.title or 'Home' })
-                    else:
-                        # Fallback to title-based detection
-                        title = (t.title or '').lower()
-                        if 'settings' in title:
-                            tabs.append({ 'type': 'settings', 'title': 'Settings' })
-                        elif 'descarga' in title or 'download' in title:
-                            tabs.append({ 'type': 'downloads', 'title': 'Descargas' })
-                        else:
-                            tabs.append({ 'type': 'home', 'title': 'Home' })
-                else:
-                    # Fallback if no widget
-                    title = (t.title or '').lower()
-                    if 'settings' in title:
-                        tabs.append({ 'type': 'settings', 'title': 'Settings' })
-                    elif 'descarga' in title or 'download' in title:
-                        tabs.append({ 'type': 'downloads', 'title': 'Descargas' })
-                    else:
-                        tabs.append({ 'type': 'home', 'title': 'Home' })
+                kind = t.kind if t.kind in NATIVE_TITLES else 'home'
+                tabs.append({ 'type': kind, 'title': t.title or NATIVE_TITLES[kind], 'group': t.group })
         return { 'tabs': tabs, 'active': max(0, self.active_index) }
 
-    def _on_url_changed(self, url, view=None):
-        """Handle URL changes - update favorite status when URL changes"""
-        try:
-            if url and url.toString():
-                # Use provided view or try to get sender
-                sender_view = view
-                if not sender_view:
-                    try:
-                        sender_view = self.sender()
-                    except AttributeError:
-                        return
-                
-                if not sender_view:
-                    return
-                
-                # Update favorite status for the tab that changed URL
-                for i, tab in enumerate(self.tabs):
-                    if tab.view and tab.view == sender_view:
-                        # Update tab title when URL changes
-                        tab.title = sender_view.title() or "New Tab"
-                        self._update_tab_favorite_status(i)
-                        break
-                        
-                # Save session immediately when URL changes
-                self._save_session_immediately()
-        except Exception:
-            pass
-
     def _save_session_immediately(self):
         """Save session immediately when active tab changes"""
+        if self._closed:
+            return
+        if self.session_store:
+            self._persist_active()
+            return
         if self.settings:
             try:
                 sess = self.export_session()
                 #print(f"DEBUG: Saving session with {len(sess.get('tabs', []))} tabs, active index: {self.active_index}")
-                self.settings.set('session', sess.get('tabs', []))
-                self.settings.set('session_active', self.active_index if self.active_index >= 0 else 0)
+                with self.settings.batch():
+                    self.settings.set('session', sess.get('tabs', []))
+                    self.settings.set('session_active', self.active_index if self.active_index >= 0 else 0)
                 #print(f"DEBUG: Session saved successfully")
             except Exception as e:
                 print(f"DEBUG: Error saving session: {e}")
                 pass
 
-    def _prewarm_qwebengine(self):
-        """Pre-warm QWebEngine with a lightweight page to prevent first-search restart"""
+    def _session_record(self, tab: Tab) -> dict:
+        """Fields stored for one tab in the session store"""
+        if tab.kind == "web":
+            url = tab.page.url().toString() if tab.page else ""
+            return {'kind': 'web', 'url': url or tab.url, 'title': tab.title or tab.url, 'group': tab.group}
+        return {'kind': tab.kind, 'url': '', 'title': tab.title, 'group': tab.group}
+
+    def _persist_tab(self, tab: Tab):
+        """Write the record of a single tab (one small row per navigation)"""
+        if not self.session_store or self._restoring_session:
+            return
         try:
-            # Create a minimal web view in the background
-            from PyQt6.QtWebEngineWidgets import QWebEngineView
-            from PyQt6.QtCore import QUrl, QTimer
-            
-            # Create a hidden web view for pre-warming
-            prewarm_view = QWebEngineView()
-            prewarm_view.setParent(self.container)
-            prewarm_view.hide()  # Keep it hidden
-            
-            # Load a lightweight page (about:blank is perfect)
-            prewarm_view.load(QUrl("about:blank"))
-            
-            # Clean up after a short delay to free resources
-            def cleanup():
-                try:
-                    prewarm_view.setParent(None)
-                    prewarm_view.deleteLater()
-                except:
-                    pass
-            
-            QTimer.singleShot(2000, cleanup)  # Clean up after 2 seconds
-            
+            position = None
+            if tab.id not in self._persisted_ids:
+                position = max(0, self.row_of(tab))
+            self.session_store.put_tab(self.window_id, tab.id, position=position, **self._session_record(tab))
+            self._persisted_ids.add(tab.id)
         except Exception as e:
-            # If pre-warming fails, continue normally
-            print(f"Warning: QWebEngine pre-warming failed: {e}")
-            pass
+            print(f"Error saving tab: {e}")
+
+    def _persist_tabs(self, tabs: List[Tab]):
+        """Write the records of several tabs in one transaction"""
+        if not self.session_store or self._restoring_session:
+            return
+        records = {}
+        for tab in tabs:
+            fields = self._session_record(tab)
+            if tab.id not in self._persisted_ids:
+                fields['position'] = max(0, self.row_of(tab))
+            records[tab.id] = fields
+        try:
+            self.session_store.put_tabs(self.window_id, records)
+            self._persisted_ids.update(records)
+        except Exception as e:
+            print(f"Error saving tabs: {e}")
+
+    def _persist_structure(self):
+        """Write new tabs, tab order and the active tab after tabs were added or removed"""
+        if not self.session_store or self._restoring_session:
+            return
+        try:
+            for i, tab in enumerate(self.tabs):
+                if tab.id not in self._persisted_ids:
+                    self.session_store.put_tab(self.window_id, tab.id, position=i, **self._session_record(tab))
+                    self._persisted_ids.add(tab.id)
+            self.session_store.set_order(self.window_id, [t.id for t in self.tabs])
+            self._persisted_ids = {t.id for t in self.tabs}
+        except Exception as e:
+            print(f"Error saving session: {e}")
+        self._persist_active()
+
+    def _persist_active(self):
+        if not self.session_store or self._restoring_session:
+            return
+        if 0 <= self.active_index < len(self.tabs):
+            try:
+                self.session_store.put_window(self.window_id, active_tab=self.tabs[self.active_index].id,
+                                              active_group=self.active_group, groups=self.groups)
+            except Exception as e:
+                print(f"Error saving active tab: {e}")
+
+    def persist_histories(self):
+        """Store the serialized back/forward list of every loaded web tab"""
+        if not self.session_store or (self.settings and self.settings.get('session_history') is False):
+            return
+        for tab in self.tabs:
+            if not tab.page:
+                continue
+            try:
+                data = serialize_history(tab.page.history())
+                self.session_store.put_tab(self.window_id, tab.id, history=data, **self._session_record(tab))
+            except Exception as e:
+                print(f"Error saving tab history: {e}")
+
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+# Views kept per window; more than one lets a quick back-and-forth switch skip setPage
+VIEW_POOL_SIZE = 2
+
+
+class ViewPool:
+    """A few QWebEngineViews shared by all web tabs of a window.
+
+    Tabs own their WebPage; showing a tab puts its page into one of these
+    views with ``setPage``. A page already sitting in a view is shown as is,
+    otherwise the least recently used view is recycled. Pages must not be
+    children of a view, since ``setPage`` deletes a replaced page the view
+    owns.
+    """
+
+    def __init__(self, create_view: Callable[[], QWebEngineView], size: int = VIEW_POOL_SIZE) -> None:
+        self._create_view = create_view
+        self.size = max(1, int(size))
+        self._views: List[QWebEngineView] = []  # least recently used first
+        self._page_of: Dict[QWebEngineView, object] = {}
+        self._view_of: Dict[object, QWebEngineView] = {}
+
+    def show(self, page) -> QWebEngineView:
+        """A view displaying page, recycling the least recently used one if needed"""
+        view = self._view_of.get(page)
+        if view is None:
+            # A free view first, then a new one while under size, then the LRU one
+            view = next((v for v in self._views if v not in self._page_of), None)
+            if view is None and len(self._views) < self.size:
+                view = self._create_view()
+                self._views.append(view)
+            elif view is None:
+                view = self._views[0]
+                self._view_of.pop(self._page_of.pop(view), None)
+            view.setPage(page)
+            self._page_of[view] = page
+            self._view_of[page] = view
+        self._views.remove(view)
+        self._views.append(view)
+        return view
+
+    def view_for(self, page) -> Optional[QWebEngineView]:
+        """The view currently displaying page, if any"""
+        return self._view_of.get(page)
+
+    def page_in(self, view) -> Optional[object]:
+        """The page a pool view is displaying (without creating a default one)"""
+        return self._page_of.get(view)
+
+    def release(self, page):
+        """page is going away: free its view for the next tab"""
+        view = self._view_of.pop(page, None)
+        if view is not None:
+            self._page_of.pop(view, None)
+            self._views.remove(view)
+            self._views.insert(0, view)
+
+    def views(self) -> List[QWebEngineView]:
+        return list(self._views)
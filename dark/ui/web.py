@@ -34,21 +34,12 @@ class WebPage(QWebEnginePage):
     
     def createWindow(self, window_type):
         """Handle popup windows and new window requests"""
-        # Get the view that created this window
-        if hasattr(self, 'view') and self.view:
-            view = self.view
-            # Find the MainWindow through the view's parent hierarchy
-            parent = view.parent()
-            while parent:
-                # Check if this is MainWindow (has tabman attribute)
-                if hasattr(parent, 'tabman') and hasattr(parent.tabman, 'create_tab'):
-                    # Found the MainWindow with tab manager
-                    tab_manager = parent.tabman
-                    # Create new tab for popup
-                    tab_manager.create_tab("about:blank")
-                    # Return the new view's PAGE, not the view itself
-                    return tab_manager.tabs[-1].view.page()
-                parent = parent.parent()
+        # The tab manager owning this page opens the popup as a new tab
+        tab_manager = getattr(self, 'tab_manager', None)
+        if tab_manager is not None and hasattr(tab_manager, 'create_tab'):
+            tab = tab_manager.create_tab("about:blank")
+            # Return the new tab's page; it is shown through the window's view pool
+            return tab.page
         return None
     
     def acceptNavigationRequest(self, url, type, isMainFrame):
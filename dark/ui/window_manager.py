@@ -0,0 +1,107 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+from PyQt6.QtWidgets import QApplication
+from ..core.metrics import LatencyHistogram
+
+
+@dataclass
+class Services:
+    """The app-wide objects every window shares (exactly one of each per app)"""
+    settings: object
+    session_store: object
+    profile: object
+    downloads: object
+    scheme_handler: object
+    spare_pages: object
+
+
+class WindowManager:
+    """Creates browser windows against one set of shared Services.
+
+    A new window only builds its own widgets and tab manager; the profile,
+    downloads manager, dark:// scheme handler, settings, session store and
+    spare page pool are reused. Creation time of every window is recorded in
+    ``creation_latency``. In the multi-process mode (``coordinator`` set) new
+    windows are separate processes started by the WindowCoordinator.
+    """
+
+    def __init__(self, services: Services, coordinator=None) -> None:
+        self.services = services
+        self.coordinator = coordinator
+        self.windows: List = []
+        self.creation_latency = LatencyHistogram("window creation", bounds_ms=(5, 10, 20, 40, 80, 160, 320, 640))
+
+    def create(self, window_id: Optional[str] = None, startup=None, home_tab: bool = True):
+        """Build (but do not show) a window; window_id restores its saved section.
+
+        With home_tab False a new window starts without tabs; the caller adds
+        the first one before showing it.
+        """
+        from .main_window import MainWindow
+        s = self.services
+        with self.creation_latency.time():
+            window = MainWindow(s.profile, s.settings, s.downloads, startup=startup, session_store=s.session_store,
+                                window_id=window_id, spare_pages=s.spare_pages, window_manager=self,
+                                home_tab=home_tab)
+        self.windows.append(window)
+        return window
+
+    def open(self, urls: Optional[Iterable[str]] = None):
+        """Open and raise a new window, optionally with the given URLs instead of Home"""
+        urls = list(urls or [])
+        if self.coordinator is not None:
+            self.coordinator.notify("windows.open", urls)
+            return None
+        window = self.create(home_tab=not urls)
+        if urls:
+            window.tabman.open_urls(urls)
+        window.show()
+        self.raise_window(window)
+        return window
+
+    def alive(self) -> List:
+        """Open windows (closed or deleted ones are forgotten)"""
+        alive = []
+        for window in self.windows:
+            try:
+                if window.isVisible():
+                    alive.append(window)
+            except RuntimeError:
+                pass  # window already deleted
+        self.windows = alive or self.windows
+        return alive
+
+    def forget(self, window):
+        """window closed for good; it is no longer a target or saved"""
+        self.windows = [w for w in self.windows if w is not window]
+
+    def others(self, window) -> List:
+        """Other windows of this process"""
+        return [w for w in self.alive() if w is not window]
+
+    def others_open(self, window) -> bool:
+        """True when another browser window is open, in this process or another one"""
+        if self.others(window):
+            return True
+        if self.coordinator is not None:
+            try:
+                return bool(self.coordinator.call("windows.others"))
+            except ConnectionError:
+                return False
+        return False
+
+    def target(self):
+        """The window forwarded URLs go to: the active one, else the last one shown"""
+        alive = self.alive()
+        active = QApplication.activeWindow()
+        if active in alive:
+            return active
+        return alive[-1] if alive else None
+
+    @staticmethod
+    def raise_window(window):
+        if window.isMinimized():
+            window.showNormal()
+        window.raise_()
+        window.activateWindow()
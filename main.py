@@ -1,29 +1,88 @@
 import sys, traceback, os
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QCoreApplication
-from dark.app import DarkApp
+
+
+def parse_args(argv):
+    """Split the command line into URLs and launch options"""
+    from PyQt6.QtCore import QUrl
+    urls, new_window = [], False
+    options = {"multi_instance": False, "multi_process": False, "window_process": None, "coordinator": None}
+    for arg in argv[1:]:
+        if arg == "--new-window":
+            new_window = True
+        elif arg == "--multi-instance":
+            options["multi_instance"] = True
+        elif arg == "--multi-process":
+            # One process per window, coordinated by this one
+            options["multi_process"] = True
+        elif arg.startswith("--window-process="):
+            options["window_process"] = arg.split("=", 1)[1]
+        elif arg.startswith("--coordinator="):
+            options["coordinator"] = arg.split("=", 1)[1]
+        elif arg.startswith("-"):
+            continue  # Qt/Chromium switches
+        else:
+            # Resolve relative file paths here; the running instance has another cwd
+            url = QUrl.fromUserInput(arg, os.getcwd(), QUrl.UserInputResolutionOption.AssumeLocalFile)
+            if url.isValid():
+                urls.append(url.toString())
+    return {"urls": urls, "new_window": new_window}, options
+
+
+def run_coordinator(app, message, instance):
+    """Parent of the multi-process mode: owns settings and sessions, spawns window processes"""
+    from dark.core.coordinator import WindowCoordinator
+    from dark.core.settings import Settings
+    from dark.core.session import SessionStore
+    session_store = SessionStore()
+    coordinator = WindowCoordinator(Settings(), session_store)
+    if not coordinator.start(message["urls"]):
+        sys.exit(1)
+    # No windows here; the coordinator quits when its last window process exits
+    app.setQuitOnLastWindowClosed(False)
+    if instance is not None:
+        instance.message_received.connect(coordinator.handle_message)
+        instance.ready()
+    app.aboutToQuit.connect(coordinator.close)
+    app.aboutToQuit.connect(session_store.close)
+    sys.exit(app.exec())
+
+
+def create_window_process_app(window_id, coordinator_name):
+    """DarkApp of one window process, using the coordinator's settings and session store"""
+    from dark.app import DarkApp
+    from dark.core.coordinator import CoordinatorClient, RemoteSettings, RemoteSessionStore, profile_dir
+    client = CoordinatorClient(coordinator_name, window_id)
+    return DarkApp(settings=RemoteSettings(client), session_store=RemoteSessionStore(client),
+                   profile_path=profile_dir(window_id), window_ids=[window_id], coordinator=client)
+
 
 def main():
     QCoreApplication.setApplicationName("Dark Browser")
     QCoreApplication.setOrganizationName("ZtaMDev")
     os.environ.setdefault("QT_LOGGING_RULES", "*.debug=false;qt.qpa.*=false;qt.core.plugin.*=false;qt.webengine.*=false")
     
-    # Initialize QWebEngine BEFORE creating QApplication
-    try:
-        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
-        from PyQt6.QtWebEngineWidgets import QWebEngineView
-        print("QWebEngine initialized successfully")
-        
-        # Wait for QWebEngine to fully warm up
-        import time
-        print("Warming up QWebEngine...")
-        time.sleep(0.5)  # 500ms warmup
-    except Exception as e:
-        print(f"Warning: QWebEngine initialization failed: {e}")
-        traceback.print_exc()
-        pass
+    # QWebEngine needs shared GL contexts set BEFORE creating QApplication;
+    # the module itself is only imported once this process is the browser
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     
     app = QApplication(sys.argv)
+    message, options = parse_args(app.arguments())
+    window_process = options["window_process"] and options["coordinator"]
+
+    # Hand the launch over to a browser that is already running
+    instance = None
+    if not options["multi_instance"] and not window_process:
+        from dark.core.single_instance import SingleInstance
+        instance = SingleInstance()
+        if instance.send(message):
+            sys.exit(0)
+        # Become the running instance right away; launches during startup are queued.
+        # A launch started at the same moment may have become it first.
+        if not instance.listen() and instance.send(message):
+            sys.exit(0)
+        app.aboutToQuit.connect(instance.close)
     
     # Configure application for 2FA compatibility
     app.setQuitOnLastWindowClosed(True)
@@ -33,6 +92,19 @@ def main():
     app.setApplicationVersion("1.0.1")
     app.setOrganizationName("Dark Browser")
     app.setOrganizationDomain("darkbrowser.local")
+
+    # Multi-process mode: this process only coordinates (after the app names, they pick the data dir)
+    if options["multi_process"] and not window_process:
+        run_coordinator(app, message, instance)
+
+    try:
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        print("QWebEngine initialized successfully")
+        # Renderer warmup happens later in TabManager and ends on loadFinished
+    except Exception as e:
+        print(f"Warning: QWebEngine initialization failed: {e}")
+        traceback.print_exc()
+    from dark.app import DarkApp
     
     # Set application icon
     try:
@@ -57,7 +129,10 @@ def main():
     
     # Keep a global reference
     global _dark_app
-    _dark_app = DarkApp()
+    if window_process:
+        _dark_app = create_window_process_app(options["window_process"], options["coordinator"])
+    else:
+        _dark_app = DarkApp()
     
     def _excepthook(t, v, tb):
         print("\n===== Uncaught exception =====", file=sys.stderr)
@@ -65,6 +140,12 @@ def main():
     sys.excepthook = _excepthook
     
     _dark_app.run()
+    if message["urls"]:
+        # The first launch already has its window; just open the URLs in it
+        _dark_app.handle_message(dict(message, new_window=False))
+    if instance is not None:
+        instance.message_received.connect(_dark_app.handle_message)
+        instance.ready()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -0,0 +1,308 @@
+"""Cold/warm startup benchmark for Dark Browser.
+
+Launches ``main.py`` N times under the offscreen platform against generated
+``settings.json`` fixtures and records, per run:
+
+* ``window_shown_ms``   time from process spawn to the main window's first show
+* ``first_load_ms``     time from process spawn to the first web ``loadFinished``
+* ``peak_rss_mb``       peak resident memory of the whole process tree
+                        (browser process plus QtWebEngine helpers)
+
+Scenarios: ``empty`` (no session), ``tabs50`` and ``tabs500`` (sessions whose
+tabs point at a local HTTP server started by the harness). ``cold`` runs use
+a fresh data directory each time; ``warm`` runs reuse one primed directory.
+
+Results are written as JSON. With ``--baseline`` the medians are compared to
+a stored baseline and the script exits non-zero when any metric is more than
+``--tolerance`` above it; ``--update-baseline`` stores the current medians.
+
+    python tools/bench_startup.py --runs 5 --out bench.json --baseline tools/startup_baseline.json
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCENARIOS = {"empty": 0, "tabs50": 50, "tabs500": 500}
+METRICS = ("window_shown_ms", "first_load_ms", "peak_rss_mb")
+EVENT_PREFIX = "@@bench "
+
+
+# ----------------------------------------------------------------------------
+# Child side: runs inside the launched browser process
+
+def _child(fixture: str, expect_load: bool, settle_ms: int) -> None:
+    sys.path.insert(0, str(ROOT))
+    # Never hand the launch to a browser the developer has open
+    sys.argv = [str(ROOT / "main.py"), "--multi-instance"]
+    from PyQt6.QtCore import QStandardPaths, QTimer
+    from PyQt6.QtWidgets import QApplication
+    import dark.app
+    from dark.ui.main_window import MainWindow
+    from dark.ui.tabs import TabManager
+
+    def emit(name: str, **data):
+        data.update(event=name, t=time.monotonic())
+        print(EVENT_PREFIX + json.dumps(data), flush=True)
+
+    seen = set()
+
+    def once(name: str, **data) -> bool:
+        if name in seen:
+            return False
+        seen.add(name)
+        emit(name, **data)
+        return True
+
+    def finish():
+        QTimer.singleShot(settle_ms, QApplication.quit)
+
+    # Drop the fixture where Settings will look for it, right before it is read
+    original_init = dark.app.DarkApp.__init__
+
+    def init(self, *a, **kw):
+        data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation))
+        data_dir.mkdir(parents=True, exist_ok=True)
+        target = data_dir / "settings.json"
+        if not target.exists():
+            shutil.copyfile(fixture, target)
+        original_init(self, *a, **kw)
+    dark.app.DarkApp.__init__ = init
+
+    original_show = MainWindow.showEvent
+
+    def show_event(self, e):
+        original_show(self, e)
+        if once("window_shown") and not expect_load:
+            finish()
+    MainWindow.showEvent = show_event
+
+    original_attach = TabManager._attach_page
+
+    def attach_page(self, page):
+        original_attach(self, page)
+        page.loadFinished.connect(lambda ok: once("first_load_finished", ok=bool(ok)) and finish())
+    TabManager._attach_page = attach_page
+
+    import main
+    main.main()
+
+
+# ----------------------------------------------------------------------------
+# Parent side
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        body = f"<!doctype html><title>bench {self.path}</title><p>{self.path}</p>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "max-age=3600")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _write_fixture(path: Path, tabs: int, base_url: str) -> None:
+    data = {"welcome_shown": True, "session_active": 0}
+    if tabs:
+        data["session"] = [
+            {"type": "web", "url": f"{base_url}/page/{i}", "title": f"Page {i}"}
+            for i in range(tabs)
+        ]
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _process_tree(root: int) -> list[int]:
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            stat = Path(f"/proc/{entry}/stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    tree, stack = [], [root]
+    while stack:
+        pid = stack.pop()
+        tree.append(pid)
+        stack.extend(children.get(pid, []))
+    return tree
+
+
+def _tree_rss_mb(root: int) -> float:
+    page = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    for pid in _process_tree(root):
+        try:
+            total += int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * page
+        except (OSError, IndexError, ValueError):
+            pass
+    return total / (1024 * 1024)
+
+
+def _run_once(fixture: Path, home: Path, expect_load: bool, timeout: float, args) -> dict:
+    env = dict(os.environ)
+    env.update(
+        HOME=str(home),
+        XDG_DATA_HOME=str(home / "data"),
+        XDG_CONFIG_HOME=str(home / "config"),
+        XDG_CACHE_HOME=str(home / "cache"),
+        QT_QPA_PLATFORM="offscreen",
+    )
+    if args.no_sandbox:
+        env["QTWEBENGINE_DISABLE_SANDBOX"] = "1"
+    cmd = [sys.executable, __file__, "--child", str(fixture), "--settle-ms", str(args.settle_ms)]
+    if expect_load:
+        cmd.append("--expect-load")
+    spawned = time.monotonic()
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+
+    peak = 0.0
+    stop = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not stop.is_set():
+            peak = max(peak, _tree_rss_mb(proc.pid))
+            stop.wait(0.05)
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+
+    events: dict[str, dict] = {}
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            if line.startswith(EVENT_PREFIX):
+                ev = json.loads(line[len(EVENT_PREFIX):])
+                events.setdefault(ev["event"], ev)
+        proc.wait()
+    finally:
+        timer.cancel()
+        stop.set()
+        sampler.join()
+
+    def since_spawn(name):
+        ev = events.get(name)
+        return round((ev["t"] - spawned) * 1000, 1) if ev else None
+
+    return {
+        "window_shown_ms": since_spawn("window_shown"),
+        "first_load_ms": since_spawn("first_load_finished"),
+        "peak_rss_mb": round(peak, 1),
+        "returncode": proc.returncode,
+    }
+
+
+def _summarize(runs: list[dict]) -> dict:
+    medians = {}
+    for metric in METRICS:
+        values = [r[metric] for r in runs if r.get(metric) is not None]
+        medians[metric] = round(statistics.median(values), 1) if values else None
+    return {"runs": runs, "median": medians}
+
+
+def _compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for key, summary in results.items():
+        base = baseline.get(key, {})
+        for metric in METRICS:
+            now, then = summary["median"].get(metric), base.get(metric)
+            if now is None or then is None:
+                continue
+            if now > then * (1 + tolerance):
+                regressions.append(f"{key} {metric}: {now} > {then} (+{tolerance:.0%})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--modes", default="cold,warm")
+    parser.add_argument("--out", default="bench_startup.json")
+    parser.add_argument("--baseline")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--settle-ms", type=int, default=250)
+    parser.add_argument("--no-sandbox", action="store_true", help="disable the Chromium sandbox (containers/CI)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--expect-load", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child, args.expect_load, args.settle_ms)
+        return 0
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    results: dict[str, dict] = {}
+    work = Path(tempfile.mkdtemp(prefix="dark-bench-"))
+    try:
+        for scenario in args.scenarios.split(","):
+            tabs = SCENARIOS[scenario]
+            fixture = work / f"{scenario}.json"
+            _write_fixture(fixture, tabs, base_url)
+            for mode in args.modes.split(","):
+                runs = []
+                warm_home = work / f"{scenario}-warm"
+                if mode == "warm":
+                    # Prime caches and the data directory; this run is not counted
+                    _run_once(fixture, warm_home, bool(tabs), args.timeout, args)
+                for i in range(args.runs):
+                    home = warm_home if mode == "warm" else work / f"{scenario}-cold-{i}"
+                    run = _run_once(fixture, home, bool(tabs), args.timeout, args)
+                    runs.append(run)
+                    print(f"{scenario:8} {mode:5} #{i + 1}: {run}")
+                    if mode == "cold":
+                        shutil.rmtree(home, ignore_errors=True)
+                results[f"{scenario}/{mode}"] = _summarize(runs)
+    finally:
+        server.shutdown()
+        shutil.rmtree(work, ignore_errors=True)
+
+    Path(args.out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results written to {args.out}")
+
+    failed = [k for k, v in results.items() if any(r["window_shown_ms"] is None for r in v["runs"])]
+    if failed:
+        print("Runs that never showed a window: " + ", ".join(failed))
+        return 2
+
+    if args.baseline:
+        baseline_path = Path(args.baseline)
+        if args.update_baseline:
+            baseline_path.write_text(json.dumps({k: v["median"] for k, v in results.items()}, indent=2), encoding="utf-8")
+            print(f"Baseline updated at {baseline_path}")
+            return 0
+        if baseline_path.exists():
+            regressions = _compare(results, json.loads(baseline_path.read_text(encoding="utf-8")), args.tolerance)
+            if regressions:
+                print("Startup regressions:\n  " + "\n  ".join(regressions))
+                return 1
+            print("No regressions against baseline")
+        else:
+            print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
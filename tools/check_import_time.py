@@ -0,0 +1,109 @@
+"""Import-time budget for the ``dark`` package.
+
+Runs ``python -X importtime -c "import dark.app, dark.ui.main_window"`` in a
+fresh interpreter. dark.app only imports the main window when WindowManager
+builds the first one, so both are named to cover what a launch loads. It
+sums the self time of every ``dark`` module and fails when the total goes
+over the budget. It also fails when a module that is meant to be loaded on
+first use (see ``LAZY_MODULES``) shows up in the startup import graph.
+
+    python tools/check_import_time.py --budget-ms 60 --runs 5
+
+The best of ``--runs`` runs is compared, which keeps the check stable on a
+busy machine. Exit codes: 0 within budget, 1 over budget or an eager lazy
+module, 2 when the import itself failed.
+"""
+from __future__ import annotations
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Everything a normal launch imports before the first window is shown
+TARGETS = ("dark.app", "dark.ui.main_window")
+DEFAULT_BUDGET_MS = 60.0
+
+# Modules only needed once the user opens the matching UI
+LAZY_MODULES = (
+    "dark.ui.settings_widget",
+    "dark.ui.downloads_widget",
+    "dark.ui.notification_widget",
+    "dark.ui.welcome_dialog",
+    "dark.core.translations",
+    "requests",
+)
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map module name to (self_us, cumulative_us) from -X importtime output"""
+    modules: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        modules[parts[2].strip()] = (self_us, cumulative_us)
+    return modules
+
+
+def measure(python: str = sys.executable) -> dict[str, tuple[int, int]]:
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {', '.join(TARGETS)}"],
+        cwd=str(ROOT), env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+    return parse_importtime(proc.stderr)
+
+
+def own_modules(modules: dict[str, tuple[int, int]]) -> dict[str, int]:
+    return {name: t[0] for name, t in modules.items() if name == "dark" or name.startswith("dark.")}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="allowed self time of all dark modules")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args(argv)
+
+    best = None
+    for _ in range(max(1, args.runs)):
+        try:
+            modules = measure()
+        except RuntimeError as e:
+            print(f"Importing {', '.join(TARGETS)} failed: {e}")
+            return 2
+        total = sum(own_modules(modules).values())
+        if best is None or total < best[0]:
+            best = (total, modules)
+    total_us, modules = best
+
+    own = own_modules(modules)
+    for name, us in sorted(own.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"{us / 1000:8.1f} ms  {name}")
+    total_ms = total_us / 1000
+    print(f"{total_ms:8.1f} ms  total for dark.* (budget {args.budget_ms:.1f} ms)")
+
+    status = 0
+    eager = [name for name in LAZY_MODULES if name in modules]
+    if eager:
+        print("Loaded at startup but meant to be imported on first use: " + ", ".join(eager))
+        status = 1
+    if total_ms > args.budget_ms:
+        print(f"Import time over budget by {total_ms - args.budget_ms:.1f} ms")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())